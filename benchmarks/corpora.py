@@ -0,0 +1,84 @@
+import os
+from typing import Callable, Dict
+
+# Each generator writes a synthetic project under ``root`` and takes a
+# ``scale`` factor: 1 is quick enough for CI, larger values stress the
+# analyzers the way big real-world repositories do.
+
+def _write(root: str, rel_path: str, source: str):
+    path = os.path.join(root, rel_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(source)
+
+def deep_nesting(root: str, scale: int = 1):
+    """A few functions whose bodies nest ``if``/``for``/``while`` 20 * scale deep."""
+    # The tokenizer rejects more than 100 indentation levels.
+    depth = min(20 * scale, 90)
+    for index in range(4):
+        lines = [f"def nested_{index}(items, limit):"]
+        for level in range(depth):
+            indent = "    " * (level + 1)
+            keyword = ("if items[{0}] > limit:", "for x{0} in items:", "while limit > {0}:")[level % 3]
+            lines.append(indent + keyword.format(level))
+            lines.append(indent + f"    limit -= {level}")
+        lines.append("    " * (depth + 1) + "return limit")
+        _write(root, f"nesting/deep_{index}.py", "\n".join(lines) + "\n")
+
+def huge_functions(root: str, scale: int = 1):
+    """Modules holding one very long, branchy function each."""
+    statements = 1500 * scale
+    for index in range(2):
+        lines = [f"def huge_{index}(a, b, c, d, e, f, g):", "    total = 0"]
+        for n in range(statements):
+            if n % 5 == 0:
+                lines.append(f"    if a == {n} or b > {n}:")
+                lines.append(f"        total += c * {n} - d")
+            else:
+                lines.append(f"    total = (total + e * {n}) % (f + g + {n})")
+        lines.append("    return total")
+        _write(root, f"huge/huge_{index}.py", "\n".join(lines) + "\n")
+
+def many_modules(root: str, scale: int = 1):
+    """A package tree of many small modules with classes and helpers."""
+    for index in range(200 * scale):
+        package = f"pkg{index % 10}/sub{index % 3}"
+        source = (
+            "import os\n"
+            f"from pkg{(index + 1) % 10} import sub{(index + 1) % 3}\n\n"
+            f"class Model{index}:\n"
+            "    def __init__(self, value):\n"
+            "        self.value = value\n\n"
+            "    def render(self):\n"
+            "        try:\n"
+            "            return os.path.join(str(self.value), 'out')\n"
+            "        except:\n"
+            "            return None\n\n"
+            f"def helper_{index}(x):\n"
+            f"    return Model{index}(x).render()\n"
+        )
+        _write(root, f"{package}/mod{index}.py", source)
+    for index in range(10):
+        _write(root, f"pkg{index}/__init__.py", "")
+        for sub in range(3):
+            _write(root, f"pkg{index}/sub{sub}/__init__.py", "")
+
+def import_web(root: str, scale: int = 1):
+    """Flat modules that each import and call a dozen others, full of cycles."""
+    count = 150 * scale
+    for index in range(count):
+        targets = [(index * 7 + k * 13) % count for k in range(1, 13)]
+        lines = [f"import web.m{t}" for t in targets]
+        lines.append("")
+        lines.append(f"def f{index}(x):")
+        lines.extend(f"    x = web.m{t}.f{t}(x)" for t in targets[:4])
+        lines.append("    return x")
+        _write(root, f"web/m{index}.py", "\n".join(lines) + "\n")
+    _write(root, "web/__init__.py", "")
+
+CORPORA: Dict[str, Callable[[str, int], None]] = {
+    "deep_nesting": deep_nesting,
+    "huge_functions": huge_functions,
+    "many_modules": many_modules,
+    "import_web": import_web,
+}
@@ -0,0 +1,210 @@
+import ast
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import click
+from rich.console import Console
+from rich.table import Table
+from benchmarks.corpora import CORPORA
+from codev_suite.analyzers.bugs import BugDetector
+from codev_suite.analyzers.metrics import MetricsAnalyzer
+from codev_suite.analyzers.smells import CodeSmellDetector
+from codev_suite.core.discovery import iter_python_files
+from codev_suite.core.parser import CodeParser
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_THRESHOLD = 0.25
+# Differences below this are timer noise, whatever the ratio.
+MIN_DELTA = 0.005
+
+console = Console()
+
+class Corpus:
+    """A generated project: its directory, sources and pre-parsed trees."""
+    def __init__(self, name: str, root: str):
+        self.name = name
+        self.root = root
+        self.sources: List[str] = []
+        for path in iter_python_files(root):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.sources.append(f.read())
+        self.trees = [ast.parse(source) for source in self.sources]
+
+def bench_structure(corpus: Corpus):
+    for source in corpus.sources:
+        CodeParser(source_code=source).get_structure()
+
+def bench_metrics(corpus: Corpus):
+    for source, tree in zip(corpus.sources, corpus.trees):
+        analyzer = MetricsAnalyzer(source, tree=tree)
+        analyzer.analyze_complexity()
+        analyzer.analyze_halstead()
+        analyzer.analyze_maintainability()
+
+def bench_detectors(corpus: Corpus):
+    smells, bugs = CodeSmellDetector(), BugDetector()
+    for tree in corpus.trees:
+        smells.check(tree)
+        bugs.check(tree)
+
+def _graph(corpus: Corpus):
+    from codev_suite.visualization.graphs import DependencyGraphGenerator
+
+    generator = DependencyGraphGenerator(corpus.root)
+    generator.build_graph()
+    return generator
+
+def bench_build_graph(corpus: Corpus):
+    _graph(corpus)
+
+def bench_visualize(corpus: Corpus, generator):
+    generator.visualize(io.BytesIO())
+
+# name -> (benchmark, setup); setup runs once, untimed, and its result is
+# passed to every repetition.
+BENCHMARKS: Dict[str, Tuple[Callable, Optional[Callable]]] = {
+    "structure": (bench_structure, None),
+    "metrics": (bench_metrics, None),
+    "detectors": (bench_detectors, None),
+    "build_graph": (bench_build_graph, None),
+    "visualize": (bench_visualize, _graph),
+}
+
+def measure(fn: Callable, repeat: int) -> float:
+    """
+    Best of ``repeat`` runs, in seconds; the minimum is the least noisy
+    estimate. An untimed first run absorbs lazy imports and warm-up.
+    """
+    fn()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run_benchmarks(workdir: str, scale: int = 1, repeat: int = 3,
+                   corpora: Optional[List[str]] = None, benchmarks: Optional[List[str]] = None,
+                   progress: Optional[Callable[[str], None]] = None) -> Dict[str, float]:
+    """
+    Generates the corpora under ``workdir`` and times each benchmark on each.
+    Returns ``{"<corpus>/<benchmark>": seconds}``.
+    """
+    results = {}
+    for corpus_name in corpora or CORPORA:
+        root = os.path.join(workdir, corpus_name)
+        CORPORA[corpus_name](root, scale)
+        corpus = Corpus(corpus_name, root)
+        for bench_name in benchmarks or BENCHMARKS:
+            fn, setup = BENCHMARKS[bench_name]
+            key = f"{corpus_name}/{bench_name}"
+            if progress is not None:
+                progress(key)
+            if setup is None:
+                results[key] = measure(lambda: fn(corpus), repeat)
+            else:
+                state = setup(corpus)
+                results[key] = measure(lambda: fn(corpus, state), repeat)
+    return results
+
+def environment(scale: int) -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "cpus": os.cpu_count(),
+        "scale": scale,
+    }
+
+def compare(baseline: Dict[str, float], results: Dict[str, float],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Compares results with a baseline. Each row has ``regression`` set when
+    a benchmark got slower than ``threshold`` (0.25 = 25%) and by more than
+    timer noise.
+    """
+    rows = []
+    for key, seconds in results.items():
+        base = baseline.get(key)
+        ratio = seconds / base if base else None
+        rows.append({
+            "benchmark": key,
+            "baseline": base,
+            "current": seconds,
+            "ratio": ratio,
+            "regression": base is not None and seconds > base * (1 + threshold) and seconds - base > MIN_DELTA,
+        })
+    return rows
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_baseline(path: str, results: Dict[str, float], scale: int):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"environment": environment(scale), "results": results}, f, indent=2, sort_keys=True)
+
+@click.command()
+@click.option('--scale', type=int, default=1, show_default=True, help="Corpus size multiplier")
+@click.option('--repeat', type=int, default=3, show_default=True, help="Runs per benchmark; the best is kept")
+@click.option('--corpus', 'corpora', multiple=True, type=click.Choice(sorted(CORPORA)),
+              help="Only run this corpus (repeatable)")
+@click.option('--bench', 'benchmarks', multiple=True, type=click.Choice(sorted(BENCHMARKS)),
+              help="Only run this benchmark (repeatable)")
+@click.option('--baseline', 'baseline_path', type=click.Path(dir_okay=False), default=DEFAULT_BASELINE,
+              show_default=True, help="Baseline results to compare against")
+@click.option('--save', is_flag=True, help="Store these results as the new baseline")
+@click.option('--threshold', type=float, default=DEFAULT_THRESHOLD, show_default=True,
+              help="Slowdown (0.25 = 25%) that counts as a regression")
+@click.option('--json', 'json_path', type=click.Path(dir_okay=False, allow_dash=True), default=None,
+              help="Also write the results as JSON")
+def main(scale, repeat, corpora, benchmarks, baseline_path, save, threshold, json_path):
+    """Time the analyzers on synthetic corpora and flag regressions against a baseline."""
+    with tempfile.TemporaryDirectory(prefix="codev-bench-") as workdir:
+        with console.status("Benchmarking...") as status:
+            results = run_benchmarks(workdir, scale, repeat, list(corpora), list(benchmarks),
+                                     progress=lambda key: status.update(f"Benchmarking {key}..."))
+
+    baseline = load_baseline(baseline_path)
+    if baseline is not None and baseline["environment"].get("scale") != scale:
+        console.print(f"[yellow]Baseline was recorded at scale {baseline['environment'].get('scale')}; "
+                      "not comparing.[/yellow]")
+        baseline = None
+    elif baseline is not None and baseline["environment"] != environment(scale):
+        console.print("[yellow]Baseline was recorded on a different machine or Python; "
+                      "timings may not be comparable.[/yellow]")
+    rows = compare(baseline["results"] if baseline else {}, results, threshold)
+
+    table = Table(title="Benchmarks")
+    table.add_column("Benchmark", style="cyan")
+    table.add_column("Baseline (ms)", justify="right")
+    table.add_column("Current (ms)", justify="right", style="green")
+    table.add_column("Change", justify="right")
+    for row in rows:
+        change = "" if row["ratio"] is None else f"{(row['ratio'] - 1) * 100:+.0f}%"
+        if row["regression"]:
+            change = f"[bold red]{change}[/bold red]"
+        base = "-" if row["baseline"] is None else f"{row['baseline'] * 1000:.1f}"
+        table.add_row(row["benchmark"], base, f"{row['current'] * 1000:.1f}", change)
+    console.print(table)
+
+    if json_path:
+        with click.open_file(json_path, 'w') as f:
+            json.dump({"environment": environment(scale), "results": results, "comparison": rows}, f, indent=2)
+    if save:
+        save_baseline(baseline_path, results, scale)
+        console.print(f"[green]Baseline saved to {baseline_path}[/green]")
+        return
+
+    regressions = [row["benchmark"] for row in rows if row["regression"]]
+    if regressions:
+        console.print(f"[bold red]{len(regressions)} regression(s) over {threshold:.0%}:[/bold red] "
+                      + ", ".join(regressions))
+        sys.exit(1)
@@ -0,0 +1,96 @@
+import ast
+from typing import Any, Dict, List, Optional
+from codev_suite.core.parser import FUNCTION_NODES, CodeParser
+
+DEFAULT_MIN_COMPLEXITY = 11  # rank C and worse
+DEFAULT_MAX_FUNCTIONS = 10
+
+class FunctionChunker:
+    """
+    Splits a module into per-function chunks so AI prompts only carry the code
+    that needs attention instead of the whole file.
+    """
+    def __init__(self, source_code: str, tree: Optional[ast.AST] = None):
+        self.source_code = source_code
+        self.parser = CodeParser(source_code=source_code)
+        if tree is not None:
+            self.parser.tree = tree
+        else:
+            self.parser.parse()
+        self.tree = self.parser.tree
+        self._lines = source_code.splitlines(keepends=True)
+
+    def functions(self) -> List[Dict[str, Any]]:
+        """
+        Returns every function and method with its line range and source.
+        """
+        chunks = []
+        for node in ast.walk(self.tree):
+            if isinstance(node, FUNCTION_NODES):
+                start = min([node.lineno] + [d.lineno for d in node.decorator_list])
+                chunks.append({
+                    "name": node.name,
+                    "qualname": self.parser.qualname(node),
+                    "line": node.lineno,
+                    "end_line": node.end_lineno,
+                    "source": "".join(self._lines[start - 1:node.end_lineno]),
+                    "complexity": None,
+                    "findings": [],
+                })
+        chunks.sort(key=lambda c: c["line"])
+        return chunks
+
+    def select(self, complexity: List[Dict[str, Any]], findings: List[Dict[str, Any]],
+               min_complexity: int = DEFAULT_MIN_COMPLEXITY,
+               max_functions: int = DEFAULT_MAX_FUNCTIONS) -> List[Dict[str, Any]]:
+        """
+        Returns the hot or smelly functions, worst first.
+
+        ``complexity`` is the output of ``MetricsAnalyzer.analyze_complexity`` and
+        ``findings`` the combined smells and bugs. Each finding is attributed to
+        the innermost function containing its line.
+        """
+        chunks = self.functions()
+        by_line = {c["line"]: c for c in chunks}
+        for block in complexity:
+            if block["type"] != "Class" and block["lineno"] in by_line:
+                by_line[block["lineno"]]["complexity"] = block["complexity"]
+
+        for finding in findings:
+            enclosing = [c for c in chunks if c["line"] <= finding["line"] <= c["end_line"]]
+            if enclosing:
+                min(enclosing, key=lambda c: c["end_line"] - c["line"])["findings"].append(finding)
+
+        hot = [
+            c for c in chunks
+            if c["findings"] or (c["complexity"] or 0) >= min_complexity
+        ]
+        hot.sort(key=lambda c: (len(c["findings"]), c["complexity"] or 0), reverse=True)
+        return hot[:max_functions]
+
+    def outline(self) -> str:
+        """
+        Returns the module with function bodies elided (docstrings kept), a
+        compact stand-in for the whole file when asking for an explanation.
+        """
+        tree = ast.parse(self.source_code)
+        for node in ast.walk(tree):
+            if isinstance(node, FUNCTION_NODES):
+                body = [ast.Expr(ast.Constant(...))]
+                docstring = ast.get_docstring(node, clean=False)
+                if docstring is not None:
+                    body.insert(0, node.body[0])
+                node.body = body
+        return ast.unparse(tree)
+
+def stitch_report(chunks: List[Dict[str, Any]], answers: List[str]) -> str:
+    """
+    Combines per-function AI answers into a single report.
+    """
+    sections = []
+    for chunk, answer in zip(chunks, answers):
+        header = f"### {chunk['qualname']} (lines {chunk['line']}-{chunk['end_line']}"
+        if chunk["complexity"] is not None:
+            header += f", complexity {chunk['complexity']}"
+        sections.append(f"{header})\n\n{answer.strip()}")
+    return "\n\n".join(sections)
@@ -1,21 +1,117 @@
+import hashlib
 import os
-import google.generativeai as genai
-from typing import Optional
-from dotenv import load_dotenv
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+from codev_suite.core.cache import ResultCache
+from codev_suite.core.profiling import AI, span
 
-load_dotenv()
+DEFAULT_MODEL = 'gemini-pro'
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting how many requests start per second.
+    """
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Blocks until a token is available, then consumes it.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
 
 class AIEngine:
     """
     Handles AI-powered code analysis using Gemini.
+
+    Requests run on a bounded thread pool, are rate limited with a token bucket,
+    retried with exponential backoff, and (given a ``ResultCache``) answered from
+    disk when the same prompt was already sent to the same model. Any object with
+    a ``generate_content(prompt)`` method returning an object with ``.text`` can
+    be passed as ``model``, e.g. a local stub in tests.
+
+    Up to ``burst`` requests (default: ``max_concurrency``) start at once;
+    beyond that they are paced to ``requests_per_minute``.
     """
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, model: Any = None,
+                 model_name: str = DEFAULT_MODEL, cache: Optional[ResultCache] = None,
+                 max_concurrency: int = 4, requests_per_minute: float = 60,
+                 max_retries: int = 3, backoff: float = 1.0, burst: Optional[int] = None):
+        self.model_name = model_name
+        if api_key is None and model is None:
+            # Loaded on first use rather than at import time; both dotenv and
+            # the Gemini client are slow to import.
+            from dotenv import load_dotenv
+            load_dotenv()
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
-        if self.api_key:
+        if model is not None:
+            self.model = model
+        elif self.api_key:
+            import google.generativeai as genai
             genai.configure(api_key=self.api_key)
-            self.model = genai.GenerativeModel('gemini-pro')
+            self.model = genai.GenerativeModel(model_name)
         else:
             self.model = None
+        self.cache = cache
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.rate_limiter = TokenBucket(requests_per_minute / 60.0,
+                                        capacity=max(1, burst if burst is not None else self.max_concurrency))
+
+    def explain_prompt(self, code_snippet: str) -> str:
+        return (
+            "You are an expert software engineer. Explain the following Python code "
+            "in plain, concise developer-friendly English. Focus on WHAT it does and WHY.\n\n"
+            f"Code:\n```python\n{code_snippet}\n```"
+        )
+
+    def refactor_prompt(self, code_snippet: str, smells: list = None) -> str:
+        smells_str = ", ".join([s['type'] for s in smells]) if smells else "general complexity"
+        return (
+            "You are an expert refactoring coach. Analyze this Python code and suggest "
+            "specific improvements to reduce complexity, improve readability, and fix "
+            f"detected smells like: {smells_str}.\n\n"
+            f"Code:\n```python\n{code_snippet}\n```\n\n"
+            "Provide the refactored code and an explanation of the changes."
+        )
+
+    def function_prompt(self, chunk: Dict[str, Any]) -> str:
+        """
+        Builds a review prompt for one function chunk. Line numbers are left out
+        so the prompt, and its cache entry, survive edits elsewhere in the file.
+        """
+        findings = "\n".join(f"- {f['type']}: {f['details']}" for f in chunk["findings"])
+        return (
+            "You are an expert refactoring coach. Review this Python function and suggest "
+            "specific improvements to reduce complexity and improve readability.\n\n"
+            + (f"Detected issues:\n{findings}\n\n" if findings else "")
+            + f"Code:\n```python\n{chunk['source']}\n```\n\n"
+            "Provide the refactored function and a short explanation of the changes."
+        )
+
+    def review_functions(self, chunks: List[Dict[str, Any]]) -> List[str]:
+        """
+        Reviews each function chunk as a separate, concurrently sent and
+        individually cached request.
+        """
+        return self.batch([self.function_prompt(chunk) for chunk in chunks])
 
     def explain_code(self, code_snippet: str) -> str:
         """
@@ -23,18 +119,7 @@ class AIEngine:
         """
         if not self.model:
             return "AI model not configured. Please set GEMINI_API_KEY."
-        
-        prompt = (
-            "You are an expert software engineer. Explain the following Python code "
-            "in plain, concise developer-friendly English. Focus on WHAT it does and WHY.\n\n"
-            f"Code:\n```python\n{code_snippet}\n```"
-        )
-        
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            return f"Error calling AI: {str(e)}"
+        return self.complete(self.explain_prompt(code_snippet))
 
     def suggest_refactor(self, code_snippet: str, smells: list = None) -> str:
         """
@@ -42,18 +127,69 @@ class AIEngine:
         """
         if not self.model:
             return "AI model not configured."
+        return self.complete(self.refactor_prompt(code_snippet, smells))
 
-        smells_str = ", ".join([s['type'] for s in smells]) if smells else "general complexity"
-        prompt = (
-            "You are an expert refactoring coach. Analyze this Python code and suggest "
-            "specific improvements to reduce complexity, improve readability, and fix "
-            f"detected smells like: {smells_str}.\n\n"
-            f"Code:\n```python\n{code_snippet}\n```\n\n"
-            "Provide the refactored code and an explanation of the changes."
-        )
+    def complete(self, prompt: str) -> str:
+        """
+        Sends a single prompt, using the cache when possible.
+        """
+        return self.batch([prompt])[0]
+
+    def batch(self, prompts: List[str], progress: Optional[Callable[[int, int], None]] = None) -> List[str]:
+        """
+        Sends several prompts concurrently and returns the answers in order.
+        Cached prompts are answered without calling the model; failures are
+        returned as error messages and never cached. ``progress`` is called
+        with ``(answered, total)`` as answers arrive.
+        """
+        if not self.model:
+            return ["AI model not configured. Please set GEMINI_API_KEY." for _ in prompts]
+
+        results: List[Optional[str]] = [None] * len(prompts)
+        misses: Dict[str, List[int]] = {}
+        for i, prompt in enumerate(prompts):
+            cached = self.cache.get(self.cache_key(prompt)) if self.cache is not None else None
+            if cached is not None:
+                results[i] = cached
+            else:
+                misses.setdefault(prompt, []).append(i)
+
+        answered = len(prompts) - sum(len(indices) for indices in misses.values())
+        if progress is not None:
+            progress(answered, len(prompts))
+        if misses:
+            workers = min(self.max_concurrency, len(misses))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(self._generate, prompt): prompt for prompt in misses}
+                # The cache is only touched from the calling thread.
+                for future in as_completed(futures):
+                    prompt = futures[future]
+                    ok, text = future.result()
+                    if ok and self.cache is not None:
+                        self.cache.set(self.cache_key(prompt), text)
+                    for i in misses[prompt]:
+                        results[i] = text
+                    answered += len(misses[prompt])
+                    if progress is not None:
+                        progress(answered, len(prompts))
+        return results
 
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            return f"Error calling AI: {str(e)}"
+    def cache_key(self, prompt: str) -> str:
+        digest = hashlib.sha256(f"{self.model_name}\0{prompt}".encode('utf-8')).hexdigest()
+        return f"ai:{self.model_name}:{digest}"
+
+    def _generate(self, prompt: str):
+        """
+        Calls the model with rate limiting and exponential backoff.
+        Returns ``(ok, text)``.
+        """
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                with span("ai.request", AI, attempt=attempt, prompt_chars=len(prompt)):
+                    response = self.model.generate_content(prompt)
+                return True, response.text
+            except Exception as e:
+                if attempt == self.max_retries:
+                    return False, f"Error calling AI: {str(e)}"
+                time.sleep(self.backoff * (2 ** attempt) * (1 + random.random() * 0.1))
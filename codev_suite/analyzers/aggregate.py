@@ -0,0 +1,182 @@
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from codev_suite.analyzers.findings import complexity_rank
+
+# (column, array typecode) per analyzed file and per complexity block.
+FILE_COLUMNS = (
+    ("maintainability", "d"), ("volume", "d"), ("difficulty", "d"), ("effort", "d"),
+    ("smells", "l"), ("bugs", "l"), ("blocks", "l"), ("max_complexity", "l"),
+)
+BLOCK_COLUMNS = (("file", "l"), ("lineno", "l"), ("complexity", "l"))
+# Complexity is integral and heavy-tailed: one bin per value up to the A/B
+# rank boundary, then one per rank band (see ``complexity_rank``).
+COMPLEXITY_BINS = (1, 2, 3, 4, 5, 6, 11, 21, 31, 41)
+MAINTAINABILITY_BINS = tuple(range(0, 101, 5))
+DEFAULT_PERCENTILES = (50, 75, 90, 95, 99)
+
+class RepoMetrics:
+    """
+    Repository-wide metrics in columnar form: one row per analyzed file
+    (maintainability, Halstead volume/difficulty/effort, finding counts) and
+    one row per complexity block.
+
+    Rows are appended from streamed per-file results into compact ``array``
+    columns; queries (percentiles, histograms, top-N) run vectorized over
+    NumPy copies of them, and ``files_frame``/``blocks_frame`` expose the
+    same data as pandas DataFrames. NumPy and pandas are only imported when
+    queried, so collecting stays cheap.
+    """
+    def __init__(self):
+        self.paths: List[str] = []
+        self.errors: List[Dict[str, str]] = []
+        self.block_names: List[str] = []
+        self.block_types: List[str] = []
+        self._files = {name: array(code) for name, code in FILE_COLUMNS}
+        self._blocks = {name: array(code) for name, code in BLOCK_COLUMNS}
+        self._arrays: Dict[str, Any] = {}
+
+    def add(self, result: Dict[str, Any]):
+        if "error" in result:
+            self.errors.append({"path": result["path"], "error": result["error"]})
+            return
+        index = len(self.paths)
+        self.paths.append(result["path"])
+        halstead = result["halstead"]
+        max_complexity = 0
+        for block in result["complexity"]:
+            self.block_names.append(block["name"])
+            self.block_types.append(sys.intern(block["type"]))
+            self._blocks["file"].append(index)
+            self._blocks["lineno"].append(block["lineno"])
+            self._blocks["complexity"].append(block["complexity"])
+            max_complexity = max(max_complexity, block["complexity"])
+        for name, value in (
+            ("maintainability", result["maintainability"]),
+            ("volume", halstead["volume"]), ("difficulty", halstead["difficulty"]),
+            ("effort", halstead["effort"]),
+            ("smells", len(result["smells"])), ("bugs", len(result["bugs"])),
+            ("blocks", len(result["complexity"])), ("max_complexity", max_complexity),
+        ):
+            self._files[name].append(value)
+        self._arrays.clear()
+
+    def extend(self, results: Iterable[Dict[str, Any]]) -> "RepoMetrics":
+        for result in results:
+            self.add(result)
+        return self
+
+    @property
+    def files(self) -> int:
+        """Files seen, including the ones that could not be analyzed."""
+        return len(self.paths) + len(self.errors)
+
+    @property
+    def analyzed(self) -> int:
+        return len(self.paths)
+
+    def column(self, name: str):
+        """
+        Returns a file column (e.g. ``maintainability``, ``smells``) or block
+        column (``complexity``, ``lineno``, ``file``) as a NumPy array.
+        """
+        values = self._arrays.get(name)
+        if values is None:
+            import numpy as np
+
+            source = self._files.get(name, self._blocks.get(name))
+            if source is None:
+                raise KeyError(f"Unknown metrics column: {name}")
+            values = self._arrays[name] = np.array(source)
+        return values
+
+    def total(self, name: str) -> float:
+        return self.column(name).sum().item() if self.analyzed else 0
+
+    def mean(self, name: str) -> float:
+        values = self.column(name)
+        return values.mean().item() if len(values) else 0.0
+
+    def percentiles(self, name: str = "complexity",
+                    q: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[float, float]:
+        """Returns ``{percentile: value}``; empty when there is no data."""
+        import numpy as np
+
+        values = self.column(name)
+        if not len(values):
+            return {}
+        return dict(zip(q, np.percentile(values, q).tolist()))
+
+    def histogram(self, name: str = "complexity", bins: Optional[Sequence[float]] = None):
+        """
+        Returns ``(counts, edges)`` as from ``numpy.histogram``. Complexity and
+        maintainability get fixed bins by default (the last complexity bin
+        stretches to the maximum); other columns use NumPy's ``auto`` bins.
+        """
+        import numpy as np
+
+        values = self.column(name)
+        if bins is None:
+            if name in ("complexity", "max_complexity"):
+                top = max(COMPLEXITY_BINS[-1], int(values.max()) if len(values) else 0) + 1
+                bins = COMPLEXITY_BINS + (top,)
+            elif name == "maintainability":
+                bins = MAINTAINABILITY_BINS
+            else:
+                bins = "auto"
+        return np.histogram(values, bins=bins)
+
+    def _top(self, values, n: int, largest: bool = True):
+        import numpy as np
+
+        n = min(n, len(values))
+        if n <= 0:
+            return []
+        keys = -values if largest else values
+        # argpartition finds the n extremes in O(rows); only those get sorted.
+        candidates = np.argpartition(keys, n - 1)[:n] if n < len(values) else np.arange(len(values))
+        return candidates[np.argsort(keys[candidates], kind="stable")].tolist()
+
+    def top_hotspots(self, n: int = 10) -> List[Dict[str, Any]]:
+        """The ``n`` most complex blocks, in the same shape as block results plus ``path``."""
+        files, linenos, complexity = (self.column(name) for name in ("file", "lineno", "complexity"))
+        return [
+            {
+                "path": self.paths[files[i]], "type": self.block_types[i], "name": self.block_names[i],
+                "lineno": int(linenos[i]), "complexity": int(complexity[i]),
+                "rank": complexity_rank(int(complexity[i])),
+            }
+            for i in self._top(complexity, n)
+        ]
+
+    def top_files(self, n: int = 10, by: str = "maintainability", largest: bool = False) -> List[Tuple[str, float]]:
+        """
+        Returns ``(path, value)`` for the ``n`` files with the lowest (or, with
+        ``largest``, highest) value of a file column.
+        """
+        values = self.column(by)
+        return [(self.paths[i], values[i].item()) for i in self._top(values, n, largest)]
+
+    def files_frame(self):
+        """Per-file metrics as a pandas DataFrame indexed by path."""
+        import pandas as pd
+
+        return pd.DataFrame({name: self.column(name) for name, _ in FILE_COLUMNS},
+                            index=pd.Index(self.paths, name="path"))
+
+    def blocks_frame(self):
+        """Per-block complexity as a pandas DataFrame."""
+        import pandas as pd
+
+        files = self.column("file")
+        if len(set(self.paths)) == len(self.paths):
+            paths = pd.Categorical.from_codes(files, categories=self.paths)
+        else:
+            paths = [self.paths[i] for i in files]
+        return pd.DataFrame({
+            "path": paths,
+            "type": pd.Categorical(self.block_types),
+            "name": self.block_names,
+            "lineno": self.column("lineno"),
+            "complexity": self.column("complexity"),
+        })
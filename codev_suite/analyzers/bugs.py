@@ -1,50 +1,57 @@
 import ast
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from codev_suite.analyzers.rules import BUG, Rule, default_registry, register, run_rules
 
-class BugDetector(ast.NodeVisitor):
-    """
-    Identifies potential bugs and dangerous patterns in Python code.
-    """
-    def __init__(self):
-        self.bugs: List[Dict[str, Any]] = []
-
-    def check(self, tree: ast.AST) -> List[Dict[str, Any]]:
-        self.bugs = []
-        self.visit(tree)
-        return self.bugs
+@register
+class BareExcept(Rule):
+    id = "bare-except"
+    name = "Bare Except"
+    category = BUG
 
-    def visit_ExceptHandler(self, node: ast.ExceptHandler):
+    def enter_ExceptHandler(self, node: ast.ExceptHandler):
         if node.type is None:
-            self.bugs.append({
-                "type": "Bare Except",
-                "line": node.lineno,
-                "details": "Using 'except:' without specifying an exception class is dangerous."
-            })
-        self.generic_visit(node)
-
-    def visit_Compare(self, node: ast.Compare):
+            self.report(node.lineno, "Using 'except:' without specifying an exception class is dangerous.")
+
+@register
+class BooleanComparison(Rule):
+    id = "boolean-comparison"
+    name = "Boolean Comparison"
+    category = BUG
+
+    def enter_Compare(self, node: ast.Compare):
         # Check for 'if x == True' or 'if x == False'
         for op, right in zip(node.ops, node.comparators):
             if isinstance(op, (ast.Eq, ast.NotEq)):
                 if isinstance(right, ast.Constant) and isinstance(right.value, bool):
-                    self.bugs.append({
-                        "type": "Boolean Comparison",
-                        "line": node.lineno,
-                        "details": f"Compare using 'if x:' or 'if not x:' instead of '== {right.value}'."
-                    })
-        self.generic_visit(node)
-
-    def visit_FunctionDef(self, node: ast.FunctionDef):
+                    self.report(node.lineno, "Compare using 'if x:' or 'if not x:' instead of '== {}'.", right.value)
+
+@register
+class UnreachableCode(Rule):
+    id = "unreachable-code"
+    name = "Unreachable Code"
+    category = BUG
+
+    def enter_FunctionDef(self, node: ast.FunctionDef):
         # Check for unreachable code after return
         returned = False
         for body_node in node.body:
             if returned:
-                self.bugs.append({
-                    "type": "Unreachable Code",
-                    "line": body_node.lineno,
-                    "details": "Statements after 'return' or 'raise' will never execute."
-                })
+                self.report(body_node.lineno, "Statements after 'return' or 'raise' will never execute.")
                 break
             if isinstance(body_node, (ast.Return, ast.Raise)):
                 returned = True
-        self.generic_visit(node)
+
+class BugDetector:
+    """
+    Identifies potential bugs and dangerous patterns in Python code.
+
+    Runs the enabled ``bug`` rules from the rule registry; ``config`` is the
+    ``[tool.codev]`` table (see ``rules.load_config``).
+    """
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.rules = default_registry().create(config, category=BUG)
+        self.bugs: List[Dict[str, Any]] = []
+
+    def check(self, tree: ast.AST) -> List[Dict[str, Any]]:
+        self.bugs = run_rules(self.rules, tree)[BUG]
+        return self.bugs
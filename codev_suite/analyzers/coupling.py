@@ -0,0 +1,133 @@
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+from codev_suite.core.graph_algorithms import strongly_connected_components
+from codev_suite.core.modules import MODULE
+
+class CallGraph:
+    """
+    Cross-module call graph built from per-module symbol tables (see
+    ``analyzers.symbols``).
+
+    Modules are added, replaced and removed one at a time, so an incremental
+    graph build only re-parses the files that changed. Calls are matched to
+    definitions lazily, on the first query after a change.
+    """
+    def __init__(self):
+        self.files: Dict[str, Dict[str, list]] = {}
+        # Defined symbol -> module that defines it.
+        self.defs: Dict[str, str] = {}
+        self._callees: Optional[Dict[str, Set[str]]] = None
+        self._callers: Optional[Dict[str, Set[str]]] = None
+
+    def update(self, module: str, symbols: Dict[str, list]):
+        self.remove(module)
+        self.files[module] = symbols
+        for symbol in symbols["defs"]:
+            self.defs[symbol] = module
+
+    def remove(self, module: str):
+        old = self.files.pop(module, None)
+        if old is not None:
+            for symbol in old["defs"]:
+                if self.defs.get(symbol) == module:
+                    del self.defs[symbol]
+        self._callees = self._callers = None
+
+    def _index(self):
+        if self._callees is None:
+            callees: Dict[str, Set[str]] = defaultdict(set)
+            callers: Dict[str, Set[str]] = defaultdict(set)
+            for symbols in self.files.values():
+                for caller, target in symbols["calls"]:
+                    if target in self.defs and target != caller:
+                        callees[caller].add(target)
+                        callers[target].add(caller)
+            self._callees, self._callers = dict(callees), dict(callers)
+        return self._callees, self._callers
+
+    def callees(self, symbol: str) -> Set[str]:
+        return self._index()[0].get(symbol, set())
+
+    def callers(self, symbol: str) -> Set[str]:
+        return self._index()[1].get(symbol, set())
+
+    def most_called(self, n: int = 10, cross_module: bool = False) -> List[Tuple[str, int]]:
+        """
+        Returns the ``n`` symbols with the most distinct callers. With
+        ``cross_module`` only callers from other modules are counted.
+        """
+        _, callers = self._index()
+        counts = []
+        for symbol, sources in callers.items():
+            if cross_module:
+                owner = self.defs[symbol]
+                sources = [s for s in sources if self._module_of(s) != owner]
+            if sources:
+                counts.append((symbol, len(sources)))
+        counts.sort(key=lambda item: (-item[1], item[0]))
+        return counts[:n]
+
+    def module_edges(self) -> Dict[str, Set[str]]:
+        """
+        Collapses the call graph to modules: ``a -> b`` when code in ``a``
+        calls something defined in ``b``.
+        """
+        edges: Dict[str, Set[str]] = defaultdict(set)
+        for module, symbols in self.files.items():
+            for _, target in symbols["calls"]:
+                owner = self.defs.get(target)
+                if owner is not None and owner != module:
+                    edges[module].add(owner)
+        return dict(edges)
+
+    def _module_of(self, symbol: str) -> str:
+        # Callers are either a module or a symbol defined in one.
+        return self.defs.get(symbol, symbol)
+
+def import_cycles(generator) -> List[List[str]]:
+    """
+    Returns the import cycles of a ``DependencyGraphGenerator`` as lists of
+    module names, largest first.
+    """
+    modules = [node for node, kind in enumerate(generator.kinds) if kind == MODULE]
+    cycles = [
+        sorted(generator.names[node] for node in component)
+        for component in strongly_connected_components(modules, generator.edges)
+        if len(component) > 1
+    ]
+    cycles.sort(key=lambda cycle: (-len(cycle), cycle[0]))
+    return cycles
+
+def module_coupling(generator) -> List[Dict]:
+    """
+    Computes per-module coupling from the import graph: ``fan_in`` (afferent
+    coupling, Ca) and ``fan_out`` (efferent coupling, Ce) count in-repo modules,
+    ``external`` counts third-party and stdlib packages, and ``instability`` is
+    Ce / (Ca + Ce), from 0 (only depended upon) to 1 (only depends on others).
+    """
+    fan_in: Dict[int, int] = defaultdict(int)
+    fan_out: Dict[int, int] = defaultdict(int)
+    external: Dict[int, int] = defaultdict(int)
+    for source, targets in generator.edges.items():
+        if generator.kinds[source] != MODULE:
+            continue
+        for target in targets:
+            kind = generator.kinds[target]
+            if kind == MODULE:
+                fan_out[source] += 1
+                fan_in[target] += 1
+            elif kind is not None:
+                external[source] += 1
+    rows = []
+    for node, (name, kind) in enumerate(zip(generator.names, generator.kinds)):
+        if kind != MODULE:
+            continue
+        ca, ce = fan_in[node], fan_out[node]
+        rows.append({
+            "module": name,
+            "fan_in": ca,
+            "fan_out": ce,
+            "external": external[node],
+            "instability": round(ce / (ca + ce), 2) if ca + ce else 0.0,
+        })
+    return rows
@@ -0,0 +1,81 @@
+import ast
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List
+from codev_suite.core import profiling
+
+class NodeDispatcher:
+    """
+    Walks an AST once and dispatches every node to the listeners interested in it.
+
+    A listener declares interest by defining ``enter_<NodeType>`` and/or
+    ``leave_<NodeType>`` methods, e.g. ``enter_FunctionDef``. Enter handlers run
+    in pre-order (the same order as ``ast.NodeVisitor``); leave handlers run once
+    all children of the node have been dispatched.
+
+    While a profiler is active, the time spent in each listener's handlers is
+    accumulated and reported as one ``rule`` span per listener.
+    """
+    def __init__(self, listeners: Iterable[Any]):
+        self.listeners = list(listeners)
+        self._enter: Dict[str, List[Callable]] = {}
+        self._leave: Dict[str, List[Callable]] = {}
+        self._profiler = profiling.active()
+        self._timings: Dict[str, int] = defaultdict(int)
+
+    def _handlers(self, table: Dict[str, List[Callable]], prefix: str, name: str) -> List[Callable]:
+        handlers = table.get(name)
+        if handlers is None:
+            handlers = [
+                getattr(listener, prefix + name)
+                for listener in self.listeners
+                if hasattr(listener, prefix + name)
+            ]
+            if self._profiler is not None:
+                handlers = [self._timed(handler) for handler in handlers]
+            table[name] = handlers
+        return handlers
+
+    def _timed(self, handler: Callable) -> Callable:
+        listener = handler.__self__
+        label = getattr(listener, "id", "") or type(listener).__name__
+        timings = self._timings
+
+        def timed(node):
+            start = time.perf_counter_ns()
+            handler(node)
+            timings[label] += time.perf_counter_ns() - start
+        return timed
+
+    def run(self, tree: ast.AST):
+        """
+        Dispatches every node of the tree. The walk is iterative, so deeply
+        nested code cannot exhaust the interpreter stack.
+        """
+        started = time.perf_counter_ns()
+        stack = [(tree, False)]
+        while stack:
+            node, leaving = stack.pop()
+            name = type(node).__name__
+            if leaving:
+                for handler in self._handlers(self._leave, "leave_", name):
+                    handler(node)
+                continue
+
+            for handler in self._handlers(self._enter, "enter_", name):
+                handler(node)
+            if self._handlers(self._leave, "leave_", name):
+                stack.append((node, True))
+            children = list(ast.iter_child_nodes(node))
+            stack.extend((child, False) for child in reversed(children))
+        if self._profiler is not None:
+            self._report_timings(started)
+
+    def _report_timings(self, started: int):
+        # Rules interleave node by node, so each gets one span holding its
+        # total; spans are laid end to end from the start of the walk.
+        offset = started
+        for label in sorted(self._timings, key=lambda label: -self._timings[label]):
+            self._profiler.add(label, profiling.RULE, offset, self._timings[label])
+            offset += self._timings[label]
+        self._timings.clear()
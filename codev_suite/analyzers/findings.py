@@ -0,0 +1,144 @@
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+class Finding(Mapping):
+    """
+    A smell or bug found by a rule.
+
+    Findings are compact, read-only records rather than dicts: the attributes
+    live in ``__slots__``, the rule name is interned (so millions of findings
+    share one string per rule) and ``details`` is only formatted from its
+    template and arguments when read. They still behave as the historical
+    ``{"type", ["rule", name, ...], "line", "details"}`` dicts:
+    ``finding["line"]``, ``dict(finding)`` and comparison with dicts all work.
+    ``rule`` is the registry id of the rule that reported it.
+    """
+    __slots__ = ("type", "line", "template", "args", "name", "extra", "rule")
+
+    def __init__(self, type: str, line: int, template: str, args: Tuple[Any, ...] = (),
+                 name: Optional[str] = None, extra: Optional[Dict[str, Any]] = None,
+                 rule: Optional[str] = None):
+        self.type = sys.intern(type)
+        self.rule = sys.intern(rule) if rule is not None else None
+        self.line = line
+        self.template = template
+        self.args = args
+        self.name = name
+        self.extra = extra or None
+
+    @property
+    def details(self) -> str:
+        return self.template.format(*self.args) if self.args else self.template
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "type":
+            return self.type
+        if key == "rule" and self.rule is not None:
+            return self.rule
+        if key == "line":
+            return self.line
+        if key == "details":
+            return self.details
+        if key == "name" and self.name is not None:
+            return self.name
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield "type"
+        if self.rule is not None:
+            yield "rule"
+        if self.name is not None:
+            yield "name"
+        if self.extra is not None:
+            yield from self.extra
+        yield "line"
+        yield "details"
+
+    def __len__(self) -> int:
+        return 3 + (self.rule is not None) + (self.name is not None) + len(self.extra or ())
+
+    def __reduce__(self):
+        # A plain constructor call pickles far smaller than the slot state.
+        return Finding, (self.type, self.line, self.template, self.args, self.name, self.extra, self.rule)
+
+    def __repr__(self) -> str:
+        return f"Finding({dict(self)!r})"
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Finding":
+        if isinstance(data, Finding):
+            return data
+        extra = {k: v for k, v in data.items() if k not in ("type", "rule", "name", "line", "details")}
+        return cls(data["type"], data["line"], data["details"], name=data.get("name"), extra=extra,
+                   rule=data.get("rule"))
+
+_RANKS = ((5, "A"), (10, "B"), (20, "C"), (30, "D"), (40, "E"))
+
+def complexity_rank(complexity: int) -> str:
+    for limit, rank in _RANKS:
+        if complexity <= limit:
+            return rank
+    return "F"
+
+class Block(Mapping):
+    """
+    The cyclomatic complexity of one function, method or class, as a compact
+    record with the ``{"type", "name", "complexity", "rank", "lineno"}`` dict
+    interface. The rank is derived from the complexity when read.
+    """
+    __slots__ = ("type", "name", "complexity", "lineno")
+
+    _keys = ("type", "name", "complexity", "rank", "lineno")
+
+    def __init__(self, type: str, name: str, complexity: int, lineno: int):
+        self.type = sys.intern(type)
+        self.name = name
+        self.complexity = complexity
+        self.lineno = lineno
+
+    @property
+    def rank(self) -> str:
+        return complexity_rank(self.complexity)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __reduce__(self):
+        return Block, (self.type, self.name, self.complexity, self.lineno)
+
+    def __repr__(self) -> str:
+        return f"Block({dict(self)!r})"
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Block":
+        if isinstance(data, Block):
+            return data
+        return cls(data["type"], data["name"], data["complexity"], data["lineno"])
+
+def compact(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converts the findings and complexity blocks of a result loaded from JSON
+    (a cache entry or a saved report) back into compact records, in place.
+    """
+    if "error" not in result:
+        result["complexity"] = [Block.from_dict(block) for block in result.get("complexity", ())]
+        for key in ("smells", "bugs"):
+            result[key] = [Finding.from_dict(finding) for finding in result.get(key, ())]
+    return result
+
+def json_default(obj: Any) -> Any:
+    """``default`` hook for ``json.dump``: writes records as plain objects."""
+    if isinstance(obj, (Finding, Block)):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -1,36 +1,46 @@
 from radon.visitors import ComplexityVisitor
-from radon.metrics import h_visit, mi_visit
+from radon.metrics import h_visit_ast, mi_compute
+from radon.raw import analyze as raw_analyze
+from typing import Optional
 import ast
+from codev_suite.analyzers.findings import Block
 
 class MetricsAnalyzer:
     """
     Analyzes code metrics like Cyclomatic Complexity, Halstead metrics, and Maintainability Index.
+
+    The source is parsed at most once; pass an already parsed ``tree`` to share
+    it with other analyzers.
     """
-    def __init__(self, source_code: str):
+    def __init__(self, source_code: str, tree: Optional[ast.AST] = None):
         self.source_code = source_code
+        self.tree = tree
+        self._complexity_visitor: Optional[ComplexityVisitor] = None
+        self._halstead = None
+
+    def _get_tree(self) -> ast.AST:
+        if self.tree is None:
+            self.tree = ast.parse(self.source_code)
+        return self.tree
+
+    def _get_complexity_visitor(self) -> ComplexityVisitor:
+        if self._complexity_visitor is None:
+            self._complexity_visitor = ComplexityVisitor.from_ast(self._get_tree())
+        return self._complexity_visitor
+
+    def _get_halstead(self):
+        if self._halstead is None:
+            self._halstead = h_visit_ast(self._get_tree())
+        return self._halstead
 
     def analyze_complexity(self):
         """
         Calculates Cyclomatic Complexity for each block.
         """
-        def get_rank(cc):
-            if cc <= 5: return 'A'
-            elif cc <= 10: return 'B'
-            elif cc <= 20: return 'C'
-            elif cc <= 30: return 'D'
-            elif cc <= 40: return 'E'
-            return 'F'
-
-        visitor = ComplexityVisitor.from_code(self.source_code)
+        visitor = self._get_complexity_visitor()
         type_map = {'F': 'Function', 'C': 'Class', 'M': 'Method'}
         return [
-            {
-                "type": type_map.get(getattr(block, 'letter', 'F'), 'Block'),
-                "name": block.name,
-                "complexity": block.complexity,
-                "rank": get_rank(block.complexity),
-                "lineno": block.lineno
-            }
+            Block(type_map.get(getattr(block, 'letter', 'F'), 'Block'), block.name, block.complexity, block.lineno)
             for block in visitor.blocks
         ]
 
@@ -38,9 +48,8 @@ class MetricsAnalyzer:
         """
         Calculates Halstead metrics.
         """
-        metrics = h_visit(self.source_code)
-        # Handle the case where h_visit returns a namedtuple or a list of namedtuples
-        # Radon's h_visit returns a HalsteadReport
+        metrics = self._get_halstead()
+        # Radon's h_visit_ast returns a HalsteadReport
         return {
             "vocabulary": metrics.total.vocabulary,
             "length": metrics.total.length,
@@ -52,6 +61,15 @@ class MetricsAnalyzer:
     def analyze_maintainability(self):
         """
         Calculates Maintainability Index.
+
+        Equivalent to ``radon.metrics.mi_visit(source, multi=False)``, but reuses
+        the shared tree and the already computed complexity and Halstead volume.
         """
-        mi = mi_visit(self.source_code, multi=False)
-        return mi
+        raw = raw_analyze(self.source_code)
+        comments = raw.comments / float(raw.sloc) * 100 if raw.sloc != 0 else 0
+        return mi_compute(
+            self._get_halstead().total.volume,
+            self._get_complexity_visitor().total_complexity,
+            raw.lloc,
+            comments,
+        )
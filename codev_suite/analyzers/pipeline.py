@@ -0,0 +1,126 @@
+import hashlib
+import json
+from typing import Any, Dict, Optional
+import radon
+from codev_suite.core.cache import content_hash
+from codev_suite.core.limits import AnalysisTimeout
+from codev_suite.core.profiling import span
+from codev_suite.core.parser import CodeParser
+from codev_suite.analyzers.metrics import MetricsAnalyzer
+from codev_suite.analyzers.prefilter import needs_analysis, screenable
+from codev_suite.analyzers.rules import BUG, SMELL, default_registry, run_rules
+
+# Bump whenever a change to the analyzers alters their output, so cached
+# results from older versions are no longer served.
+ANALYZER_VERSION = 2
+# Resource limits that stop an analysis partway; see ``IncompleteAnalysis``.
+LIMIT_ERRORS = (AnalysisTimeout, RecursionError, MemoryError)
+
+class IncompleteAnalysis(Exception):
+    """
+    A time, memory or recursion limit stopped the analysis of a file during
+    ``stage``. ``partial`` holds the sections finished before it, e.g.
+    ``structure`` and ``complexity`` when the Halstead pass timed out.
+    """
+    def __init__(self, stage: str, partial: Dict[str, Any], error: BaseException):
+        detail = f": {error}" if str(error) else ""
+        super().__init__(f"{type(error).__name__} during {stage}{detail}")
+        self.stage = stage
+        self.partial = partial
+
+class AnalysisPipeline:
+    """
+    Runs every static analysis over a single shared AST.
+
+    The source is parsed exactly once. Radon's metrics reuse that tree, and the
+    smell and bug rules are served by one dispatcher walk instead of a full
+    traversal per rule.
+
+    ``config`` is the project's ``[tool.codev]`` table (see
+    ``rules.load_config``): it selects and disables rules by id and sets their
+    options.
+
+    Files that a lexical screen (see ``prefilter``) shows to hold no
+    functions, classes, branches or operators skip the metrics and rules and
+    get their known results directly; ``prefilter = false`` turns this off.
+    """
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.config = config or {}
+        self.rules = default_registry().create(self.config)
+        self.prefilter = bool(self.config.get("prefilter", True)) and screenable(self.rules)
+
+    def fingerprint(self) -> str:
+        """
+        Identifies the analyzer version and rule configuration. Results are only
+        reusable between runs with the same fingerprint.
+        """
+        config = {
+            "version": ANALYZER_VERSION,
+            "radon": radon.__version__,
+            "prefilter": self.prefilter,
+            "rules": {rule.id: {"version": rule.version, **rule.config} for rule in self.rules},
+        }
+        return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()[:16]
+
+    def cache_key(self, data: bytes) -> str:
+        """
+        Returns the result cache key for a file's raw bytes.
+        """
+        return f"{self.fingerprint()}:{content_hash(data)}"
+
+    def run(self, source_code: str, file_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Analyzes one source file and returns all results as plain data.
+        """
+        result: Dict[str, Any] = {"path": file_path}
+        stage = "parse"
+        try:
+            parser = CodeParser(source_code=source_code)
+            with span(stage):
+                tree = parser.parse()
+            stage = "structure"
+            with span(stage):
+                result["structure"] = parser.get_structure()
+
+            if self.prefilter:
+                with span("prefilter"):
+                    trivial = not needs_analysis(source_code)
+                if trivial:
+                    return self._trivial_result(file_path, result["structure"])
+
+            metrics_analyzer = MetricsAnalyzer(source_code, tree=tree)
+            stage = "metrics.complexity"
+            with span(stage):
+                result["complexity"] = metrics_analyzer.analyze_complexity()
+            stage = "metrics.halstead"
+            with span(stage):
+                result["halstead"] = metrics_analyzer.analyze_halstead()
+            stage = "metrics.maintainability"
+            with span(stage):
+                result["maintainability"] = metrics_analyzer.analyze_maintainability()
+
+            stage = "rules"
+            with span(stage):
+                findings = run_rules(self.rules, tree)
+        except LIMIT_ERRORS as e:
+            if len(result) == 1:
+                raise
+            raise IncompleteAnalysis(stage, result, e) from e
+
+        result["smells"] = findings[SMELL]
+        result["bugs"] = findings[BUG]
+        return result
+
+    @staticmethod
+    def _trivial_result(file_path: Optional[str], structure: Dict[str, Any]) -> Dict[str, Any]:
+        # Without operators the Halstead volume is 0, for which radon defines
+        # the Maintainability Index as 100.
+        return {
+            "path": file_path,
+            "structure": structure,
+            "complexity": [],
+            "halstead": {"vocabulary": 0, "length": 0, "volume": 0, "difficulty": 0, "effort": 0},
+            "maintainability": 100.0,
+            "smells": [],
+            "bugs": [],
+        }
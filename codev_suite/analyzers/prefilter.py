@@ -0,0 +1,58 @@
+import ast
+import re
+from typing import Iterable
+from codev_suite.analyzers.rules import Rule
+
+# Strings and comments are skipped (an escape may be a backslash-newline,
+# hence ``[\s\S]``, not ``.``); anything else that could produce a
+# complexity block, a Halstead operator or a rule finding is a hit. f-strings
+# are hits because their replacement fields are expressions.
+_SCREEN = re.compile(r"""
+    (?P<skip>
+        \#[^\n]*
+      | \bimport\s*\*
+      | (?<![\w.])[rRbBuU]{0,2}(?:'''(?:\\[\s\S]|[^\\])*?'''|\"\"\"(?:\\[\s\S]|[^\\])*?\"\"\"
+                              |'(?:\\[\s\S]|[^\\'\n])*'|"(?:\\[\s\S]|[^\\"\n])*")
+    )
+  | (?<![\w.])(?:[rRbB]?[fF]|[fF][rRbB])['"]
+  | \b(?:def|class|lambda|if|for|while|try|except|with|and|or|not|is|in)\b
+  | [-+*/%@&|^~<>!] | ==
+""", re.VERBOSE)
+
+# Node types a screened file cannot contain: each needs one of the keywords
+# or operators above.
+SCREENED_NODES = frozenset(
+    [
+        "FunctionDef", "AsyncFunctionDef", "ClassDef", "Lambda", "arguments", "arg", "Return",
+        "Yield", "YieldFrom", "Await", "If", "IfExp", "For", "AsyncFor", "While", "Try", "TryStar",
+        "ExceptHandler", "With", "AsyncWith", "withitem", "Compare", "BinOp", "UnaryOp", "BoolOp",
+        "AugAssign", "Starred", "ListComp", "SetComp", "DictComp", "GeneratorExp", "comprehension",
+        "JoinedStr", "FormattedValue",
+    ]
+    + [op.__name__ for base in (ast.operator, ast.unaryop, ast.cmpop, ast.boolop) for op in base.__subclasses__()]
+)
+
+def needs_analysis(source: str) -> bool:
+    """
+    A lexical screen: returns False when ``source`` has no functions, classes,
+    branches, loops, exception handlers or operators outside strings and
+    comments (``__init__.py`` files, constants, generated tables), so it has
+    no complexity blocks, no Halstead operators and nothing for the built-in
+    rules to report. It errs towards True.
+    """
+    for match in _SCREEN.finditer(source):
+        if match.lastgroup != "skip":
+            return True
+    return False
+
+def screenable(rules: Iterable[Rule]) -> bool:
+    """
+    True if the screen is exact for these rules: every node type they handle
+    is one a screened file cannot contain. Plugin rules that inspect other
+    nodes (e.g. ``enter_Assign``) turn the screen off.
+    """
+    return all(
+        name.split("_", 1)[1] in SCREENED_NODES
+        for rule in rules for name in dir(rule)
+        if name.startswith(("enter_", "leave_"))
+    )
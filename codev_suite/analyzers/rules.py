@@ -0,0 +1,152 @@
+import ast
+import os
+from typing import Any, Dict, Iterable, List, Optional, Type
+from codev_suite.analyzers.findings import Finding
+
+ENTRY_POINT_GROUP = "codev_suite.rules"
+SMELL = "smell"
+BUG = "bug"
+
+class Rule:
+    """
+    Base class for analysis rules.
+
+    A rule declares the node types it handles by defining ``enter_<NodeType>``
+    and/or ``leave_<NodeType>`` methods; the ``NodeDispatcher`` walk shared by
+    all rules calls only those, so a disabled rule costs nothing.
+
+    Subclasses set ``id`` (used in configuration), ``name`` (the finding
+    ``type`` shown to users), ``category`` (``smell`` or ``bug``) and default
+    ``options``, which become attributes and can be overridden per project.
+    Bump ``version`` when a rule's output changes so cached results expire.
+    """
+    id: str = ""
+    name: str = ""
+    category: str = SMELL
+    version: int = 1
+    options: Dict[str, Any] = {}
+
+    def __init__(self, **options):
+        unknown = set(options) - set(self.options)
+        if unknown:
+            raise ValueError(f"Unknown options for rule {self.id}: {', '.join(sorted(unknown))}")
+        self.config = {**self.options, **options}
+        for key, value in self.config.items():
+            setattr(self, key, value)
+        self.findings: List[Dict[str, Any]] = []
+
+    def reset(self, findings: Optional[List[Dict[str, Any]]] = None):
+        """
+        Clears per-file state. Findings are appended to ``findings`` when given,
+        so rules of one category share a list in traversal order.
+        """
+        self.findings = findings if findings is not None else []
+
+    def report(self, line: int, details: str, *args, name: Optional[str] = None, **extra):
+        """
+        Records a finding. With ``args``, ``details`` is a ``str.format``
+        template that is only formatted when the message is read.
+        """
+        self.findings.append(Finding(self.name, line, details, args, name, extra, self.id))
+
+class RuleRegistry:
+    """
+    The rules available to the analysis pipeline, by id.
+
+    Built-in rules register themselves with ``@register``; third-party
+    packages add rules through the ``codev_suite.rules`` entry point group,
+    each entry point naming a ``Rule`` subclass.
+    """
+    def __init__(self):
+        self.rules: Dict[str, Type[Rule]] = {}
+
+    def register(self, rule: Type[Rule]) -> Type[Rule]:
+        if not rule.id:
+            raise ValueError(f"{rule.__name__} has no id")
+        if rule.category not in (SMELL, BUG):
+            raise ValueError(f"Rule {rule.id} has unknown category {rule.category!r}")
+        self.rules[rule.id] = rule
+        return rule
+
+    def load_entry_points(self):
+        from importlib.metadata import entry_points
+
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            self.register(entry_point.load())
+        return self
+
+    def create(self, config: Optional[Dict[str, Any]] = None, category: Optional[str] = None) -> List[Rule]:
+        """
+        Instantiates the enabled rules, in registration order, with options
+        from ``config`` (the ``[tool.codev]`` table).
+        """
+        config = config or {}
+        select = set(config.get("select", self.rules))
+        disabled = set(config.get("disable", ()))
+        unknown = (select | disabled) - set(self.rules)
+        if unknown:
+            raise ValueError(f"Unknown rules in configuration: {', '.join(sorted(unknown))}")
+        options = config.get("rules", {})
+        return [
+            rule(**options.get(rule_id, {}))
+            for rule_id, rule in self.rules.items()
+            if rule_id in select and rule_id not in disabled
+            and (category is None or rule.category == category)
+        ]
+
+registry = RuleRegistry()
+register = registry.register
+
+_plugins_loaded = False
+
+def default_registry() -> RuleRegistry:
+    """
+    Returns the registry with the built-in rules and installed plugins.
+    """
+    global _plugins_loaded
+    # Importing the rule modules registers the built-in rules.
+    from codev_suite.analyzers import bugs, smells  # noqa: F401
+
+    if not _plugins_loaded:
+        registry.load_entry_points()
+        _plugins_loaded = True
+    return registry
+
+def load_config(path: str) -> Dict[str, Any]:
+    """
+    Reads ``[tool.codev]`` from the nearest ``pyproject.toml`` at or above
+    ``path``. Returns an empty config when there is none, or when no TOML
+    parser is available (``tomllib`` needs Python 3.11, else ``tomli``).
+    """
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            return {}
+    current = os.path.abspath(path)
+    if os.path.isfile(current):
+        current = os.path.dirname(current)
+    while True:
+        candidate = os.path.join(current, "pyproject.toml")
+        if os.path.isfile(candidate):
+            with open(candidate, "rb") as f:
+                return tomllib.load(f).get("tool", {}).get("codev", {})
+        parent = os.path.dirname(current)
+        if parent == current:
+            return {}
+        current = parent
+
+def run_rules(rules: Iterable[Rule], tree: ast.AST) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Runs rules over a tree in one walk and returns findings by category.
+    """
+    from codev_suite.analyzers.dispatch import NodeDispatcher
+
+    rules = list(rules)
+    findings: Dict[str, List[Dict[str, Any]]] = {SMELL: [], BUG: []}
+    for rule in rules:
+        rule.reset(findings[rule.category])
+    NodeDispatcher(rules).run(tree)
+    return findings
@@ -1,67 +1,66 @@
 import ast
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from codev_suite.analyzers.rules import SMELL, Rule, default_registry, register, run_rules
 
-class CodeSmellDetector(ast.NodeVisitor):
-    """
-    Detects common code smells in Python code using AST.
-    """
-    def __init__(self):
-        self.smells: List[Dict[str, Any]] = []
-        self.current_function = None
-        self.depth = 0
-        self.MAX_NESTING = 3
-        self.MAX_METHOD_LENGTH = 50
-        self.MAX_ARGS = 5
-
-    def check(self, tree: ast.AST) -> List[Dict[str, Any]]:
-        self.smells = []
-        self.visit(tree)
-        return self.smells
+@register
+class TooManyArguments(Rule):
+    id = "too-many-arguments"
+    name = "Too Many Arguments"
+    options = {"max_args": 5}
 
-    def visit_FunctionDef(self, node: ast.FunctionDef):
-        # Check argument count
+    def enter_FunctionDef(self, node: ast.FunctionDef):
         arg_count = len(node.args.args)
-        if arg_count > self.MAX_ARGS:
-            self.smells.append({
-                "type": "Too Many Arguments",
-                "name": node.name,
-                "line": node.lineno,
-                "details": f"Function has {arg_count} arguments (limit: {self.MAX_ARGS})"
-            })
+        if arg_count > self.max_args:
+            self.report(node.lineno, "Function has {} arguments (limit: {})", arg_count, self.max_args,
+                        name=node.name)
+
+@register
+class LongMethod(Rule):
+    id = "long-method"
+    name = "Long Method"
+    options = {"max_method_length": 50}
 
-        # Check method length
+    def enter_FunctionDef(self, node: ast.FunctionDef):
         length = node.end_lineno - node.lineno
-        if length > self.MAX_METHOD_LENGTH:
-            self.smells.append({
-                "type": "Long Method",
-                "name": node.name,
-                "line": node.lineno,
-                "details": f"Method is {length} lines long (limit: {self.MAX_METHOD_LENGTH})"
-            })
+        if length > self.max_method_length:
+            self.report(node.lineno, "Method is {} lines long (limit: {})", length, self.max_method_length,
+                        name=node.name)
 
-        # Track nesting
-        old_function = self.current_function
-        self.current_function = node.name
-        self.generic_visit(node)
-        self.current_function = old_function
+@register
+class DeeplyNestedCode(Rule):
+    id = "deep-nesting"
+    name = "Deeply Nested Code"
+    options = {"max_nesting": 3}
 
-    def visit_If(self, node: ast.If):
-        self.depth += 1
-        if self.depth > self.MAX_NESTING:
-            self.smells.append({
-                "type": "Deeply Nested Code",
-                "line": node.lineno,
-                "details": f"Nesting depth: {self.depth} (limit: {self.MAX_NESTING})"
-            })
-        self.generic_visit(node)
-        self.depth -= 1
+    def reset(self, findings=None):
+        super().reset(findings)
+        self.depth = 0
 
-    def visit_While(self, node: ast.While):
+    def enter_If(self, node: ast.If):
         self.depth += 1
-        self.generic_visit(node)
-        self.depth -= 1
+        if self.depth > self.max_nesting:
+            self.report(node.lineno, "Nesting depth: {} (limit: {})", self.depth, self.max_nesting)
 
-    def visit_For(self, node: ast.For):
+    def _enter_loop(self, node):
         self.depth += 1
-        self.generic_visit(node)
+
+    def _leave_block(self, node):
         self.depth -= 1
+
+    enter_While = enter_For = _enter_loop
+    leave_If = leave_While = leave_For = _leave_block
+
+class CodeSmellDetector:
+    """
+    Detects common code smells in Python code using AST.
+
+    Runs the enabled ``smell`` rules from the rule registry; ``config`` is the
+    ``[tool.codev]`` table (see ``rules.load_config``).
+    """
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.rules = default_registry().create(config, category=SMELL)
+        self.smells: List[Dict[str, Any]] = []
+
+    def check(self, tree: ast.AST) -> List[Dict[str, Any]]:
+        self.smells = run_rules(self.rules, tree)[SMELL]
+        return self.smells
@@ -0,0 +1,99 @@
+import ast
+from typing import Dict, List, Optional, Tuple
+from codev_suite.analyzers.dispatch import NodeDispatcher
+from codev_suite.core.modules import ImportRef, absolute_module
+
+class SymbolCollector:
+    """
+    Collects the symbol table of one module: the functions and classes it
+    defines and the calls each of them makes.
+
+    Call targets are resolved to absolute dotted names through the module's
+    import aliases (``import pkg.util as u; u.f()`` -> ``pkg.util.f``), local
+    names (``f()`` -> ``<module>.f``) and ``self``/``cls`` inside a class.
+    Targets that cannot be named statically (``obj.method()``) are dropped.
+    """
+    def __init__(self, module: str, is_package: bool = False):
+        self.module = module
+        self.is_package = is_package
+        self.reset()
+
+    def reset(self):
+        self.defs: List[str] = []
+        self.aliases: Dict[str, str] = {}
+        self._scopes: List[ast.AST] = []
+        self._raw_calls: List[Tuple[str, Optional[str], List[str]]] = []
+
+    def collect(self, tree: ast.AST) -> Dict[str, list]:
+        """
+        Returns ``{"defs": [...], "calls": [[caller, callee], ...]}`` with fully
+        qualified names; module-level calls use the module name as caller.
+        """
+        self.reset()
+        NodeDispatcher([self]).run(tree)
+        calls = []
+        for caller, cls, parts in self._raw_calls:
+            target = self._resolve(cls, parts)
+            if target is not None:
+                calls.append([caller, target])
+        return {"defs": self.defs, "calls": calls}
+
+    def _qualname(self) -> str:
+        return ".".join([self.module] + [scope.name for scope in self._scopes])
+
+    def _enter_scope(self, node):
+        self._scopes.append(node)
+        self.defs.append(self._qualname())
+
+    def _leave_scope(self, node):
+        self._scopes.pop()
+
+    enter_FunctionDef = enter_AsyncFunctionDef = enter_ClassDef = _enter_scope
+    leave_FunctionDef = leave_AsyncFunctionDef = leave_ClassDef = _leave_scope
+
+    def enter_Import(self, node):
+        for alias in node.names:
+            if alias.asname:
+                self.aliases[alias.asname] = alias.name
+            else:
+                top = alias.name.split(".")[0]
+                self.aliases[top] = top
+
+    def enter_ImportFrom(self, node):
+        base = absolute_module(self.module, self.is_package, ImportRef(node.module, (), node.level))
+        for alias in node.names:
+            if alias.name != "*":
+                self.aliases[alias.asname or alias.name] = f"{base}.{alias.name}" if base else alias.name
+
+    def enter_Call(self, node):
+        parts = []
+        func = node.func
+        while isinstance(func, ast.Attribute):
+            parts.append(func.attr)
+            func = func.value
+        if not isinstance(func, ast.Name):
+            return
+        parts.append(func.id)
+        parts.reverse()
+        cls = next((s for s in reversed(self._scopes) if isinstance(s, ast.ClassDef)), None)
+        cls_name = None
+        if cls is not None:
+            # Qualified name of the innermost enclosing class.
+            index = self._scopes.index(cls)
+            cls_name = ".".join([self.module] + [s.name for s in self._scopes[:index + 1]])
+        self._raw_calls.append((self._qualname(), cls_name, parts))
+
+    def _resolve(self, cls: Optional[str], parts: List[str]) -> Optional[str]:
+        # Aliases are applied after the walk so imports below their first use
+        # (or inside functions) still count.
+        head, rest = parts[0], parts[1:]
+        if head in ("self", "cls") and cls is not None:
+            return f"{cls}.{rest[0]}" if len(rest) == 1 else None
+        if head in self.aliases:
+            return ".".join([self.aliases[head]] + rest)
+        if not rest:
+            return f"{self.module}.{head}"
+        return None
+
+def extract_symbols(tree: ast.AST, module: str, is_package: bool = False) -> Dict[str, list]:
+    return SymbolCollector(module, is_package).collect(tree)
@@ -2,16 +2,160 @@ import click
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.syntax import Syntax
-from codev_suite.core.parser import CodeParser
-from codev_suite.analyzers.metrics import MetricsAnalyzer
-from codev_suite.analyzers.smells import CodeSmellDetector
-from codev_suite.analyzers.bugs import BugDetector
-from codev_suite.visualization.graphs import DependencyGraphGenerator
-from codev_suite.ai.engine import AIEngine
+from codev_suite.ai.chunking import FunctionChunker, stitch_report
+from codev_suite.analyzers.findings import compact
+from codev_suite.analyzers.pipeline import AnalysisPipeline
+from codev_suite.analyzers.rules import default_registry, load_config
+from codev_suite.core.cache import ResultCache
+from codev_suite.core.discovery import DEFAULT_MAX_FILE_BYTES, decode_source, map_file
+from codev_suite.core.history import AnalysisIndex
+from codev_suite.core.profiling import FILE, RULE, STAGE, Profiler
+from codev_suite.core.incremental import (
+    git_changed_files, git_revision, load_report, merge_results, select_changed, write_report,
+)
+from codev_suite.core.scanner import DEFAULT_CHUNK_SIZE, RepositoryScanner, ScanSummary
+from codev_suite.reporting.writers import WRITERS, get_writer
+from collections import deque
+from contextlib import ExitStack
+import functools
+import json
 import os
+import sys
+import time
 
+# Heavy subsystems (networkx/matplotlib for graphs, the Gemini client and
+# dotenv for AI) are imported inside the commands that need them, so plain
+# analysis runs such as pre-commit hooks do not pay for them at startup.
 console = Console()
+err_console = Console(stderr=True)
+
+def open_cache(no_cache, cache_dir):
+    return None if no_cache else ResultCache(cache_dir)
+
+cache_options = [
+    click.option('--no-cache', is_flag=True, help="Do not read or write the result cache"),
+    click.option('--cache-dir', type=click.Path(file_okay=False), default=None,
+                 help="Result cache directory (default: ~/.cache/codev_suite)"),
+]
+
+index_options = [
+    click.option('--index', 'index_path', type=click.Path(dir_okay=False), default=None,
+                 help="History index file (default: ~/.cache/codev_suite/history.sqlite)"),
+]
+
+incremental_options = [
+    click.option('--since', 'base_rev', default=None, help="Only analyze files changed since this git revision"),
+    click.option('--changed', 'changed_paths', multiple=True, help="Only analyze this file (repeatable, relative to DIR_PATH)"),
+    click.option('--dependents', is_flag=True, help="Also analyze files that import a changed file"),
+    click.option('--baseline', type=click.Path(exists=True, dir_okay=False), default=None,
+                 help="Previous report to merge incremental results into"),
+]
+
+graph_source_options = [
+    click.option('--since', 'base_rev', default=None, help="Only re-analyze files changed since this git revision"),
+    click.option('--changed', 'changed_paths', multiple=True,
+                 help="Only re-analyze this file (repeatable, relative to DIR_PATH)"),
+    click.option('--baseline', type=click.Path(exists=True, dir_okay=False), default=None,
+                 help="Graph JSON saved by a previous run (--save) to update"),
+    click.option('--save', 'save_path', type=click.Path(dir_okay=False), default=None,
+                 help="Also save the graph as JSON for later incremental runs"),
+    click.option('--jobs', '-j', type=int, default=None, help="Worker processes for parsing (default: CPU count)"),
+]
+
+def with_options(options):
+    def decorator(f):
+        for option in reversed(options):
+            f = option(f)
+        return f
+    return decorator
+
+format_options = [
+    click.option('--format', 'fmt', type=click.Choice(['table'] + sorted(WRITERS)), default='table',
+                 show_default=True, help="Output format; non-table formats stream one record per file"),
+    click.option('--output', '-o', type=click.Path(dir_okay=False, allow_dash=True), default='-',
+                 help="Where to write json/ndjson/sarif output (default: stdout)"),
+]
+
+profile_options = [
+    click.option('--profile', is_flag=True, help="Report time per stage, rule and file"),
+    click.option('--profile-trace', type=click.Path(dir_okay=False), default=None,
+                 help="Also write a Chrome trace (chrome://tracing, ui.perfetto.dev) to this file"),
+    click.option('--profile-memory', is_flag=True, help="Also record bytes allocated per span (slow)"),
+]
+
+def print_profile(profiler, out, top=10):
+    for title, category in (("Stages", STAGE), ("Rules", RULE)):
+        table = Table(title=title)
+        table.add_column("Name", style="cyan")
+        table.add_column("Total (ms)", style="green", justify="right")
+        table.add_column("Calls", style="blue", justify="right")
+        for name, total, count in profiler.totals(category):
+            table.add_row(name, f"{total:.1f}", str(count))
+        out.print(table)
+    slowest = profiler.slowest(FILE, top)
+    if slowest:
+        table = Table(title="Slowest Files")
+        table.add_column("File", style="cyan")
+        table.add_column("Time (ms)", style="green", justify="right")
+        if profiler.memory:
+            table.add_column("Allocated (KiB)", style="yellow", justify="right")
+        for event in slowest:
+            row = [event["name"], f"{event['dur'] / 1000:.1f}"]
+            if profiler.memory:
+                row.append(f"{event['args'].get('alloc_bytes', 0) / 1024:.0f}")
+            table.add_row(*row)
+        out.print(table)
+
+def with_profile_options(f):
+    """
+    Adds ``--profile``, ``--profile-trace`` and ``--profile-memory`` to a
+    command and runs it under a ``Profiler`` when any of them is given.
+    The report goes to stderr for machine-readable formats.
+    """
+    @functools.wraps(f)
+    def wrapper(*args, profile, profile_trace, profile_memory, **kwargs):
+        if not (profile or profile_trace or profile_memory):
+            return f(*args, **kwargs)
+        with Profiler(memory=profile_memory) as profiler:
+            f(*args, **kwargs)
+        out = console if kwargs.get('fmt', 'table') == 'table' else err_console
+        if profile or profile_memory:
+            print_profile(profiler, out)
+        if profile_trace:
+            profiler.write_chrome_trace(profile_trace)
+            out.print(f"[green]Trace saved to {profile_trace}[/green]")
+    return with_options(profile_options)(wrapper)
+
+with_cache_options = with_options(cache_options)
+with_incremental_options = with_options(incremental_options)
+with_index_options = with_options(index_options)
+with_format_options = with_options(format_options)
+with_graph_source_options = with_options(graph_source_options)
+
+def request_ai_insights(content, result, cache):
+    """
+    Sends an outline of the module and its hot or smelly functions to the AI,
+    each as its own cached request, all running concurrently.
+    Returns the explanation, the reviewed chunks and their answers.
+    """
+    from codev_suite.ai.engine import AIEngine
+
+    engine = AIEngine(cache=cache)
+    chunker = FunctionChunker(content)
+    chunks = chunker.select(result["complexity"], result["smells"] + result["bugs"])
+    prompts = [engine.explain_prompt(chunker.outline())]
+    prompts += [engine.function_prompt(chunk) for chunk in chunks]
+    answers = engine.batch(prompts)
+    return answers[0], chunks, answers[1:]
+
+def resolve_changed(dir_path, base_rev, changed_paths):
+    """Returns the changed paths requested on the command line, or None for a full run."""
+    if not base_rev and not changed_paths:
+        return None
+    changed = set(changed_paths)
+    if base_rev:
+        changed.update(git_changed_files(dir_path, base_rev))
+    return changed
 
 @click.group()
 def cli():
@@ -21,29 +165,52 @@ def cli():
 @cli.command()
 @click.argument('file_path', type=click.Path(exists=True))
 @click.option('--ai', is_flag=True, help="Include AI insights")
-def analyze(file_path, ai):
+@click.option('--strict', is_flag=True, help="Fully analyze the file even if the lexical prefilter finds it trivial")
+@with_format_options
+@with_cache_options
+@with_profile_options
+def analyze(file_path, ai, strict, fmt, output, no_cache, cache_dir):
     """Analyze a Python source file."""
-    console.print(Panel(f"[bold blue]Analyzing:[/bold blue] {file_path}", expand=False))
+    if fmt == 'table':
+        console.print(Panel(f"[bold blue]Analyzing:[/bold blue] {file_path}", expand=False))
 
+    cache = open_cache(no_cache, cache_dir)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        config = load_config(file_path)
+        if strict:
+            config["prefilter"] = False
+        with map_file(file_path, config.get("max_file_bytes", DEFAULT_MAX_FILE_BYTES)) as data:
+            content = decode_source(data, file_path)
+            # 1-3. Parsing, metrics, smells & bugs over one shared AST
+            pipeline = AnalysisPipeline(config)
+            key = pipeline.cache_key(data)
+        result = cache.get(key) if cache is not None else None
+        if result is None:
+            result = pipeline.run(content, file_path)
+            if cache is not None:
+                # Entries are shared by every file with the same content.
+                cache.set(key, {k: v for k, v in result.items() if k != "path"})
+        else:
+            result = compact({"path": file_path, **result})
 
-        # 1. Parsing
-        parser = CodeParser(source_code=content)
-        structure = parser.get_structure()
-        
-        # 2. Metrics
-        metrics_analyzer = MetricsAnalyzer(content)
-        complexity = metrics_analyzer.analyze_complexity()
-        ma_index = metrics_analyzer.analyze_maintainability()
-
-        # 3. Smells & Bugs
-        detector = CodeSmellDetector()
-        smells = detector.check(parser.tree)
-        
-        bug_detector = BugDetector()
-        bugs = bug_detector.check(parser.tree)
+        if fmt != 'table':
+            if ai:
+                explanation, chunks, answers = request_ai_insights(content, result, cache)
+                result["ai"] = {
+                    "explanation": explanation,
+                    "functions": [
+                        {"qualname": chunk["qualname"], "line": chunk["line"], "suggestion": answer}
+                        for chunk, answer in zip(chunks, answers)
+                    ],
+                }
+            with click.open_file(output, 'w') as stream, get_writer(fmt, stream) as writer:
+                writer.write(result)
+            return
+
+        complexity = result["complexity"]
+        ma_index = result["maintainability"]
+        smells = result["smells"]
+        bugs = result["bugs"]
 
         # Output Results
         # Complexity Table
@@ -77,30 +244,391 @@ def analyze(file_path, ai):
         # 4. AI Insights
         if ai:
             console.print("\n[bold purple]Requesting AI Insights...[/bold purple]")
-            engine = AIEngine()
-            explanation = engine.explain_code(content)
+            explanation, chunks, answers = request_ai_insights(content, result, cache)
             console.print(Panel(explanation, title="AI Explanation", border_style="purple"))
-            
-            if smells:
-                refactor = engine.suggest_refactor(content, smells)
-                console.print(Panel(refactor, title="Refactoring Suggestions", border_style="green"))
+
+            if chunks:
+                report = stitch_report(chunks, answers)
+                console.print(Panel(report, title="Refactoring Suggestions", border_style="green"))
 
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {str(e)}")
+        (console if fmt == 'table' else err_console).print(f"[bold red]Error:[/bold red] {str(e)}")
+    finally:
+        if cache is not None:
+            cache.close()
+
+def build_dependency_graph(dir_path, jobs, base_rev, changed_paths, baseline, save_path):
+    """
+    Builds (or incrementally updates a saved) dependency graph for the
+    ``graph`` and ``deps`` commands.
+    """
+    from codev_suite.visualization.graphs import DependencyGraphGenerator
+
+    generator = DependencyGraphGenerator(dir_path, jobs=jobs)
+    changed = resolve_changed(dir_path, base_rev, changed_paths)
+    if baseline:
+        generator.load(baseline)
+    if changed is not None and baseline:
+        generator.build_graph(sorted(changed))
+    else:
+        generator.build_graph()
+    if save_path:
+        generator.save(save_path)
+    return generator
 
 @cli.command()
 @click.argument('dir_path', type=click.Path(exists=True))
-@click.option('--out', default='dependency_graph.png', help="Output file path")
-def graph(dir_path, out):
+@click.option('--out', default='dependency_graph.png', help="Output file path (.png, .svg or interactive .html)")
+@click.option('--layout', type=click.Choice(['auto', 'spring', 'hierarchical', 'clustered']), default='auto',
+              show_default=True, help="Layout; auto uses spring for small graphs, hierarchical for large ones")
+@click.option('--collapse', 'collapse_depth', type=int, default=None,
+              help="Merge modules into packages at this depth (e.g. 2: app.api.views -> app.api)")
+@click.option('--no-external', is_flag=True, help="Hide third-party and standard library nodes")
+@with_graph_source_options
+@with_profile_options
+def graph(dir_path, out, layout, collapse_depth, no_external, base_rev, changed_paths, baseline, save_path, jobs):
     """Generate a dependency graph for a directory."""
     console.print(Panel(f"[bold blue]Generating Dependency Graph for:[/bold blue] {dir_path}", expand=False))
     try:
-        generator = DependencyGraphGenerator(dir_path)
-        generator.build_graph()
-        path = generator.visualize(out)
+        generator = build_dependency_graph(dir_path, jobs, base_rev, changed_paths, baseline, save_path)
+        path = generator.visualize(out, layout=layout, collapse_depth=collapse_depth,
+                                   include_external=not no_external)
         console.print(f"[green]Graph saved to {path}[/green]")
+        for file_path, error in generator.errors:
+            console.print(f"- [yellow]{file_path}[/yellow] skipped: {error}")
     except Exception as e:
         console.print(f"[bold red]Error generating graph:[/bold red] {str(e)}")
 
+@cli.command()
+@click.argument('dir_path', type=click.Path(exists=True))
+@click.option('--top', type=int, default=10, show_default=True, help="Number of modules and functions to list")
+@click.option('--format', 'fmt', type=click.Choice(['table', 'json']), default='table', show_default=True,
+              help="Output format")
+@with_graph_source_options
+def deps(dir_path, top, fmt, base_rev, changed_paths, baseline, save_path, jobs):
+    """Report import cycles, module coupling and the most called functions."""
+    from codev_suite.analyzers.coupling import import_cycles, module_coupling
+
+    try:
+        generator = build_dependency_graph(dir_path, jobs, base_rev, changed_paths, baseline, save_path)
+    except Exception as e:
+        err_console.print(f"[bold red]Error building graph:[/bold red] {str(e)}")
+        sys.exit(1)
+    cycles = import_cycles(generator)
+    coupling = sorted(module_coupling(generator), key=lambda row: (-row["fan_in"], row["module"]))
+    most_called = generator.calls.most_called(top, cross_module=True)
+
+    if fmt == 'json':
+        click.echo(json.dumps({
+            "cycles": cycles,
+            "coupling": coupling,
+            "most_called": [{"symbol": symbol, "callers": count} for symbol, count in most_called],
+        }, indent=2))
+        return
+
+    console.print(Panel(f"[bold blue]Dependencies of:[/bold blue] {dir_path}", expand=False))
+    if cycles:
+        console.print(f"[bold red]{len(cycles)} import cycle(s):[/bold red]")
+        for cycle in cycles:
+            console.print(f"- {' -> '.join(cycle)}")
+    else:
+        console.print("[green]No import cycles.[/green]")
+
+    table = Table(title="Module Coupling (most depended upon)")
+    table.add_column("Module", style="cyan", overflow="fold")
+    table.add_column("Fan-in (Ca)", justify="right")
+    table.add_column("Fan-out (Ce)", justify="right")
+    table.add_column("External", justify="right")
+    table.add_column("Instability", justify="right")
+    for row in coupling[:top]:
+        table.add_row(row["module"], str(row["fan_in"]), str(row["fan_out"]), str(row["external"]),
+                      f"{row['instability']:.2f}")
+    console.print(table)
+
+    if most_called:
+        table = Table(title="Most Called Across Modules")
+        table.add_column("Function / Class", style="cyan", overflow="fold")
+        table.add_column("Callers", justify="right")
+        for symbol, count in most_called:
+            table.add_row(symbol, str(count))
+        console.print(table)
+    for file_path, error in generator.errors:
+        console.print(f"- [yellow]{file_path}[/yellow] skipped: {error}")
+
+@cli.command()
+@click.argument('dir_path', type=click.Path(exists=True, file_okay=False))
+@click.option('--jobs', '-j', type=int, default=None, help="Worker processes (default: CPU count)")
+@click.option('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, show_default=True,
+              help="Files handed to a worker at a time")
+@click.option('--top', type=int, default=10, show_default=True, help="Number of complexity hotspots to list")
+@click.option('--report', 'report_path', type=click.Path(dir_okay=False), default=None,
+              help="Write per-file results (merged with --baseline) to this JSON file")
+@click.option('--chart', 'chart_path', type=click.Path(dir_okay=False), default=None,
+              help="Save complexity and maintainability histograms to this image (.png, .svg)")
+@click.option('--record', is_flag=True, help="Record this run in the history index for `codev trends`")
+@click.option('--strict', is_flag=True, help="Fully analyze every file, without the lexical prefilter for trivial files")
+@click.option('--file-timeout', type=float, default=None,
+              help="Seconds each file may take before it is reported as timed out (default: 60, 0 for none)")
+@click.option('--file-memory', type=int, default=None,
+              help="Address space limit per worker process in MiB (default: none)")
+@with_index_options
+@with_incremental_options
+@with_format_options
+@with_cache_options
+@with_profile_options
+def scan(dir_path, jobs, chunk_size, top, report_path, chart_path, record, strict, file_timeout, file_memory,
+         index_path, base_rev, changed_paths, dependents, baseline, fmt, output, no_cache, cache_dir):
+    """Analyze every Python file in a directory in parallel."""
+    # Machine-readable formats skip all rich rendering and stream records instead.
+    machine = fmt != 'table'
+    if not machine:
+        console.print(Panel(f"[bold blue]Scanning:[/bold blue] {dir_path}", expand=False))
+
+    baseline_results = load_report(baseline) if baseline else {}
+    changed = resolve_changed(dir_path, base_rev, changed_paths)
+    paths, removed = None, []
+    if changed is not None:
+        targets, removed = select_changed(dir_path, changed, baseline_results, dependents)
+        paths = [os.path.join(dir_path, path) for path in targets]
+        if not machine:
+            console.print(f"Incremental run: {len(targets)} files to analyze, {len(removed)} removed")
+
+    cache = open_cache(no_cache, cache_dir)
+    overrides = {}
+    if strict:
+        overrides["prefilter"] = False
+    if file_timeout is not None:
+        overrides["file_timeout"] = file_timeout
+    if file_memory is not None:
+        overrides["file_memory_mb"] = file_memory
+    config = {**load_config(dir_path), **overrides} if overrides else None
+    scanner = RepositoryScanner(dir_path, jobs=jobs, chunk_size=chunk_size, cache=cache, config=config)
+    summary = ScanSummary(top=top)
+    index = AnalysisIndex(index_path) if record else None
+    if index is not None:
+        index.begin_run(dir_path, git_revision(dir_path))
+
+    def track(results, status=None, writer=None):
+        for result in results:
+            if index is not None:
+                index.add(result)
+            if writer is not None:
+                writer.write(result)
+            else:
+                summary.add(result)
+                status.update(f"Analyzed {summary.files} files ({len(summary.errors)} failed)")
+            yield result
+
+    try:
+        with ExitStack() as stack:
+            if machine:
+                stream = stack.enter_context(click.open_file(output, 'w'))
+                writer = stack.enter_context(get_writer(fmt, stream))
+                results = track(scanner.scan(paths), writer=writer)
+            else:
+                status = stack.enter_context(console.status("Analyzing..."))
+                results = track(scanner.scan(paths), status=status)
+
+            if not report_path:
+                deque(results, maxlen=0)
+            elif changed is None and not baseline_results:
+                write_report(report_path, results)
+            else:
+                merged = merge_results(baseline_results, results, removed)
+                write_report(report_path, merged.values())
+            if index is not None:
+                index.end_run(removed, full=changed is None)
+    finally:
+        if cache is not None:
+            cache.close()
+        if index is not None:
+            index.close()
+
+    if machine:
+        return
+
+    table = Table(title="Complexity Hotspots")
+    table.add_column("File", style="cyan")
+    table.add_column("Name", style="magenta")
+    table.add_column("Line", style="blue")
+    table.add_column("Complexity", style="green")
+    table.add_column("Rank", style="yellow")
+    for item in summary.top_hotspots():
+        table.add_row(item['path'], item['name'], str(item['lineno']), str(item['complexity']), item['rank'])
+    console.print(table)
+
+    metrics = summary.metrics
+    table = Table(title="Least Maintainable Files")
+    table.add_column("File", style="cyan")
+    table.add_column("Maintainability", style="green", justify="right")
+    for path, mi in metrics.top_files(top):
+        table.add_row(path, f"{mi:.2f}")
+    console.print(table)
+
+    console.print(f"[bold]Files analyzed:[/bold] {summary.analyzed} / {summary.files}")
+    console.print(f"[bold]Average Maintainability Index:[/bold] {summary.average_maintainability:.2f}")
+    percentiles = metrics.percentiles("complexity")
+    if percentiles:
+        console.print("[bold]Complexity percentiles:[/bold] "
+                      + ", ".join(f"p{q} {value:g}" for q, value in percentiles.items()))
+    console.print(f"[bold]Code smells:[/bold] {summary.smells}  [bold]Potential bugs:[/bold] {summary.bugs}")
+    if cache is not None:
+        console.print(f"[bold]Cache:[/bold] {cache.hits} hits, {cache.misses} misses")
+
+    if report_path:
+        console.print(f"[green]Report saved to {report_path}[/green]")
+    if record:
+        console.print(f"[green]Run recorded in {index.path}[/green]")
+    if chart_path:
+        from codev_suite.visualization.metrics_viz import MetricsVisualizer
+
+        MetricsVisualizer.plot_repository_summary(metrics, chart_path)
+        console.print(f"[green]Charts saved to {chart_path}[/green]")
+
+    if summary.errors:
+        console.print("\n[bold red]Files that could not be analyzed:[/bold red]")
+        for error in summary.errors:
+            console.print(f"- [yellow]{error['path']}[/yellow]: {error['error']}")
+
+@cli.command()
+@click.argument('dir_path', type=click.Path(exists=True, file_okay=False))
+@click.option('--runs', 'last', type=int, default=10, show_default=True, help="Number of recent runs to compare")
+@click.option('--top', type=int, default=10, show_default=True, help="Number of functions to list")
+@click.option('--falling', is_flag=True, help="List functions whose complexity fell most instead")
+@click.option('--format', 'fmt', type=click.Choice(['table', 'json']), default='table', show_default=True,
+              help="Output format")
+@with_index_options
+def trends(dir_path, last, top, falling, fmt, index_path):
+    """Show how DIR_PATH changed across runs recorded with `scan --record`, without re-analyzing."""
+    with AnalysisIndex(index_path) as index:
+        runs = index.runs(dir_path, last)
+        changes = index.complexity_changes(dir_path, last, top, rising=not falling)
+    if fmt == 'json':
+        click.echo(json.dumps({"runs": runs, "complexity": changes}, indent=2))
+        return
+    if not runs:
+        console.print(f"[yellow]No recorded runs for {dir_path}; run `codev scan --record` first.[/yellow]")
+        return
+
+    table = Table(title="Recorded Runs")
+    table.add_column("Run", style="blue", justify="right")
+    table.add_column("Date")
+    table.add_column("Revision", style="magenta")
+    table.add_column("Analyzed", justify="right")
+    table.add_column("Files", justify="right")
+    table.add_column("Avg. Maintainability", style="green", justify="right")
+    table.add_column("Smells", justify="right")
+    table.add_column("Bugs", justify="right")
+    for run in runs:
+        mi = run['maintainability']
+        table.add_row(str(run['run']), time.strftime("%Y-%m-%d %H:%M", time.localtime(run['started'])),
+                      (run['revision'] or "-")[:10], str(run['files']), str(run['tracked']), "-" if mi is None else f"{mi:.2f}",
+                      str(run['smells'] or 0), str(run['bugs'] or 0))
+    console.print(table)
+
+    table = Table(title=f"Functions Whose Complexity {'Fell' if falling else 'Rose'} Most")
+    table.add_column("File", style="cyan")
+    table.add_column("Name", style="magenta")
+    table.add_column("Line", style="blue")
+    table.add_column("Before", justify="right")
+    table.add_column("After", justify="right")
+    table.add_column("Change", style="yellow", justify="right")
+    for item in changes:
+        table.add_row(item['path'], item['symbol'], str(item['lineno']), str(item['before']),
+                      str(item['after']), f"{item['delta']:+d}")
+    console.print(table)
+
+@cli.command()
+@click.argument('dir_path', type=click.Path(exists=True, file_okay=False))
+@click.option('--interval', type=float, default=0.5, show_default=True,
+              help="Seconds between mtime polls when filesystem notifications are unavailable")
+@click.option('--poll', is_flag=True, help="Poll mtimes even when watchdog is installed")
+@click.option('--jobs', '-j', type=int, default=None, help="Worker processes for the initial scan (default: CPU count)")
+@with_cache_options
+def watch(dir_path, interval, poll, jobs, no_cache, cache_dir):
+    """Re-analyze files as they are saved."""
+    from codev_suite.core.watch import WorkspaceState, make_watcher, new_findings
+
+    cache = open_cache(no_cache, cache_dir)
+    watcher = make_watcher(dir_path, interval=interval, polling=poll)
+    try:
+        with console.status("Analyzing..."):
+            state = WorkspaceState(dir_path, jobs=jobs, cache=cache).load()
+        console.print(f"Watching {len(state.results)} files in {dir_path} "
+                      f"({type(watcher).__name__}). Press Ctrl+C to stop.")
+        while True:
+            changed = watcher.wait()
+            started = time.perf_counter()
+            update = state.update(changed)
+            if not update["analyzed"] and not update["removed"]:
+                continue
+            elapsed = (time.perf_counter() - started) * 1000
+            console.rule(f"[dim]{time.strftime('%H:%M:%S')} · {elapsed:.0f} ms[/dim]")
+            for path, (previous, result) in update["analyzed"].items():
+                if "error" in result:
+                    console.print(f"[red]{path}[/red]: {result['error']}")
+                    continue
+                mi = result["maintainability"]
+                delta = ""
+                if previous and "error" not in previous:
+                    change = mi - previous["maintainability"]
+                    if abs(change) >= 0.01:
+                        delta = f" ({'[green]+' if change > 0 else '[red]'}{change:.2f}[/])"
+                console.print(f"[cyan]{path}[/cyan]: MI {mi:.2f}{delta}, "
+                              f"{len(result['smells'])} smells, {len(result['bugs'])} bugs")
+                for finding in new_findings(previous, result):
+                    console.print(f"  [yellow]new[/yellow] {finding['type']} (line {finding['line']}): {finding['details']}")
+            for path in update["removed"]:
+                console.print(f"[dim]{path} removed[/dim]")
+            if update["cycles"] is not None:
+                if update["cycles"]:
+                    for cycle in update["cycles"]:
+                        console.print(f"[bold red]Import cycle:[/bold red] {' -> '.join(cycle)}")
+                else:
+                    console.print("[green]No import cycles.[/green]")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+        if cache is not None:
+            cache.close()
+
+@cli.command()
+@click.option('--host', default='127.0.0.1', show_default=True, help="Interface to listen on")
+@click.option('--port', type=int, default=8765, show_default=True, help="Port to listen on")
+@click.option('--jobs', '-j', type=int, default=None, help="Worker processes (default: CPU count)")
+@click.option('--batch-size', type=int, default=16, show_default=True,
+              help="Most files handed to a worker in one task")
+@click.option('--max-pending', type=int, default=256, show_default=True,
+              help="Files queued or running before requests are refused with 503")
+@click.option('--quiet', is_flag=True, help="Do not log each request")
+@with_cache_options
+def serve(host, port, jobs, batch_size, max_pending, quiet, no_cache, cache_dir):
+    """Serve the analyzers over a local HTTP/JSON API."""
+    from codev_suite.server.service import serve as run_server
+
+    console.print(Panel(f"[bold blue]Serving analysis API on[/bold blue] http://{host}:{port}", expand=False))
+    console.print("POST /analyze with {\"source\": ..., \"path\": ...} or {\"files\": [...]}; GET /health")
+    run_server(host, port, quiet=quiet, jobs=jobs, cache_dir=cache_dir, use_cache=not no_cache,
+               batch_size=batch_size, max_pending=max_pending, config=load_config(os.getcwd()))
+
+@cli.command()
+@click.argument('dir_path', type=click.Path(exists=True), default='.')
+def rules(dir_path):
+    """List the available rules and whether DIR_PATH's configuration enables them."""
+    registry = default_registry()
+    enabled = {rule.id: rule for rule in registry.create(load_config(dir_path))}
+    table = Table(title="Rules")
+    table.add_column("Id", style="cyan")
+    table.add_column("Category")
+    table.add_column("Name")
+    table.add_column("Enabled")
+    table.add_column("Options")
+    for rule_id, rule in registry.rules.items():
+        options = enabled[rule_id].config if rule_id in enabled else rule.options
+        table.add_row(rule_id, rule.category, rule.name, "yes" if rule_id in enabled else "[dim]no[/dim]",
+                      ", ".join(f"{k}={v}" for k, v in options.items()))
+    console.print(table)
+
 if __name__ == '__main__':
     cli()
@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Any, List, Optional, Tuple
+from codev_suite.analyzers.findings import json_default
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "codev_suite")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+_COMMIT_EVERY = 256
+
+def content_hash(data: bytes) -> str:
+    """
+    Returns the hex digest used to key cached results by file content.
+    """
+    return hashlib.sha256(data).hexdigest()
+
+class ResultCache:
+    """
+    Persistent, size-bounded cache of JSON-serializable analysis results.
+
+    Entries live in a single SQLite file and are keyed by the caller, normally
+    ``<analyzer fingerprint>:<content hash>``. When the stored payload exceeds
+    ``max_bytes`` the least recently used entries are evicted.
+    """
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        directory = directory or DEFAULT_CACHE_DIR
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "results.sqlite")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+            " size INTEGER NOT NULL, accessed REAL NOT NULL)"
+        )
+        # Covers both the LRU order and SUM(size), which then never reads the values.
+        self._conn.execute("DROP INDEX IF EXISTS entries_accessed")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries (accessed, size)")
+        self._conn.commit()
+        self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        self._touched: List[Tuple[float, str]] = []
+        self._dirty = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        row = self._conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # Access times are written back in batches to keep lookups read-only.
+        self._touched.append((time.time(), key))
+        if len(self._touched) >= _COMMIT_EVERY:
+            self.flush()
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any):
+        payload = json.dumps(value, separators=(",", ":"), default=json_default)
+        old = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO entries (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+            (key, payload, len(payload), time.time()),
+        )
+        self._size += len(payload) - (old[0] if old else 0)
+        self._dirty += 1
+        if self._size > self.max_bytes:
+            self._evict()
+        if self._dirty >= _COMMIT_EVERY:
+            self.flush()
+
+    def _evict(self):
+        """
+        Drops least recently used entries until the cache is at 90% of its budget.
+
+        ``_size`` is only refreshed from the store on ``flush``, and other
+        processes may share the file, so the real total is re-read under the
+        write lock before choosing what to drop.
+        """
+        self.flush()
+        target = self.max_bytes * 0.9
+        self._conn.execute("BEGIN IMMEDIATE")
+        self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        rows = self._conn.execute("SELECT key, size FROM entries ORDER BY accessed")
+        doomed = []
+        for key, size in rows:
+            if self._size <= target:
+                break
+            doomed.append((key,))
+            self._size -= size
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+        self._conn.commit()
+
+    def clear(self):
+        self._conn.execute("DELETE FROM entries")
+        self._conn.commit()
+        self._size = 0
+        self._touched = []
+
+    def flush(self):
+        if self._touched:
+            self._conn.executemany("UPDATE entries SET accessed = ? WHERE key = ?", self._touched)
+            self._touched = []
+        self._conn.commit()
+        self._dirty = 0
+        # Pick up what other processes sharing the file added or evicted.
+        self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def close(self):
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
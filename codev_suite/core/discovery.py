@@ -0,0 +1,262 @@
+import codecs
+import io
+import mmap
+import os
+import re
+import tokenize
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Tuple, Union
+
+DEFAULT_EXCLUDED_DIRS = frozenset({
+    ".git", ".hg", ".svn", "__pycache__", ".mypy_cache", ".pytest_cache",
+    ".tox", ".nox", ".venv", "venv", "env", "node_modules", "site-packages",
+    "build", "dist", "vendor", "_vendor", "third_party",
+})
+# Larger files are skipped and reported; override with ``max_file_bytes``
+# in ``[tool.codev]``.
+DEFAULT_MAX_FILE_BYTES = 2 * 1024 * 1024
+# Files at least this large are memory-mapped instead of read into a buffer.
+MMAP_THRESHOLD = 256 * 1024
+GITIGNORE = ".gitignore"
+
+def is_excluded_dir(name: str, excluded: Iterable[str] = DEFAULT_EXCLUDED_DIRS) -> bool:
+    """
+    Returns True for directories that never contain first-party sources.
+    """
+    return name in excluded or name.endswith(".egg-info")
+
+def _translate(pattern: str) -> str:
+    """Translates a gitignore glob into a regex over ``/``-separated paths."""
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i):
+                if pattern.startswith("**/", i):
+                    out.append("(?:.*/)?")
+                    i += 3
+                else:
+                    out.append(".*")
+                    i += 2
+                continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append("[" + body.replace("\\", "\\\\") + "]")
+                i = end + 1
+                continue
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+            continue
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+class GitIgnore:
+    """
+    The patterns of one ``.gitignore`` file, matched against paths relative
+    to the directory holding it. Supports comments, ``!`` negation, trailing
+    ``/`` for directories only, anchoring with a leading or inner ``/``, and
+    ``*``, ``?``, ``[...]`` and ``**`` globs.
+    """
+    def __init__(self, lines: Iterable[str]):
+        self.patterns: List[Tuple[Pattern, bool, bool]] = []
+        for line in lines:
+            line = line.rstrip("\n\r")
+            if not line.endswith("\\ "):
+                line = line.rstrip(" ")
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            regex = _translate(line.lstrip("/"))
+            if "/" not in line:
+                regex = "(?:.*/)?" + regex
+            self.patterns.append((re.compile(regex + r"\Z"), negate, dir_only))
+
+    @classmethod
+    def load(cls, directory: str) -> Optional["GitIgnore"]:
+        try:
+            with open(os.path.join(directory, GITIGNORE), 'r', encoding='utf-8', errors='replace') as f:
+                ignore = cls(f)
+        except OSError:
+            return None
+        return ignore if ignore.patterns else None
+
+    def match(self, rel_path: str, is_dir: bool = False) -> Optional[bool]:
+        """
+        Returns True if the last matching pattern ignores the path, False if
+        it re-includes it (``!pattern``) and None if no pattern matches.
+        """
+        result = None
+        for regex, negate, dir_only in self.patterns:
+            if (is_dir or not dir_only) and regex.match(rel_path):
+                result = not negate
+        return result
+
+class IgnoreRules:
+    """
+    Decides which paths below ``root`` are skipped: the default excluded
+    directories plus the patterns of every ``.gitignore`` between ``root``
+    and the path (deeper files take precedence). Only ``.gitignore`` files
+    inside ``root`` are read, each at most once.
+    """
+    def __init__(self, root: str, excluded_dirs: Optional[Iterable[str]] = None, gitignore: bool = True):
+        self.root = root
+        self.excluded = frozenset(excluded_dirs) if excluded_dirs is not None else DEFAULT_EXCLUDED_DIRS
+        self.gitignore = gitignore
+        self._chains: Dict[str, Tuple[Tuple[str, GitIgnore], ...]] = {}
+
+    def _chain(self, rel_dir: str) -> Tuple[Tuple[str, GitIgnore], ...]:
+        """The ``(base, GitIgnore)`` pairs that apply inside ``rel_dir``."""
+        chain = self._chains.get(rel_dir)
+        if chain is None:
+            parent = self._chain(rel_dir.rpartition("/")[0]) if rel_dir else ()
+            ignore = GitIgnore.load(os.path.join(self.root, rel_dir)) if self.gitignore else None
+            chain = parent + ((rel_dir, ignore),) if ignore is not None else parent
+            self._chains[rel_dir] = chain
+        return chain
+
+    def ignored(self, rel_path: str, is_dir: bool = False) -> bool:
+        """
+        Checks one entry whose parent directories are known not to be ignored
+        (as when walking the tree top-down).
+        """
+        rel_path = rel_path.replace(os.sep, "/")
+        parent, _, name = rel_path.rpartition("/")
+        if is_dir and is_excluded_dir(name, self.excluded):
+            return True
+        result = None
+        for base, ignore in self._chain(parent):
+            match = ignore.match(rel_path[len(base) + 1:] if base else rel_path, is_dir)
+            if match is not None:
+                result = match
+        return bool(result)
+
+    def ignored_path(self, rel_path: str) -> bool:
+        """Checks a file and each of its parent directories."""
+        parts = rel_path.replace(os.sep, "/").split("/")
+        for depth in range(1, len(parts)):
+            if self.ignored("/".join(parts[:depth]), is_dir=True):
+                return True
+        return self.ignored("/".join(parts))
+
+def iter_python_files(root: str, excluded_dirs: Optional[Iterable[str]] = None,
+                      gitignore: bool = True) -> Iterator[str]:
+    """
+    Yields the paths of all Python files below ``root`` in a stable order,
+    skipping VCS metadata, caches, virtualenvs, vendored code, build output
+    and (with ``gitignore``) anything a ``.gitignore`` excludes.
+
+    The tree is walked with ``os.scandir`` one directory at a time, so memory
+    stays proportional to the widest directory, not the whole tree.
+    """
+    if os.path.isfile(root):
+        if root.endswith(".py"):
+            yield root
+        return
+    rules = IgnoreRules(root, excluded_dirs, gitignore)
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            with os.scandir(os.path.join(root, rel_dir)) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                if entry.is_dir():
+                    if not entry.is_symlink() and not rules.ignored(rel_path, is_dir=True):
+                        subdirs.append(rel_path)
+                elif entry.name.endswith(".py") and not rules.ignored(rel_path):
+                    yield os.path.join(root, rel_path.replace("/", os.sep))
+            except OSError:
+                continue
+        # Depth first, in name order: the same order as a sorted os.walk.
+        stack.extend(reversed(subdirs))
+
+class SourceError(ValueError):
+    """A file that cannot be read as Python source."""
+
+class FileTooLarge(SourceError):
+    def __init__(self, path: str, size: int, limit: int):
+        super().__init__(f"{path} is {size / 1024:.0f} KiB, over the {limit / 1024:.0f} KiB limit "
+                         "(raise max_file_bytes in [tool.codev] to analyze it)")
+        self.size = size
+        self.limit = limit
+
+class SourceDecodeError(SourceError):
+    pass
+
+@contextmanager
+def map_file(path: str, max_bytes: Optional[int] = DEFAULT_MAX_FILE_BYTES) -> Iterator[Union[bytes, mmap.mmap]]:
+    """
+    Yields a file's contents as a read-only buffer: ``bytes`` for small files
+    and an ``mmap`` for large ones, so hashing and decoding them does not
+    need an extra in-memory copy. Raises ``FileTooLarge`` over ``max_bytes``.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if max_bytes is not None and size > max_bytes:
+            raise FileTooLarge(path, size, max_bytes)
+        if size < MMAP_THRESHOLD:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+def decode_source(data: Union[bytes, mmap.mmap], path: str = "<source>", errors: str = "strict") -> str:
+    """
+    Decodes Python source the way the interpreter does: a UTF-8 BOM or a
+    PEP 263 ``coding`` comment selects the encoding, else UTF-8. Invalid
+    bytes raise ``SourceDecodeError`` naming the encoding and offset, unless
+    ``errors`` asks for a lossy fallback such as ``"replace"``. Newlines are
+    normalized to ``\\n``.
+    """
+    # The encoding can only be declared on the first two lines.
+    end = data.find(b"\n", data.find(b"\n") + 1)
+    try:
+        encoding, _ = tokenize.detect_encoding(io.BytesIO(data[:end + 1] if end != -1 else data[:]).readline)
+    except SyntaxError as e:
+        raise SourceDecodeError(f"{path}: {e}") from None
+    view = memoryview(data)
+    try:
+        text = codecs.decode(view, encoding, errors)
+        error = None
+    except UnicodeDecodeError as e:
+        error = (f"{path}: not valid {encoding} at byte {e.start}; "
+                 "declare the file's encoding with a '# -*- coding: <name> -*-' comment")
+    finally:
+        # An mmap cannot be closed while a view of it is alive.
+        view.release()
+    if error is not None:
+        raise SourceDecodeError(error)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+def read_source(path: str, max_bytes: Optional[int] = DEFAULT_MAX_FILE_BYTES, errors: str = "strict") -> str:
+    """
+    Reads a Python file as text; see ``map_file`` and ``decode_source``.
+    """
+    with map_file(path, max_bytes) as data:
+        return decode_source(data, path, errors)
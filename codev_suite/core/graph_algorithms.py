@@ -0,0 +1,73 @@
+from typing import Dict, Iterable, List, Set
+
+def strongly_connected_components(nodes: Iterable[int], edges: Dict[int, Set[int]]) -> List[List[int]]:
+    """
+    Tarjan's algorithm, iterative so large graphs cannot exhaust the stack.
+    Components are returned in reverse topological order (sinks first).
+    """
+    index: Dict[int, int] = {}
+    lowlink: Dict[int, int] = {}
+    on_stack: Set[int] = set()
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    for root in nodes:
+        if root in index:
+            continue
+        work = [(root, iter(edges.get(root, ())))]
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, children = work[-1]
+            advanced = False
+            for child in children:
+                if child not in index:
+                    index[child] = lowlink[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(edges.get(child, ()))))
+                    advanced = True
+                    break
+                if child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+            if advanced:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+    return components
+
+def longest_path_layers(nodes: List[int], edges: Dict[int, Set[int]]) -> Dict[int, int]:
+    """
+    Assigns each node a layer so that importers sit above what they import.
+    Cycles are collapsed first, so every member of a cycle shares a layer.
+    Runs in O(V + E).
+    """
+    components = strongly_connected_components(nodes, edges)
+    component_of = {node: i for i, component in enumerate(components) for node in component}
+    # Tarjan yields sinks first, so one pass in that order sees every
+    # successor's layer before the node that depends on it.
+    layer_of_component: List[int] = [0] * len(components)
+    for i, component in enumerate(components):
+        depth = 0
+        for node in component:
+            for target in edges.get(node, ()):
+                j = component_of.get(target)
+                if j is not None and j != i:
+                    depth = max(depth, layer_of_component[j] + 1)
+        layer_of_component[i] = depth
+    return {node: layer_of_component[component_of[node]] for node in nodes}
@@ -0,0 +1,283 @@
+import os
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from codev_suite.core.cache import DEFAULT_CACHE_DIR
+
+DEFAULT_INDEX_PATH = os.path.join(DEFAULT_CACHE_DIR, "history.sqlite")
+_FLUSH_EVERY = 2048
+# Stored as ``PRAGMA user_version``; bump when the tables change shape and
+# add the upgrade to ``_migrate``.
+INDEX_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY, root TEXT NOT NULL, started REAL NOT NULL,
+    revision TEXT, files INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS runs_root ON runs (root, id);
+CREATE TABLE IF NOT EXISTS files (
+    run INTEGER NOT NULL, path TEXT NOT NULL, maintainability REAL,
+    smells INTEGER, bugs INTEGER, error TEXT, removed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (path, run)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS functions (
+    run INTEGER NOT NULL, path TEXT NOT NULL, symbol TEXT NOT NULL, occurrence INTEGER NOT NULL,
+    type TEXT NOT NULL, lineno INTEGER NOT NULL, complexity INTEGER NOT NULL,
+    PRIMARY KEY (path, symbol, occurrence, run)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS functions_run ON functions (run);
+CREATE TABLE IF NOT EXISTS findings (
+    run INTEGER NOT NULL, path TEXT NOT NULL, type TEXT NOT NULL,
+    line INTEGER NOT NULL, details TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS findings_run ON findings (run, type);
+"""
+
+def qualified_blocks(blocks: Iterable[Dict[str, Any]]) -> Iterable[Tuple[str, int, Dict[str, Any]]]:
+    """
+    Yields ``(symbol, occurrence, block)`` for a file's complexity blocks.
+    Methods are qualified with their class (radon lists them right after it),
+    so two ``__init__`` methods in one file stay distinct; ``occurrence``
+    numbers definitions that still share a name (e.g. a function redefined
+    under ``if``), in file order from 0.
+    """
+    current_class = None
+    seen: Dict[str, int] = {}
+    for block in blocks:
+        if block["type"] == "Class":
+            current_class = symbol = block["name"]
+        elif block["type"] == "Method" and current_class is not None:
+            symbol = f"{current_class}.{block['name']}"
+        else:
+            current_class = None
+            symbol = block["name"]
+        occurrence = seen.get(symbol, 0)
+        seen[symbol] = occurrence + 1
+        yield symbol, occurrence, block
+
+class AnalysisIndex:
+    """
+    Persistent history of analysis runs in SQLite: per-file metrics, per-
+    function complexity and findings, by project root, run (with its git
+    revision) and symbol.
+
+    A run is recorded with ``begin_run``, ``add`` for each result and
+    ``end_run``; rows are written in bulk. Runs may cover only some files (an
+    incremental scan): queries compare each symbol's earliest and latest
+    observation and per-run totals use each file's latest values up to that
+    run, so unchanged files simply carry their last values.
+    """
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or DEFAULT_INDEX_PATH
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+        self._run: Optional[int] = None
+        self._files: List[Tuple] = []
+        self._functions: List[Tuple] = []
+        self._findings: List[Tuple] = []
+        self._seen: Set[str] = set()
+        self._count = 0
+
+    def _migrate(self):
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version > INDEX_VERSION:
+            raise ValueError(f"{self.path} was written by a newer version (index version {version})")
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(functions)")]
+        if columns and "occurrence" not in columns:
+            # Version 1 keyed functions by (path, symbol, run) only.
+            script = ("ALTER TABLE functions RENAME TO functions_v1; DROP INDEX functions_run;" + _SCHEMA
+                      + "INSERT INTO functions SELECT run, path, symbol, 0, type, lineno, complexity FROM functions_v1;"
+                      " DROP TABLE functions_v1;")
+        else:
+            script = _SCHEMA
+        self._conn.executescript(f"BEGIN; {script} PRAGMA user_version = {INDEX_VERSION}; COMMIT;")
+
+    @staticmethod
+    def project(root: str) -> str:
+        """The key runs are stored under: the project's absolute real path."""
+        return os.path.realpath(root)
+
+    def begin_run(self, root: str, revision: Optional[str] = None) -> int:
+        self._run = self._conn.execute(
+            "INSERT INTO runs (root, started, revision) VALUES (?, ?, ?)",
+            (self.project(root), time.time(), revision),
+        ).lastrowid
+        self._seen = set()
+        self._count = 0
+        return self._run
+
+    def add(self, result: Dict[str, Any]):
+        run, path = self._run, result["path"]
+        self._seen.add(path)
+        self._count += 1
+        if "error" in result:
+            self._files.append((run, path, None, None, None, result["error"], 0))
+        else:
+            self._files.append((run, path, result["maintainability"],
+                                len(result["smells"]), len(result["bugs"]), None, 0))
+            self._functions.extend(
+                (run, path, symbol, occurrence, block["type"], block["lineno"], block["complexity"])
+                for symbol, occurrence, block in qualified_blocks(result["complexity"])
+            )
+            self._findings.extend(
+                (run, path, finding["type"], finding["line"], finding["details"])
+                for finding in result["smells"] + result["bugs"]
+            )
+        if len(self._functions) + len(self._findings) >= _FLUSH_EVERY:
+            self._flush()
+
+    def end_run(self, removed: Iterable[str] = (), full: bool = False) -> int:
+        """
+        Finishes the current run; ``removed`` lists files deleted since the
+        previous run so their symbols drop out of later queries. A ``full``
+        run analyzed the whole project, so every known file it did not see
+        counts as removed.
+        """
+        run = self._run
+        removed = set(removed)
+        if full:
+            removed.update(path for path in self._live_paths(run) if path not in self._seen)
+        self._files.extend((run, path, None, None, None, None, 1) for path in sorted(removed))
+        self._flush()
+        self._conn.execute("UPDATE runs SET files = ? WHERE id = ?", (self._count, run))
+        self._conn.commit()
+        self._run = None
+        return run
+
+    def record(self, root: str, results: Iterable[Dict[str, Any]], revision: Optional[str] = None,
+               removed: Iterable[str] = (), full: bool = False) -> int:
+        self.begin_run(root, revision)
+        for result in results:
+            self.add(result)
+        return self.end_run(removed, full)
+
+    def _live_paths(self, run: int) -> List[str]:
+        """Files of ``run``'s project that were not removed as of earlier runs."""
+        rows = self._conn.execute(
+            """
+            WITH project AS (
+                SELECT id FROM runs WHERE root = (SELECT root FROM runs WHERE id = :run) AND id < :run
+            )
+            SELECT f.path FROM files f
+            WHERE f.run IN project AND f.removed = 0 AND f.run = (
+                SELECT MAX(run) FROM files WHERE path = f.path AND run IN project
+            )
+            """,
+            {"run": run},
+        ).fetchall()
+        return [path for path, in rows]
+
+    def _flush(self):
+        self._conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)", self._files)
+        self._conn.executemany("INSERT OR REPLACE INTO functions VALUES (?, ?, ?, ?, ?, ?, ?)", self._functions)
+        self._conn.executemany("INSERT INTO findings VALUES (?, ?, ?, ?, ?)", self._findings)
+        self._files, self._functions, self._findings = [], [], []
+
+    def projects(self) -> List[Tuple[str, int]]:
+        """Returns ``(root, runs)`` for every project with recorded runs."""
+        return self._conn.execute(
+            "SELECT root, COUNT(*) FROM runs GROUP BY root ORDER BY MAX(started) DESC"
+        ).fetchall()
+
+    def runs(self, root: str, last: int = 10) -> List[Dict[str, Any]]:
+        """
+        The ``last`` runs of a project, oldest first, with the number of files
+        analyzed in each (``files``) and the state of the project after it:
+        the files known by then (``tracked``), their average maintainability
+        and finding counts. Files a run did not analyze count with their
+        latest earlier values, so incremental runs compare with full ones.
+        """
+        rows = self._conn.execute(
+            """
+            WITH project AS (
+                SELECT id FROM runs WHERE root = :root
+            ),
+            recent AS (
+                SELECT * FROM runs WHERE root = :root ORDER BY id DESC LIMIT :last
+            ),
+            paths AS (
+                SELECT DISTINCT path FROM files WHERE run IN project
+            )
+            SELECT r.id, r.started, r.revision, r.files, COUNT(f.path),
+                   AVG(f.maintainability), SUM(f.smells), SUM(f.bugs)
+            FROM recent r CROSS JOIN paths p
+            LEFT JOIN files f ON f.path = p.path AND f.removed = 0 AND f.run = (
+                SELECT MAX(run) FROM files WHERE path = p.path AND run <= r.id AND run IN project
+            )
+            GROUP BY r.id ORDER BY r.id
+            """,
+            {"root": self.project(root), "last": last},
+        ).fetchall()
+        keys = ("run", "started", "revision", "files", "tracked", "maintainability", "smells", "bugs")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def complexity_changes(self, root: str, last: int = 10, top: int = 10,
+                           rising: bool = True) -> List[Dict[str, Any]]:
+        """
+        Functions and methods whose complexity rose (or, with ``rising=False``, fell) most
+        between their first and latest observation in the last ``last`` runs.
+        Symbols of files deleted or changed since are not reported as current.
+        """
+        rows = self._conn.execute(
+            f"""
+            WITH recent AS (
+                SELECT id FROM runs WHERE root = :root ORDER BY id DESC LIMIT :last
+            ),
+            seen AS (
+                SELECT path, symbol, occurrence, MIN(run) AS first, MAX(run) AS latest FROM functions
+                WHERE run IN recent GROUP BY path, symbol, occurrence HAVING first < latest
+            ),
+            current AS (
+                SELECT path, MAX(run) AS run FROM files WHERE run IN recent GROUP BY path
+            )
+            SELECT s.path, s.symbol, b.type, b.lineno, a.complexity, b.complexity,
+                   b.complexity - a.complexity AS delta, s.first, s.latest
+            FROM seen s
+            JOIN current c ON c.path = s.path AND c.run = s.latest
+            JOIN functions a ON a.path = s.path AND a.symbol = s.symbol
+                AND a.occurrence = s.occurrence AND a.run = s.first
+            JOIN functions b ON b.path = s.path AND b.symbol = s.symbol
+                AND b.occurrence = s.occurrence AND b.run = s.latest
+            WHERE b.type != 'Class' AND delta {'>' if rising else '<'} 0
+            ORDER BY delta {'DESC' if rising else 'ASC'}, s.path, s.symbol, s.occurrence
+            LIMIT :top
+            """,
+            {"root": self.project(root), "last": last, "top": top},
+        ).fetchall()
+        keys = ("path", "symbol", "type", "lineno", "before", "after", "delta", "first_run", "last_run")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def symbol_history(self, root: str, path: str, symbol: str, occurrence: int = 0) -> List[Dict[str, Any]]:
+        """
+        Complexity of one function in every run that analyzed it, oldest
+        first. ``occurrence`` picks among same-named definitions in the file.
+        """
+        rows = self._conn.execute(
+            "SELECT r.id, r.started, r.revision, f.complexity FROM functions f JOIN runs r ON r.id = f.run"
+            " WHERE r.root = ? AND f.path = ? AND f.symbol = ? AND f.occurrence = ? ORDER BY r.id",
+            (self.project(root), path, symbol, occurrence),
+        ).fetchall()
+        return [dict(zip(("run", "started", "revision", "complexity"), row)) for row in rows]
+
+    def finding_counts(self, root: str, last: int = 10) -> List[Dict[str, Any]]:
+        """Findings per run and type over the last ``last`` runs."""
+        rows = self._conn.execute(
+            "SELECT f.run, f.type, COUNT(*) FROM findings f"
+            " WHERE f.run IN (SELECT id FROM runs WHERE root = ? ORDER BY id DESC LIMIT ?)"
+            " GROUP BY f.run, f.type ORDER BY f.run, f.type",
+            (self.project(root), last),
+        ).fetchall()
+        return [dict(zip(("run", "type", "count"), row)) for row in rows]
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,123 @@
+import json
+import os
+import subprocess
+from typing import Any, Dict, Iterable, List, Optional, Set
+from codev_suite.analyzers.findings import compact
+from codev_suite.core.discovery import iter_python_files
+from codev_suite.core.modules import module_name
+from codev_suite.core.parser import CodeParser
+from codev_suite.reporting.writers import JsonReportWriter
+
+def git_changed_files(root: str, base_rev: str) -> List[str]:
+    """
+    Returns the Python files under ``root`` that differ from ``base_rev``,
+    including uncommitted and untracked files. Paths are relative to ``root``;
+    deleted files are included so callers can drop them from a baseline.
+    """
+    def git(*args):
+        return subprocess.run(
+            ["git", "-C", root, *args], check=True, capture_output=True, text=True
+        ).stdout.splitlines()
+
+    changed = git("diff", "--name-only", "--relative", base_rev, "--")
+    changed += git("ls-files", "--others", "--exclude-standard")
+    return sorted({path for path in changed if path.endswith(".py")})
+
+def git_revision(root: str) -> Optional[str]:
+    """
+    Returns the commit checked out in ``root``, or None outside a git
+    repository (or without git installed).
+    """
+    try:
+        return subprocess.run(
+            ["git", "-C", root, "rev-parse", "HEAD"], check=True, capture_output=True, text=True
+        ).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def reverse_dependents(changed: Iterable[str], imports: Dict[str, List[Optional[str]]],
+                       transitive: bool = False) -> Set[str]:
+    """
+    Returns the files that import any of the ``changed`` files.
+
+    ``imports`` maps each file to the module names it imports, as found in
+    ``CodeParser.get_structure()["imports"]``. Matching is conservative: an
+    import of a package also counts as depending on its submodules.
+    """
+    def depends_on(imported, target):
+        return imported == target or target.startswith(imported + ".") or imported.startswith(target + ".")
+
+    frontier = {module_name(path) for path in changed}
+    dependents: Set[str] = set()
+    while frontier:
+        found = {
+            path for path, modules in imports.items()
+            if path not in dependents
+            and any(m and depends_on(m, target) for m in modules for target in frontier)
+        }
+        found -= set(changed)
+        dependents |= found
+        frontier = {module_name(path) for path in found} if transitive else set()
+    return dependents
+
+def collect_imports(root: str) -> Dict[str, List[Optional[str]]]:
+    """
+    Parses every file under ``root`` for its imports. Used to find dependents
+    when no baseline report is available.
+    """
+    imports = {}
+    for path in iter_python_files(root):
+        try:
+            imports[os.path.relpath(path, root)] = CodeParser(file_path=path).get_structure()["imports"]
+        except (OSError, SyntaxError, ValueError):
+            continue
+    return imports
+
+def select_changed(root: str, changed: Iterable[str], baseline: Optional[Dict[str, Dict[str, Any]]] = None,
+                   dependents: bool = False):
+    """
+    Splits changed paths (relative to ``root``) into files to analyze and files
+    that were deleted. With ``dependents``, files importing a changed module are
+    analyzed too; their imports come from the baseline when one is given.
+    """
+    changed = {os.path.normpath(path) for path in changed}
+    targets = {path for path in changed if os.path.isfile(os.path.join(root, path))}
+    removed = changed - targets
+    if dependents:
+        if baseline:
+            imports = {path: r.get("structure", {}).get("imports", []) for path, r in baseline.items()}
+        else:
+            imports = collect_imports(root)
+        targets |= {
+            path for path in reverse_dependents(changed, imports)
+            if os.path.isfile(os.path.join(root, path))
+        }
+    return sorted(targets), sorted(removed)
+
+def load_report(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Reads a report written by ``write_report`` into a mapping of path to result.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    return {result["path"]: compact(result) for result in report.get("files", [])}
+
+def write_report(path: str, results: Iterable[Dict[str, Any]]):
+    """
+    Writes per-file results as a JSON report, one entry per file.
+    """
+    with open(path, 'w', encoding='utf-8') as f, JsonReportWriter(f) as writer:
+        for result in results:
+            writer.write(result)
+
+def merge_results(baseline: Dict[str, Dict[str, Any]], updates: Iterable[Dict[str, Any]],
+                  removed: Iterable[str] = ()) -> Dict[str, Dict[str, Any]]:
+    """
+    Overlays freshly analyzed files on a baseline report and drops deleted files.
+    """
+    merged = dict(baseline)
+    for path in removed:
+        merged.pop(path, None)
+    for result in updates:
+        merged[result["path"]] = result
+    return merged
@@ -0,0 +1,91 @@
+import faulthandler
+import os
+import signal
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+# Seconds one file may take; override with ``file_timeout`` in
+# ``[tool.codev]`` (0 turns the limit off).
+DEFAULT_FILE_TIMEOUT = 60
+# A worker still busy this long after its time limit is stuck in C code
+# (e.g. ``ast.parse``), which the soft limit cannot interrupt; it exits.
+HARD_LIMIT_GRACE = 10
+
+class AnalysisTimeout(TimeoutError):
+    def __init__(self, seconds: float):
+        super().__init__(f"analysis took longer than {seconds:g}s "
+                         "(raise file_timeout in [tool.codev] to allow more)")
+        self.seconds = seconds
+
+def _can_alarm() -> bool:
+    return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+@contextmanager
+def time_limit(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Raises ``AnalysisTimeout`` in the block once it has run for ``seconds``.
+
+    Uses ``SIGALRM``, so it only applies in the main thread on POSIX; elsewhere
+    (or with no ``seconds``) the block runs unlimited. The signal interrupts
+    Python code only: a single long C call finishes first.
+    """
+    if not seconds or not _can_alarm():
+        yield
+        return
+
+    def expired(signum, frame):
+        raise AnalysisTimeout(seconds)
+
+    previous = signal.signal(signal.SIGALRM, expired)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+def worker_exited(timeout: Optional[float]) -> str:
+    """The error reported for a file whose worker process died analyzing it."""
+    limit = f"over the {timeout:g}s time limit, " if timeout else ""
+    return f"WorkerExited: the worker analyzing this file exited ({limit}out of memory or crashed)"
+
+_devnull = None
+
+@contextmanager
+def watchdog(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Terminates the whole process if the block runs for ``seconds``, even
+    inside C code. Only for disposable worker processes, whose pool notices
+    the exit.
+    """
+    global _devnull
+    if not seconds:
+        yield
+        return
+    if _devnull is None:
+        _devnull = open(os.devnull, "w")
+    faulthandler.dump_traceback_later(seconds, exit=True, file=_devnull)
+    try:
+        yield
+    finally:
+        faulthandler.cancel_dump_traceback_later()
+
+def limit_memory(megabytes: Optional[int]) -> bool:
+    """
+    Caps the address space of the current process, so an allocation past it
+    raises ``MemoryError`` instead of exhausting the machine. Returns False
+    where ``RLIMIT_AS`` is not available.
+    """
+    if not megabytes:
+        return False
+    try:
+        import resource
+    except ImportError:
+        return False
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    limit = int(megabytes) * 1024 * 1024
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    return True
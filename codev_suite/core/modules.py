@@ -0,0 +1,143 @@
+import ast
+import os
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Node kinds in the dependency graph.
+MODULE = "module"
+EXTERNAL = "external"
+STDLIB = "stdlib"
+
+class ImportRef(NamedTuple):
+    """
+    One import statement as written: ``module`` is None for ``from . import x``.
+    """
+    module: Optional[str]
+    names: Tuple[str, ...]
+    level: int
+
+def module_name(rel_path: str) -> str:
+    """
+    Maps a path relative to the project root to its dotted module name.
+    """
+    parts = os.path.normpath(rel_path)[:-len(".py")].split(os.sep)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+def root_package(root: str) -> str:
+    """
+    Returns the dotted package name of ``root`` itself when it is a package
+    (or nested in one), e.g. ``codev_suite`` for the ``codev_suite/`` directory,
+    and an empty string for a plain project directory.
+    """
+    parts = []
+    current = os.path.abspath(root)
+    while os.path.isfile(os.path.join(current, "__init__.py")):
+        parts.append(os.path.basename(current))
+        current = os.path.dirname(current)
+    return ".".join(reversed(parts))
+
+def qualify(package: str, module: str) -> str:
+    if not package:
+        return module
+    return f"{package}.{module}" if module else package
+
+def is_package(rel_path: str) -> bool:
+    return os.path.basename(rel_path) == "__init__.py"
+
+def extract_imports(tree: ast.AST) -> List[ImportRef]:
+    """
+    Returns every import in the tree, including those nested in functions.
+    """
+    refs = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                refs.append(ImportRef(alias.name, (), 0))
+        elif isinstance(node, ast.ImportFrom):
+            refs.append(ImportRef(node.module, tuple(a.name for a in node.names), node.level))
+    return refs
+
+def absolute_module(importer: str, importer_is_package: bool, ref: ImportRef) -> str:
+    """
+    Returns the absolute dotted module an import refers to, resolving relative
+    imports against the importing module. May be empty for ``from . import x``
+    at the project root.
+    """
+    if not ref.level:
+        return ref.module or ""
+    package = importer.split(".") if importer else []
+    if not importer_is_package:
+        package = package[:-1]
+    if ref.level > 1:
+        package = package[:len(package) - (ref.level - 1)]
+    return ".".join(package + ([ref.module] if ref.module else []))
+
+class ModuleIndex:
+    """
+    The set of modules that exist in a project, used to tell in-repo imports
+    from third-party ones. Modules under a top-level ``src/`` directory are
+    also importable without the ``src.`` prefix.
+    """
+    def __init__(self, modules: Iterable[str] = ()):
+        # Importable name -> canonical module name (the path-derived one).
+        self.modules: Dict[str, str] = {}
+        for module in modules:
+            self.add(module)
+
+    def add(self, module: str):
+        self.modules[module] = module
+        if module.startswith("src."):
+            self.modules.setdefault(module[len("src."):], module)
+
+    def discard(self, module: str):
+        self.modules.pop(module, None)
+        if module.startswith("src.") and self.modules.get(module[len("src."):]) == module:
+            del self.modules[module[len("src."):]]
+
+    def __contains__(self, module: str) -> bool:
+        return module in self.modules
+
+    def _longest_known_prefix(self, dotted: str) -> Optional[str]:
+        parts = dotted.split(".")
+        for end in range(len(parts), 0, -1):
+            candidate = ".".join(parts[:end])
+            if candidate in self.modules:
+                return candidate
+        return None
+
+    @staticmethod
+    def lookups(importer: str, importer_is_package: bool, ref: ImportRef) -> List[str]:
+        """
+        Returns the importable names ``resolve`` checks for ``ref``: adding or
+        removing a module under one of them can change what it resolves to.
+        """
+        base = absolute_module(importer, importer_is_package, ref)
+        names = [f"{base}.{name}" if base else name for name in ref.names if name != "*"]
+        parts = base.split(".") if base else []
+        return names + [".".join(parts[:end]) for end in range(1, len(parts) + 1)]
+
+    def resolve(self, importer: str, importer_is_package: bool, ref: ImportRef) -> Tuple[List[str], Optional[str]]:
+        """
+        Resolves one import made by module ``importer``.
+
+        Returns the in-repo modules it refers to and, if it points outside the
+        repository, the top-level name of the external package.
+        """
+        base = absolute_module(importer, importer_is_package, ref)
+
+        targets = []
+        for name in ref.names:
+            submodule = f"{base}.{name}" if base else name
+            if name != "*" and submodule in self.modules:
+                targets.append(self.modules[submodule])
+        if not targets and base:
+            known = self._longest_known_prefix(base)
+            if known:
+                targets.append(self.modules[known])
+        if targets:
+            return targets, None
+        if ref.level or not base:
+            # Unresolvable relative import; it cannot be a third-party package.
+            return [], None
+        return [], base.split(".")[0]
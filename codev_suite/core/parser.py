@@ -1,5 +1,9 @@
 import ast
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+from codev_suite.core.discovery import read_source
+
+FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+SCOPE_NODES = (ast.ClassDef,) + FUNCTION_NODES
 
 class CodeParser:
     """
@@ -9,28 +13,36 @@ class CodeParser:
         self.source_code = source_code
         self.file_path = file_path
         self.tree: Optional[ast.AST] = None
+        self._parents: Optional[Dict[ast.AST, ast.AST]] = None
+        self._scopes: Optional[Dict[ast.AST, Optional[ast.AST]]] = None
 
     def parse(self) -> ast.AST:
         """
         Parses the source code or file content into an AST.
         """
         if self.file_path:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                self.source_code = f.read()
-        
+            self.source_code = read_source(self.file_path)
+
         if self.source_code is None:
             raise ValueError("No source code or file path provided.")
 
         self.tree = ast.parse(self.source_code)
+        self._parents = None
+        self._scopes = None
         return self.tree
 
     def get_structure(self) -> Dict[str, Any]:
         """
         Returns a simplified structure of the code (classes, functions).
+
+        Functions whose nearest enclosing scope is a class are reported as
+        methods of that class; every other function (module level or nested
+        in another function) is listed under "functions".
         """
         if not self.tree:
             self.parse()
-        
+        self._build_index()
+
         structure = {
             "classes": [],
             "functions": [],
@@ -41,15 +53,17 @@ class CodeParser:
             if isinstance(node, ast.ClassDef):
                 structure["classes"].append({
                     "name": node.name,
+                    "qualname": self.qualname(node),
                     "line": node.lineno,
-                    "methods": [n.name for n in node.body if isinstance(n, ast.FunctionDef)]
+                    "methods": [n.name for n in node.body if isinstance(n, FUNCTION_NODES)]
                 })
-            elif isinstance(node, ast.FunctionDef):
-                # Check if it's a top-level function
-                if not any(isinstance(parent, ast.ClassDef) for parent in self._get_parents(node)):
+            elif isinstance(node, FUNCTION_NODES):
+                if not isinstance(self._scopes[node], ast.ClassDef):
                     structure["functions"].append({
                         "name": node.name,
-                        "line": node.lineno
+                        "qualname": self.qualname(node),
+                        "line": node.lineno,
+                        "async": isinstance(node, ast.AsyncFunctionDef)
                     })
             elif isinstance(node, (ast.Import, ast.ImportFrom)):
                 if isinstance(node, ast.Import):
@@ -60,15 +74,50 @@ class CodeParser:
 
         return structure
 
-    def _get_parents(self, target_node: ast.AST):
+    def qualname(self, node: ast.AST) -> str:
         """
-        Helper to find parents of a node. 
-        Note: This is a simplified approach; ast.walk doesn't provide parents naturally.
+        Returns the dotted name of a class or function, e.g. ``Outer.Inner.method``.
         """
-        parents = []
-        for node in ast.walk(self.tree):
+        self._build_index()
+        names = [node.name]
+        scope = self._scopes.get(node)
+        while scope is not None:
+            names.append(scope.name)
+            scope = self._scopes.get(scope)
+        return ".".join(reversed(names))
+
+    def _build_index(self):
+        """
+        Builds the parent and enclosing-scope maps in a single traversal.
+        The walk is iterative so deeply nested code cannot exhaust the stack.
+        """
+        if self._parents is not None:
+            return
+        if not self.tree:
+            self.parse()
+
+        parents: Dict[ast.AST, ast.AST] = {}
+        scopes: Dict[ast.AST, Optional[ast.AST]] = {self.tree: None}
+        stack = [(self.tree, None)]
+        while stack:
+            node, scope = stack.pop()
+            child_scope = node if isinstance(node, SCOPE_NODES) else scope
             for child in ast.iter_child_nodes(node):
-                if child == target_node:
-                    parents.append(node)
-                    parents.extend(self._get_parents(node))
+                parents[child] = node
+                scopes[child] = child_scope
+                stack.append((child, child_scope))
+
+        self._parents = parents
+        self._scopes = scopes
+
+    def _get_parents(self, target_node: ast.AST) -> List[ast.AST]:
+        """
+        Returns the ancestors of a node, nearest first.
+        """
+        self._build_index()
+        parents = []
+        node = self._parents.get(target_node)
+        while node is not None:
+            parents.append(node)
+            node = self._parents.get(node)
         return parents
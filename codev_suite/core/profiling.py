@@ -0,0 +1,133 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Span categories used across the code base.
+STAGE = "stage"
+FILE = "file"
+RULE = "rule"
+AI = "ai"
+
+_active: Optional["Profiler"] = None
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+NULL_SPAN = _NullSpan()
+
+class _Span:
+    __slots__ = ("profiler", "name", "category", "args", "start", "allocated")
+
+    def __init__(self, profiler: "Profiler", name: str, category: str, args: Dict[str, Any]):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        if self.profiler.memory:
+            self.allocated = tracemalloc.get_traced_memory()[0]
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        args = self.args
+        if self.profiler.memory:
+            args = dict(args, alloc_bytes=tracemalloc.get_traced_memory()[0] - self.allocated)
+        self.profiler.add(self.name, self.category, self.start, end - self.start, args)
+        return False
+
+def span(name: str, category: str = STAGE, **args):
+    """
+    Times a block when a profiler is active, e.g.
+    ``with span("parse", path=path): ...``. Without an active profiler this
+    returns a shared no-op context manager, so instrumentation is nearly free.
+    """
+    profiler = _active
+    if profiler is None:
+        return NULL_SPAN
+    return _Span(profiler, name, category, args)
+
+def active() -> Optional["Profiler"]:
+    return _active
+
+class Profiler:
+    """
+    Collects timed spans (stage, file, rule and AI request) as Chrome trace
+    events. With ``memory`` each span also records the net bytes allocated
+    while it ran, via ``tracemalloc`` (which slows the run down noticeably).
+
+    Events from worker processes are merged with ``extend``; timestamps come
+    from the system-wide monotonic clock, so they line up across processes.
+    """
+    def __init__(self, memory: bool = False):
+        self.memory = memory
+        self.events: List[Dict[str, Any]] = []
+        self._previous: Optional[Profiler] = None
+        self._started_tracemalloc = False
+
+    def add(self, name: str, category: str, start_ns: int, duration_ns: int,
+            args: Optional[Dict[str, Any]] = None):
+        self.events.append({
+            "name": name, "cat": category, "ph": "X",
+            "ts": start_ns / 1000, "dur": duration_ns / 1000,
+            "pid": os.getpid(), "tid": threading.get_ident(),
+            "args": args or {},
+        })
+
+    def extend(self, events: Iterable[Dict[str, Any]]):
+        self.events.extend(events)
+
+    def __enter__(self):
+        global _active
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._previous, _active = _active, self
+        return self
+
+    def __exit__(self, *exc):
+        global _active
+        _active = self._previous
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        return False
+
+    def totals(self, category: str) -> List[Tuple[str, float, int]]:
+        """
+        Returns ``(name, total_ms, count)`` per span name in ``category``,
+        slowest first.
+        """
+        total: Dict[str, float] = defaultdict(float)
+        count: Dict[str, int] = defaultdict(int)
+        for event in self.events:
+            if event["cat"] == category:
+                total[event["name"]] += event["dur"] / 1000
+                count[event["name"]] += 1
+        return sorted(((name, total[name], count[name]) for name in total), key=lambda t: -t[1])
+
+    def slowest(self, category: str = FILE, top: int = 10) -> List[Dict[str, Any]]:
+        events = [e for e in self.events if e["cat"] == category]
+        events.sort(key=lambda e: -e["dur"])
+        return events[:top]
+
+    def write_chrome_trace(self, output_path: str) -> str:
+        """
+        Writes the spans in the Chrome trace event format, which
+        ``chrome://tracing`` and https://ui.perfetto.dev open directly.
+        """
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+        return output_path
@@ -0,0 +1,276 @@
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from codev_suite.core.cache import ResultCache
+from codev_suite.core.discovery import DEFAULT_MAX_FILE_BYTES, SourceError, iter_python_files, map_file, read_source
+from codev_suite.core.limits import (
+    DEFAULT_FILE_TIMEOUT, HARD_LIMIT_GRACE, limit_memory, time_limit, watchdog, worker_exited,
+)
+from codev_suite.core.profiling import FILE, Profiler, active, span
+from codev_suite.analyzers.aggregate import RepoMetrics
+from codev_suite.analyzers.findings import compact
+from codev_suite.analyzers.pipeline import AnalysisPipeline, IncompleteAnalysis
+from codev_suite.analyzers.rules import load_config
+
+DEFAULT_CHUNK_SIZE = 32
+
+# One pipeline per rule configuration, reused for every file a worker sees.
+_pipelines: Dict[str, AnalysisPipeline] = {}
+# True in pool workers, which may be killed when a file overruns its limit.
+_isolated = False
+
+def _init_worker(memory_mb: Optional[int]):
+    global _isolated
+    _isolated = True
+    limit_memory(memory_mb)
+
+def analyze_file(file_path: str, rel_path: Optional[str] = None,
+                 config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Runs the analysis pipeline over one file. Failures are returned as an
+    ``error`` entry instead of being raised, so one bad file cannot abort a scan.
+
+    Analysis stops after ``file_timeout`` seconds; what was finished by then
+    is returned along with the error. In a pool worker a file stuck in C code
+    past the limit ends the worker, which the scanner reports.
+    """
+    config = config or {}
+    rel_path = rel_path or file_path
+    timeout = config.get("file_timeout", DEFAULT_FILE_TIMEOUT)
+    try:
+        key = json.dumps(config, sort_keys=True)
+        pipeline = _pipelines.get(key)
+        if pipeline is None:
+            pipeline = _pipelines[key] = AnalysisPipeline(config)
+        with span(rel_path, FILE), time_limit(timeout), \
+                watchdog(timeout + HARD_LIMIT_GRACE if _isolated and timeout else None):
+            content = read_source(file_path, config.get("max_file_bytes", DEFAULT_MAX_FILE_BYTES))
+            return pipeline.run(content, rel_path)
+    except IncompleteAnalysis as e:
+        return {**e.partial, "path": rel_path, "error": f"{type(e).__name__}: {e}"}
+    except Exception as e:
+        return {"path": rel_path, "error": f"{type(e).__name__}: {e}"}
+
+def _analyze_chunk(root: str, paths: List[str], config: Optional[Dict[str, Any]] = None,
+                   memory: Optional[bool] = None):
+    """
+    Analyzes a chunk of files in a worker. When ``memory`` is not None the
+    parent is profiling: the worker profiles too and returns its events.
+    """
+    if memory is None:
+        return [analyze_file(path, os.path.relpath(path, root), config) for path in paths], []
+    with Profiler(memory=memory) as profiler:
+        results = [analyze_file(path, os.path.relpath(path, root), config) for path in paths]
+    return results, profiler.events
+
+def _chunked(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+class RepositoryScanner:
+    """
+    Analyzes every Python file under a directory using a pool of worker processes.
+
+    With a ``ResultCache`` the parent process hashes each file and only hands
+    files whose content (or analyzer configuration) changed to the workers.
+    Rules are configured from ``[tool.codev]`` in the project's
+    ``pyproject.toml`` unless ``config`` is given.
+
+    Each file gets ``file_timeout`` seconds and, with ``file_memory_mb``, each
+    worker a capped address space (a pool is then used even for one job). A
+    file that kills its worker is reported instead of failing the scan.
+    """
+    def __init__(self, root: str, jobs: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 cache: Optional[ResultCache] = None, config: Optional[Dict[str, Any]] = None):
+        self.root = root
+        self.jobs = jobs or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.cache = cache
+        self.config = load_config(root) if config is None else config
+        self.memory_limit = self.config.get("file_memory_mb")
+        self._pipeline = AnalysisPipeline(self.config)
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def files(self) -> Iterator[str]:
+        return iter_python_files(self.root)
+
+    def scan(self, paths: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yields one result per file as soon as it is available: cache hits
+        immediately, everything else when its chunk finishes. Results arrive in
+        completion order, not discovery order.
+        """
+        if self.jobs > 1 or self.memory_limit:
+            self._pool = self._new_pool()
+        pending: Dict[Future, List[Tuple[str, Optional[str]]]] = {}
+        chunk: List[Tuple[str, Optional[str]]] = []
+        try:
+            for path in (paths if paths is not None else self.files()):
+                key = self._cache_key(path)
+                if key is not None:
+                    cached = self.cache.get(key)
+                    if cached is not None:
+                        cached["path"] = os.path.relpath(path, self.root)
+                        yield compact(cached)
+                        continue
+                chunk.append((path, key))
+                if len(chunk) >= self.chunk_size:
+                    yield from self._submit(pending, chunk)
+                    chunk = []
+            if chunk:
+                yield from self._submit(pending, chunk)
+            while pending:
+                yield from self._collect(pending)
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+                self._pool = None
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker, initargs=(self.memory_limit,))
+
+    def _cache_key(self, path: str) -> Optional[str]:
+        if self.cache is None:
+            return None
+        try:
+            with map_file(path, self.config.get("max_file_bytes", DEFAULT_MAX_FILE_BYTES)) as data:
+                return self._pipeline.cache_key(data)
+        except (OSError, SourceError):
+            # Not cacheable; analyze_file reports why.
+            return None
+
+    def _submit_chunk(self, paths: List[str]) -> Future:
+        profiler = active()
+        memory = profiler.memory if profiler is not None else None
+        return self._pool.submit(_analyze_chunk, self.root, paths, self.config, memory)
+
+    def _submit(self, pending, chunk):
+        paths = [path for path, _ in chunk]
+        if self._pool is None:
+            # In-process analysis reports straight to the active profiler.
+            results, _ = _analyze_chunk(self.root, paths, self.config)
+            yield from self._store(chunk, results)
+            return
+        try:
+            pending[self._submit_chunk(paths)] = chunk
+        except BrokenProcessPool:
+            yield from self._recover(pending, chunk)
+            return
+        # Keep a bounded number of chunks in flight so huge trees do not
+        # queue every path (and every result) in memory at once.
+        if len(pending) >= self.jobs * 2:
+            yield from self._collect(pending)
+
+    def _collect(self, pending):
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                results, events = future.result()
+            except BrokenProcessPool:
+                yield from self._recover(pending)
+                return
+            self._add_events(events)
+            yield from self._store(pending.pop(future), results)
+
+    def _recover(self, pending, chunk=()):
+        """
+        Handles a worker that died: every chunk in flight is lost with the
+        pool and any of their files may be the culprit. They are rerun in a
+        fresh pool, one file per task but all at once; files lost again are
+        retried, and when a round finishes none of them the first is run
+        alone. Only files that end a worker on their own are reported.
+        """
+        suspects = [item for items in pending.values() for item in items] + list(chunk)
+        pending.clear()
+        alone, broken = False, True
+        while suspects:
+            if broken:
+                self._restart_pool()
+            batch = suspects[:1] if alone else suspects
+            alone = len(batch) == 1
+            futures: Dict[Future, int] = {}
+            for i, (path, _) in enumerate(batch):
+                try:
+                    futures[self._submit_chunk([path])] = i
+                except BrokenProcessPool:
+                    break
+            lost = set(range(len(batch))) - set(futures.values())
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results, events = future.result()
+                except BrokenProcessPool:
+                    lost.add(i)
+                    continue
+                self._add_events(events)
+                yield from self._store([batch[i]], results)
+            broken = bool(lost)
+            if alone and lost:
+                path, _ = batch[0]
+                yield {"path": os.path.relpath(path, self.root),
+                       "error": worker_exited(self.config.get("file_timeout", DEFAULT_FILE_TIMEOUT))}
+                lost = set()
+            alone = len(lost) == len(batch)
+            suspects = [batch[i] for i in sorted(lost)] + suspects[len(batch):]
+
+    def _restart_pool(self):
+        self._pool.shutdown(cancel_futures=True)
+        self._pool = self._new_pool()
+
+    def _add_events(self, events):
+        profiler = active()
+        if profiler is not None:
+            profiler.extend(events)
+
+    def _store(self, chunk, results):
+        for (_, key), result in zip(chunk, results):
+            if key is not None and "error" not in result:
+                self.cache.set(key, {k: v for k, v in result.items() if k != "path"})
+            yield result
+
+class ScanSummary:
+    """
+    Incrementally aggregates per-file results so a scan never has to keep
+    every result in memory: only the compact columns of ``metrics``.
+    """
+    def __init__(self, top: int = 10):
+        self.top = top
+        self.metrics = RepoMetrics()
+
+    def add(self, result: Dict[str, Any]):
+        self.metrics.add(result)
+
+    @property
+    def files(self) -> int:
+        return self.metrics.files
+
+    @property
+    def errors(self) -> List[Dict[str, str]]:
+        return self.metrics.errors
+
+    @property
+    def analyzed(self) -> int:
+        return self.metrics.analyzed
+
+    @property
+    def smells(self) -> int:
+        return self.metrics.total("smells")
+
+    @property
+    def bugs(self) -> int:
+        return self.metrics.total("bugs")
+
+    @property
+    def average_maintainability(self) -> float:
+        return self.metrics.mean("maintainability")
+
+    def top_hotspots(self) -> List[Dict[str, Any]]:
+        return self.metrics.top_hotspots(self.top)
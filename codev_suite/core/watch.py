@@ -0,0 +1,203 @@
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from codev_suite.analyzers.coupling import import_cycles
+from codev_suite.core.cache import ResultCache, content_hash
+from codev_suite.core.discovery import IgnoreRules, iter_python_files, map_file
+from codev_suite.core.scanner import DEFAULT_CHUNK_SIZE, RepositoryScanner
+
+DEFAULT_INTERVAL = 0.5
+# Editors often write a file in several steps; wait this long after the last
+# event before reporting a batch of changes.
+DEBOUNCE = 0.05
+
+class PollingWatcher:
+    """
+    Detects changed Python files by comparing ``(mtime, size)`` snapshots.
+    Used when ``watchdog`` is not installed.
+    """
+    def __init__(self, root: str, interval: float = DEFAULT_INTERVAL):
+        self.root = root
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for path in iter_python_files(self.root):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            snapshot[os.path.relpath(path, self.root)] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def wait(self, timeout: Optional[float] = None) -> Set[str]:
+        """
+        Blocks until files change (or ``timeout`` passes) and returns the
+        changed paths relative to the root, deleted files included.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self._scan()
+            changed = {
+                path for path in current.keys() | self._snapshot.keys()
+                if current.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = current
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+            time.sleep(self.interval)
+
+    def close(self):
+        pass
+
+class NotifyWatcher:
+    """
+    Detects changed Python files from filesystem notifications via ``watchdog``.
+    """
+    def __init__(self, root: str):
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        self.root = os.path.abspath(root)
+        self._ignore = IgnoreRules(self.root)
+        self._changed: Set[str] = set()
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        watcher = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory:
+                    return
+                for path in (event.src_path, getattr(event, "dest_path", "")):
+                    watcher._record(path)
+
+        self._observer = Observer()
+        self._observer.schedule(Handler(), self.root, recursive=True)
+        self._observer.start()
+
+    def _record(self, path):
+        if isinstance(path, bytes):
+            path = os.fsdecode(path)
+        if not path.endswith(".py"):
+            return
+        rel_path = os.path.relpath(path, self.root)
+        if rel_path.startswith(os.pardir) or self._ignore.ignored_path(rel_path):
+            return
+        with self._lock:
+            self._changed.add(rel_path)
+        self._event.set()
+
+    def wait(self, timeout: Optional[float] = None) -> Set[str]:
+        if not self._event.wait(timeout):
+            return set()
+        time.sleep(DEBOUNCE)
+        with self._lock:
+            changed, self._changed = self._changed, set()
+            self._event.clear()
+        return changed
+
+    def close(self):
+        self._observer.stop()
+        self._observer.join()
+
+def make_watcher(root: str, interval: float = DEFAULT_INTERVAL, polling: bool = False):
+    """
+    Returns a notification-based watcher when ``watchdog`` is available,
+    otherwise (or with ``polling``) an mtime poller.
+    """
+    if not polling:
+        try:
+            return NotifyWatcher(root)
+        except ImportError:
+            pass
+    return PollingWatcher(root, interval)
+
+class WorkspaceState:
+    """
+    In-memory analysis results and dependency graph for a directory, updated
+    file by file as changes arrive.
+
+    Only changed files are re-analyzed (files whose content did not actually
+    change are skipped), and only their outgoing graph edges and call-graph
+    entries are rebuilt, plus the edges of modules importing a module that
+    was created or deleted.
+    """
+    def __init__(self, root: str, jobs: Optional[int] = None, cache: Optional[ResultCache] = None):
+        from codev_suite.visualization.graphs import DependencyGraphGenerator
+
+        self.root = root
+        self.jobs = jobs
+        self.cache = cache
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.digests: Dict[str, str] = {}
+        self.graph = DependencyGraphGenerator(root, jobs=jobs)
+        self.cycles: List[List[str]] = []
+
+    def load(self):
+        """
+        Analyzes the whole directory once, in parallel.
+        """
+        scanner = RepositoryScanner(self.root, jobs=self.jobs, cache=self.cache)
+        for result in scanner.scan():
+            self.results[result["path"]] = result
+            self.digests[result["path"]] = self._digest(result["path"])
+        self.graph.build_graph()
+        self.cycles = import_cycles(self.graph)
+        return self
+
+    def _digest(self, rel_path: str) -> Optional[str]:
+        try:
+            with map_file(os.path.join(self.root, rel_path), max_bytes=None) as data:
+                return content_hash(data)
+        except OSError:
+            return None
+
+    def update(self, changed: Iterable[str]) -> Dict[str, Any]:
+        """
+        Applies a batch of changed paths. Returns ``analyzed`` (path ->
+        ``(previous, current)`` results), ``removed`` paths and ``cycles``
+        when the set of import cycles changed (else None).
+        """
+        analyzed: Dict[str, Tuple[Optional[Dict], Dict]] = {}
+        removed: List[str] = []
+        modified: List[str] = []
+        for rel_path in sorted({os.path.normpath(p) for p in changed}):
+            digest = self._digest(rel_path)
+            if digest is None:
+                if self.results.pop(rel_path, None) is not None:
+                    removed.append(rel_path)
+                self.digests.pop(rel_path, None)
+            elif digest != self.digests.get(rel_path):
+                self.digests[rel_path] = digest
+                modified.append(rel_path)
+        if not modified and not removed:
+            return {"analyzed": analyzed, "removed": removed, "cycles": None}
+
+        # A handful of saved files is analyzed in-process; a branch switch
+        # touching many files goes through the worker pool.
+        jobs = self.jobs if len(modified) > DEFAULT_CHUNK_SIZE else 1
+        scanner = RepositoryScanner(self.root, jobs=jobs, cache=self.cache)
+        for result in scanner.scan([os.path.join(self.root, p) for p in modified]):
+            analyzed[result["path"]] = (self.results.get(result["path"]), result)
+            self.results[result["path"]] = result
+
+        self.graph.build_graph(modified + removed)
+        cycles = import_cycles(self.graph)
+        changed_cycles = cycles if cycles != self.cycles else None
+        self.cycles = cycles
+        return {"analyzed": analyzed, "removed": removed, "cycles": changed_cycles}
+
+def new_findings(previous: Optional[Dict[str, Any]], current: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Returns the smells and bugs in ``current`` that were not reported for the
+    previous version of the file. Findings are compared by type and message,
+    not line, so edits above a finding do not make it look new.
+    """
+    findings = current.get("smells", []) + current.get("bugs", [])
+    if not previous or "error" in previous:
+        return findings
+    seen = {(f["type"], f["details"]) for f in previous.get("smells", []) + previous.get("bugs", [])}
+    return [f for f in findings if (f["type"], f["details"]) not in seen]
@@ -0,0 +1,139 @@
+import json
+from typing import Any, Dict, List, TextIO
+from codev_suite.analyzers.findings import json_default
+from codev_suite.analyzers.rules import BUG, SMELL, default_registry
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+REPORT_VERSION = 1
+# SARIF result level per rule category.
+LEVELS = {SMELL: "note", BUG: "warning"}
+
+def rule_id(finding: Dict[str, Any]) -> str:
+    """
+    Returns the registry id of the rule that reported a finding. Findings
+    saved without one fall back to an id derived from the type, e.g.
+    "Bare Except" -> "bare-except".
+    """
+    return finding.get("rule") or finding["type"].lower().replace(" ", "-")
+
+class ReportWriter:
+    """
+    Streams per-file results to a text stream as they are produced.
+
+    Writers never hold on to results, so memory stays constant no matter how
+    many files are written. Use as a context manager, or call ``begin``,
+    ``write`` for each result, then ``end``.
+    """
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    def begin(self):
+        pass
+
+    def write(self, result: Dict[str, Any]):
+        raise NotImplementedError
+
+    def end(self):
+        self.stream.flush()
+
+    def __enter__(self):
+        self.begin()
+        return self
+
+    def __exit__(self, *exc):
+        self.end()
+
+class NdjsonReportWriter(ReportWriter):
+    """
+    Writes one JSON object per line, flushed as soon as each file is done.
+    """
+    def write(self, result: Dict[str, Any]):
+        self.stream.write(json.dumps(result, separators=(",", ":"), default=json_default))
+        self.stream.write("\n")
+        self.stream.flush()
+
+class JsonReportWriter(ReportWriter):
+    """
+    Writes a single JSON document: ``{"version": 1, "files": [...]}``.
+    """
+    def begin(self):
+        self._count = 0
+        self.stream.write('{"version": %d, "files": [' % REPORT_VERSION)
+
+    def write(self, result: Dict[str, Any]):
+        self.stream.write(",\n" if self._count else "\n")
+        json.dump(result, self.stream, default=json_default)
+        self._count += 1
+
+    def end(self):
+        self.stream.write("\n]}\n")
+        super().end()
+
+class SarifReportWriter(ReportWriter):
+    """
+    Writes smells and bugs as a SARIF 2.1.0 log for code-scanning dashboards.
+    Results are keyed by rule registry id and every registered rule is
+    described in ``tool.driver.rules``. Files that could not be analyzed are
+    reported as tool notifications.
+    """
+    def begin(self):
+        self._count = 0
+        self._errors: List[Dict[str, Any]] = []
+        rules = [
+            {
+                "id": rule.id,
+                "name": rule.name,
+                "shortDescription": {"text": rule.name},
+                "defaultConfiguration": {"level": LEVELS[rule.category]},
+            }
+            for rule in default_registry().rules.values()
+        ]
+        tool = {"driver": {"name": "CoDevSuite", "informationUri": "https://github.com/SayedFaisalShah12/CoDevSuit",
+                           "rules": rules}}
+        # The run object and its results array stay open until end().
+        self.stream.write('{"$schema": "%s", "version": "2.1.0", "runs": [{"tool": %s, "results": ['
+                          % (SARIF_SCHEMA, json.dumps(tool)))
+
+    def write(self, result: Dict[str, Any]):
+        if "error" in result:
+            self._errors.append({
+                "level": "error",
+                "message": {"text": f"{result['path']}: {result['error']}"},
+            })
+            return
+        for category, findings in ((SMELL, result.get("smells", [])), (BUG, result.get("bugs", []))):
+            level = LEVELS[category]
+            for finding in findings:
+                self._emit({
+                    "ruleId": rule_id(finding),
+                    "level": level,
+                    "message": {"text": f"{finding['type']}: {finding['details']}"},
+                    "locations": [{
+                        "physicalLocation": {
+                            "artifactLocation": {"uri": result["path"].replace("\\", "/")},
+                            "region": {"startLine": finding["line"]},
+                        }
+                    }],
+                })
+
+    def _emit(self, sarif_result: Dict[str, Any]):
+        self.stream.write(",\n" if self._count else "\n")
+        json.dump(sarif_result, self.stream)
+        self._count += 1
+
+    def end(self):
+        invocation = {
+            "executionSuccessful": not self._errors,
+            "toolExecutionNotifications": self._errors,
+        }
+        self.stream.write('\n], "invocations": [%s]}]}\n' % json.dumps(invocation))
+        super().end()
+
+WRITERS = {
+    "json": JsonReportWriter,
+    "ndjson": NdjsonReportWriter,
+    "sarif": SarifReportWriter,
+}
+
+def get_writer(fmt: str, stream: TextIO) -> ReportWriter:
+    return WRITERS[fmt](stream)
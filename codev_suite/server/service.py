@@ -0,0 +1,326 @@
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from codev_suite.analyzers.findings import json_default
+from codev_suite.analyzers.pipeline import AnalysisPipeline, IncompleteAnalysis
+from codev_suite.core.cache import ResultCache
+from codev_suite.core.limits import (
+    DEFAULT_FILE_TIMEOUT, HARD_LIMIT_GRACE, limit_memory, time_limit, watchdog, worker_exited,
+)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_BATCH_SIZE = 16
+DEFAULT_MAX_PENDING = 256
+MAX_BODY_BYTES = 8 * 1024 * 1024
+# Seconds a request handler waits for its results before answering 504.
+DEFAULT_RESULT_TIMEOUT = 300
+
+# Per-process state of a pool worker, set up once by ``_init_worker``.
+_pipeline: Optional[AnalysisPipeline] = None
+_cache: Optional[ResultCache] = None
+
+def _init_worker(cache_dir: Optional[str], use_cache: bool, config: Optional[Dict[str, Any]]):
+    global _pipeline, _cache
+    _pipeline = AnalysisPipeline(config)
+    limit_memory((config or {}).get("file_memory_mb"))
+    # Every worker opens its own connection to the same SQLite file, so a
+    # result computed by one worker is served by all of them.
+    _cache = ResultCache(cache_dir) if use_cache else None
+
+def _warm_up() -> int:
+    return os.getpid()
+
+def _analyze_batch(items: List[Tuple[str, Optional[str]]]) -> List[Dict[str, Any]]:
+    results = []
+    timeout = _pipeline.config.get("file_timeout", DEFAULT_FILE_TIMEOUT)
+    for source, path in items:
+        try:
+            key = _pipeline.cache_key(source.encode("utf-8")) if _cache is not None else None
+            cached = _cache.get(key) if key is not None else None
+            if cached is not None:
+                cached["path"] = path
+                results.append(cached)
+                continue
+            # A file stuck in C code past its limit ends this worker; the
+            # service replaces it and reports the file.
+            with time_limit(timeout), watchdog(timeout + HARD_LIMIT_GRACE if timeout else None):
+                result = _pipeline.run(source, path)
+            if key is not None:
+                _cache.set(key, {k: v for k, v in result.items() if k != "path"})
+            results.append(result)
+        except IncompleteAnalysis as e:
+            results.append({**e.partial, "path": path, "error": f"{type(e).__name__}: {e}"})
+        except Exception as e:
+            results.append({"path": path, "error": f"{type(e).__name__}: {e}"})
+    if _cache is not None:
+        _cache.flush()
+    return results
+
+class _Request(NamedTuple):
+    source: str
+    path: Optional[str]
+    future: Future
+    # Set when rerun alone after its batch was lost with a dead worker.
+    isolated: bool = False
+
+class Overloaded(Exception):
+    """Raised when the service already holds ``max_pending`` requests."""
+
+class BatchTooLarge(ValueError):
+    """Raised for a batch larger than ``max_pending``, which can never be admitted."""
+
+class AnalysisService:
+    """
+    Runs the analysis pipeline on a pool of worker processes started up front,
+    so interpreter start-up and imports are paid once rather than per request.
+
+    Requests are queued and a dispatcher thread hands them to the pool with at
+    most one task per worker in flight. Whatever queued up while the workers
+    were busy (up to ``batch_size`` files) goes out as a single task, so
+    batches are small under light load and grow to amortize IPC under heavy
+    load. At most ``max_pending`` files may be queued or running; beyond that
+    ``submit`` raises ``Overloaded`` so callers can shed load. ``config`` is
+    a ``[tool.codev]`` rule configuration applied to every request.
+
+    If a worker dies (a crash, the ``file_memory_mb`` limit or a file stuck
+    past ``file_timeout``), the pool is replaced and the files it was running
+    are rerun one per task; a file that ends a worker again gets a
+    ``WorkerExited`` error result.
+    """
+    def __init__(self, jobs: Optional[int] = None, cache_dir: Optional[str] = None, use_cache: bool = True,
+                 batch_size: int = DEFAULT_BATCH_SIZE, max_pending: int = DEFAULT_MAX_PENDING,
+                 config: Optional[Dict[str, Any]] = None, result_timeout: float = DEFAULT_RESULT_TIMEOUT):
+        self.jobs = jobs or os.cpu_count() or 1
+        self.batch_size = max(1, batch_size)
+        self.max_pending = max_pending
+        self.result_timeout = result_timeout
+        self._initargs = (cache_dir, use_cache, config)
+        self._pool = self._new_pool()
+        self.timeout = (config or {}).get("file_timeout", DEFAULT_FILE_TIMEOUT)
+        self._queue: "queue.Queue[Optional[_Request]]" = queue.Queue()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._slots = threading.Semaphore(self.jobs)
+        self._dispatcher = threading.Thread(target=self._dispatch, name="codev-dispatch", daemon=True)
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker, initargs=self._initargs)
+
+    def _restart_pool(self, broken: ProcessPoolExecutor):
+        """Replaces ``broken`` unless another thread already has."""
+        with self._lock:
+            if self._pool is not broken:
+                return
+            self._pool = self._new_pool()
+        # Called from the broken pool's own callbacks too, so do not wait.
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def start(self):
+        # Start every worker now instead of on the first requests.
+        for future in [self._pool.submit(_warm_up) for _ in range(self.jobs)]:
+            future.result()
+        self._dispatcher.start()
+        return self
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def submit(self, source: str, path: Optional[str] = None) -> Future:
+        return self.submit_many([(source, path)])[0]
+
+    def submit_many(self, items: List[Tuple[str, Optional[str]]]) -> List[Future]:
+        """
+        Queues files for analysis; each future resolves to that file's result.
+        All files are admitted or, when over capacity, none are.
+        """
+        if len(items) > self.max_pending:
+            raise BatchTooLarge(f"{len(items)} files in one request; at most {self.max_pending} are accepted")
+        with self._lock:
+            if self._pending + len(items) > self.max_pending:
+                raise Overloaded(f"{self._pending} requests pending")
+            self._pending += len(items)
+        futures = []
+        for source, path in items:
+            future = Future()
+            self._queue.put(_Request(source, path, future))
+            futures.append(future)
+        return futures
+
+    def _dispatch(self):
+        carried = None
+        while True:
+            item = carried or self._queue.get()
+            carried = None
+            if item is None:
+                return
+            self._slots.acquire()
+            batch = [item]
+            while not item.isolated and len(batch) < self.batch_size:
+                try:
+                    queued = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if queued is None:
+                    self._queue.put(None)
+                    break
+                if queued.isolated:
+                    carried = queued
+                    break
+                batch.append(queued)
+            self._submit(batch)
+
+    def _submit(self, batch):
+        items = [(request.source, request.path) for request in batch]
+        pool = self._pool
+        try:
+            task = pool.submit(_analyze_batch, items)
+        except BrokenProcessPool:
+            # The pool broke since the last task; this batch never ran.
+            self._restart_pool(pool)
+            pool = self._pool
+            try:
+                task = pool.submit(_analyze_batch, items)
+            except BrokenProcessPool as e:
+                task = Future()
+                task.set_exception(e)
+        task.add_done_callback(lambda task, batch=batch, pool=pool: self._complete(batch, task, pool))
+
+    def _complete(self, batch, task: Future, pool: ProcessPoolExecutor):
+        self._slots.release()
+        error = CancelledError() if task.cancelled() else task.exception()
+        if isinstance(error, BrokenProcessPool):
+            self._restart_pool(pool)
+            # Any file of the batch may have ended the worker: rerun each one
+            # alone, and report those that were already alone.
+            retried = [request for request in batch if not request.isolated]
+            for request in retried:
+                self._queue.put(request._replace(isolated=True))
+            batch = [request for request in batch if request.isolated]
+            error = None
+            results = [{"path": request.path, "error": worker_exited(self.timeout)} for request in batch]
+        elif error is None:
+            results = task.result()
+        with self._lock:
+            self._pending -= len(batch)
+        for i, request in enumerate(batch):
+            if error is not None:
+                request.future.set_exception(error)
+            else:
+                request.future.set_result(results[i])
+
+    def close(self):
+        self._queue.put(None)
+        if self._dispatcher.is_alive():
+            self._dispatcher.join()
+        self._pool.shutdown(cancel_futures=True)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+class AnalysisRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON endpoints:
+
+    - ``GET /health``: worker count and queue depth.
+    - ``POST /analyze``: ``{"source": ..., "path": ...}`` returns one result;
+      ``{"files": [{"source": ..., "path": ...}, ...]}`` returns
+      ``{"results": [...]}`` in request order.
+
+    Responds 503 with ``Retry-After`` when the service is at capacity, 413
+    for a batch that can never fit and 504 when results take longer than the
+    service's ``result_timeout``.
+    """
+    server_version = "codev-suite"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def service(self) -> AnalysisService:
+        return self.server.service
+
+    def do_GET(self):
+        if self.path != "/health":
+            return self._send(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+        self._send(HTTPStatus.OK, {
+            "status": "ok", "workers": self.service.jobs, "pending": self.service.pending,
+        })
+
+    def do_POST(self):
+        if self.path != "/analyze":
+            return self._send(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            return self._send(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Request body too large"})
+        try:
+            body = json.loads(self.rfile.read(length) or b"null")
+            single = isinstance(body, dict) and "files" not in body
+            files = [body] if single else body["files"]
+            items = [(f["source"], f.get("path")) for f in files]
+            if not all(isinstance(source, str) for source, _ in items):
+                raise TypeError("source must be a string")
+        except (ValueError, KeyError, TypeError) as e:
+            return self._send(HTTPStatus.BAD_REQUEST, {"error": f"Invalid request: {e}"})
+
+        try:
+            futures = self.service.submit_many(items)
+        except BatchTooLarge as e:
+            return self._send(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": str(e)})
+        except Overloaded as e:
+            return self._send(HTTPStatus.SERVICE_UNAVAILABLE, {"error": f"Server busy: {e}"},
+                              headers={"Retry-After": "1"})
+        deadline = time.monotonic() + self.service.result_timeout
+        try:
+            results = [future.result(timeout=max(0, deadline - time.monotonic())) for future in futures]
+        except FutureTimeout:
+            return self._send(HTTPStatus.GATEWAY_TIMEOUT, {"error": "Analysis did not finish in time"})
+        except Exception as e:
+            return self._send(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{type(e).__name__}: {e}"})
+        if single:
+            status = HTTPStatus.UNPROCESSABLE_ENTITY if "error" in results[0] else HTTPStatus.OK
+            return self._send(status, results[0])
+        self._send(HTTPStatus.OK, {"results": results})
+
+    def _send(self, status: HTTPStatus, payload: Any, headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(payload, default=json_default).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+class AnalysisServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], service: AnalysisService, quiet: bool = False):
+        super().__init__(address, AnalysisRequestHandler)
+        self.service = service
+        self.quiet = quiet
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, quiet: bool = False, **service_options):
+    """
+    Starts the worker pool and serves requests until interrupted.
+    """
+    with AnalysisService(**service_options) as service:
+        with AnalysisServer((host, port), service, quiet=quiet) as server:
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
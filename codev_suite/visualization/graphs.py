@@ -1,51 +1,356 @@
 import networkx as nx
-import matplotlib.pyplot as plt
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 import ast
+import json
 import os
+import sys
+from codev_suite.analyzers.coupling import CallGraph
+from codev_suite.analyzers.symbols import extract_symbols
+from codev_suite.analyzers.rules import load_config
+from codev_suite.core.discovery import DEFAULT_MAX_FILE_BYTES, iter_python_files, read_source
+from codev_suite.core.profiling import span
+from codev_suite.core.modules import (
+    EXTERNAL, MODULE, STDLIB, ImportRef, ModuleIndex, extract_imports, is_package, module_name,
+    qualify, root_package,
+)
+from codev_suite.visualization.layout import clustered_layout, collapse, hierarchical_layout
+
+STDLIB_MODULES = frozenset(getattr(sys, "stdlib_module_names", ()))
+GRAPH_FORMAT_VERSION = 3
+SPRING_LAYOUT_LIMIT = 100
+LABEL_LIMIT = 200
+
+def _read_module(file_path: str, module: str, package: bool, max_bytes: Optional[int] = DEFAULT_MAX_FILE_BYTES):
+    try:
+        # Imports are ASCII, so undecodable bytes elsewhere need not drop the module.
+        tree = ast.parse(read_source(file_path, max_bytes, errors="replace"))
+        return extract_imports(tree), extract_symbols(tree, module, package), None
+    except Exception as e:
+        return None, None, f"{type(e).__name__}: {e}"
+
+def _read_module_chunk(items: List[Tuple[str, str, bool]]):
+    return [_read_module(*item) for item in items]
 
 class DependencyGraphGenerator:
     """
     Generates dependency graphs based on imports and function calls.
+
+    Nodes are in-repo modules plus one node per external top-level package
+    (kind ``external``, or ``stdlib`` for the standard library).
+    Every node gets a compact integer id; ``names``, ``kinds`` and ``paths`` are
+    indexed by that id and ``edges`` maps an importing module's id to the ids
+    it imports. ``graph`` exposes the same data as a networkx ``DiGraph``.
+
+    Function calls are collected in the same pass into ``calls``, a
+    ``CallGraph`` keyed by fully qualified symbol names.
     """
-    def __init__(self, directory_path: str):
+    def __init__(self, directory_path: str, jobs: int = 1, chunk_size: int = 64):
         self.directory_path = directory_path
-        self.graph = nx.DiGraph()
+        self.jobs = jobs or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.names: List[str] = []
+        self.kinds: List[Optional[str]] = []
+        self.paths: List[Optional[str]] = []
+        self.edges: Dict[int, Set[int]] = {}
+        self.imports: Dict[int, List[ImportRef]] = {}
+        self.errors: List[Tuple[str, str]] = []
+        self.modules = ModuleIndex()
+        self.calls = CallGraph()
+        self.package = root_package(directory_path)
+        self.max_file_bytes = load_config(directory_path).get("max_file_bytes", DEFAULT_MAX_FILE_BYTES)
+        self._ids: Dict[str, int] = {}
+        # Importable name -> importers whose resolution depends on whether a
+        # module of that name exists, and the reverse, to keep it current.
+        self._dependents: Dict[str, Set[int]] = defaultdict(set)
+        self._lookups: Dict[int, Set[str]] = {}
+        self._graph: Optional[nx.DiGraph] = None
+
+    def node_id(self, name: str, kind: str = MODULE, path: Optional[str] = None) -> int:
+        """
+        Returns the integer id for a node, creating it on first use.
+        """
+        node = self._ids.get(name)
+        if node is None:
+            node = len(self.names)
+            self._ids[name] = node
+            self.names.append(name)
+            self.kinds.append(kind)
+            self.paths.append(path)
+        elif self.kinds[node] is None or (path is not None and self.kinds[node] != MODULE):
+            self.kinds[node] = kind
+            self.paths[node] = path
+        return node
+
+    @property
+    def graph(self) -> nx.DiGraph:
+        if self._graph is None:
+            graph = nx.DiGraph()
+            graph.add_nodes_from(
+                (node, {"label": name, "kind": kind, "path": path})
+                for node, (name, kind, path) in enumerate(zip(self.names, self.kinds, self.paths))
+                if kind is not None
+            )
+            graph.add_edges_from(
+                (source, target)
+                for source, targets in self.edges.items()
+                for target in targets
+                if self.kinds[target] is not None
+            )
+            self._graph = graph
+        return self._graph
 
-    def build_graph(self):
+    def build_graph(self, paths: Optional[Iterable[str]] = None):
         """
         Walks through the directory and identifies dependencies.
+
+        Files are parsed in parallel when ``jobs`` > 1, vendored and virtualenv
+        directories are skipped, and imports (relative ones included) are
+        resolved to the in-repo modules they refer to. Files that fail to parse
+        are listed in ``errors``.
+
+        When ``paths`` (relative to the directory) is given, only those files are
+        re-analyzed: their previous outgoing edges are replaced, and files that
+        no longer exist are removed from the graph. Modules importing a module
+        that was added or removed (e.g. ``from pkg import new``) are re-resolved
+        from their stored imports.
+        """
+        self._graph = None
+        if paths is None:
+            rel_paths = [os.path.relpath(p, self.directory_path) for p in iter_python_files(self.directory_path)]
+        else:
+            rel_paths = [os.path.normpath(p) for p in paths if p.endswith(".py")]
+
+        existing = []
+        changed = set()
+        for rel_path in rel_paths:
+            name = self._module_name(rel_path)
+            if os.path.isfile(os.path.join(self.directory_path, rel_path)):
+                if name not in self.modules:
+                    changed.add(name)
+                self.modules.add(name)
+                self.node_id(name, MODULE, rel_path)
+                existing.append(rel_path)
+            elif name in self._ids:
+                node = self._ids[name]
+                if name in self.modules:
+                    changed.add(name)
+                self.modules.discard(name)
+                self.kinds[node] = None
+                self.edges.pop(node, None)
+                self.imports.pop(node, None)
+                self._unindex(node)
+                self.calls.remove(name)
+
+        refreshed = set(rel_paths)
+        self.errors = [e for e in self.errors if e[0] not in refreshed]
+        with span("graph.parse", files=len(existing)):
+            parsed = self._parse_all(existing)
+        with span("graph.resolve"):
+            for rel_path, (refs, symbols, error) in zip(existing, parsed):
+                name = self._module_name(rel_path)
+                node = self._ids[name]
+                if error is not None:
+                    self.errors.append((rel_path, error))
+                    refs, symbols = [], {"defs": [], "calls": []}
+                self.imports[node] = refs
+                self.edges[node] = self._resolve(node, refs)
+                self.calls.update(name, symbols)
+            if paths is not None:
+                reparsed = {self._ids[self._module_name(p)] for p in existing}
+                for node in self._importers_of(changed) - reparsed:
+                    self.edges[node] = self._resolve(node, self.imports[node])
+
+    def _importers_of(self, modules: Set[str]) -> Set[int]:
+        importers = set()
+        for module in modules:
+            importers |= self._dependents.get(module, set())
+            if module.startswith("src."):
+                importers |= self._dependents.get(module[len("src."):], set())
+        return importers
+
+    def _unindex(self, node: int):
+        for name in self._lookups.pop(node, ()):
+            self._dependents[name].discard(node)
+
+    def _module_name(self, rel_path: str) -> str:
+        return qualify(self.package, module_name(rel_path))
+
+    def _parse_all(self, rel_paths: List[str]):
+        items = [
+            (os.path.join(self.directory_path, p), self._module_name(p), is_package(p), self.max_file_bytes)
+            for p in rel_paths
+        ]
+        if self.jobs == 1 or len(items) <= self.chunk_size:
+            return [_read_module(*item) for item in items]
+        chunks = [items[i:i + self.chunk_size] for i in range(0, len(items), self.chunk_size)]
+        with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+            return [result for chunk in pool.map(_read_module_chunk, chunks) for result in chunk]
+
+    def _resolve(self, node: int, refs: List[ImportRef]) -> Set[int]:
+        importer = self.names[node]
+        package = is_package(self.paths[node])
+        self._unindex(node)
+        lookups = self._lookups[node] = set()
+        targets = set()
+        for ref in refs:
+            lookups.update(self.modules.lookups(importer, package, ref))
+            internal, external = self.modules.resolve(importer, package, ref)
+            for target in internal:
+                targets.add(self.node_id(target))
+            if external:
+                targets.add(self.node_id(external, STDLIB if external in STDLIB_MODULES else EXTERNAL))
+        for name in lookups:
+            self._dependents[name].add(node)
+        targets.discard(node)
+        return targets
+
+    def save(self, output_path: str):
+        """
+        Stores the graph as JSON so a later run can update it incrementally.
+        """
+        data = {
+            "version": GRAPH_FORMAT_VERSION,
+            "names": self.names,
+            "kinds": self.kinds,
+            "paths": self.paths,
+            "imports": {str(node): refs for node, refs in self.imports.items()},
+            "symbols": self.calls.files,
+            "errors": self.errors,
+        }
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        return output_path
+
+    def load(self, input_path: str):
+        """
+        Loads a graph previously written by ``save``. Edges are re-resolved
+        from the stored imports.
+        """
+        with open(input_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get("version") != GRAPH_FORMAT_VERSION:
+            raise ValueError(f"Unsupported graph file version in {input_path}")
+        self.names = data["names"]
+        self.kinds = data["kinds"]
+        self.paths = data["paths"]
+        self._ids = {name: node for node, name in enumerate(self.names)}
+        self.errors = [tuple(e) for e in data["errors"]]
+        self.modules = ModuleIndex(
+            name for name, kind in zip(self.names, self.kinds) if kind == MODULE
+        )
+        self.imports = {
+            int(node): [ImportRef(ref[0], tuple(ref[1]), ref[2]) for ref in refs]
+            for node, refs in data["imports"].items()
+        }
+        self._dependents = defaultdict(set)
+        self._lookups = {}
+        self.edges = {node: self._resolve(node, refs) for node, refs in self.imports.items()}
+        self.calls = CallGraph()
+        for module, symbols in data["symbols"].items():
+            self.calls.update(module, symbols)
+        self._graph = None
+        return self.graph
+
+    def visualize(self, output_path: str = "dependency_graph.png", layout: str = "auto",
+                  collapse_depth: Optional[int] = None, include_external: bool = True):
         """
-        for root, _, files in os.walk(self.directory_path):
-            for file in files:
-                if file.endswith(".py"):
-                    file_path = os.path.join(root, file)
-                    rel_path = os.path.relpath(file_path, self.directory_path)
-                    self._analyze_file(file_path, rel_path)
-
-    def _analyze_file(self, file_path, rel_path):
-        with open(file_path, 'r', encoding='utf-8') as f:
-            try:
-                tree = ast.parse(f.read())
-                self.graph.add_node(rel_path)
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            self.graph.add_edge(rel_path, alias.name)
-                    elif isinstance(node, ast.ImportFrom):
-                        self.graph.add_edge(rel_path, node.module)
-            except Exception:
-                pass # Skip files that fail to parse
-
-    def visualize(self, output_path: str = "dependency_graph.png"):
-        """
-        Saves the graph as an image.
-        """
-        plt.figure(figsize=(12, 8))
-        pos = nx.spring_layout(self.graph)
-        nx.draw(self.graph, pos, with_labels=True, node_color='lightblue', 
-                edge_color='gray', node_size=2000, font_size=10, arrows=True)
-        plt.title("Code Dependency Graph")
-        plt.savefig(output_path)
-        plt.close()
+        Saves the graph as an image (.png, .svg) or interactive page (.html).
+        ``output_path`` may also be a binary file object, which receives a PNG.
+
+        ``layout`` is ``spring`` (the original force-directed look),
+        ``hierarchical``, ``clustered`` or ``auto``, which keeps ``spring`` for
+        small graphs and switches to the O(V + E) hierarchical layout beyond
+        ``SPRING_LAYOUT_LIMIT`` nodes. ``collapse_depth`` merges modules into
+        their packages at that depth before drawing.
+        """
+        names = {
+            node: name for node, (name, kind) in enumerate(zip(self.names, self.kinds))
+            if kind == MODULE or (include_external and kind is not None)
+        }
+        edges = {
+            source: {t for t in targets if t in names}
+            for source, targets in self.edges.items() if source in names
+        }
+        sizes = {node: 1 for node in names}
+        if collapse_depth:
+            names, edges, sizes = collapse(names, edges, collapse_depth)
+
+        if layout == "auto":
+            layout = "spring" if len(names) <= SPRING_LAYOUT_LIMIT else "hierarchical"
+        with span("graph.layout", layout=layout, nodes=len(names)):
+            if layout == "spring":
+                graph = nx.DiGraph()
+                graph.add_nodes_from(names)
+                graph.add_edges_from((s, t) for s, targets in edges.items() for t in targets)
+                pos = nx.spring_layout(graph, seed=42)
+            elif layout == "hierarchical":
+                pos = hierarchical_layout(names, edges)
+            elif layout == "clustered":
+                pos = clustered_layout(names, depth=collapse_depth or 1)
+            else:
+                raise ValueError(f"Unknown layout: {layout}")
+
+        with span("graph.render"):
+            if isinstance(output_path, str) and output_path.endswith(".html"):
+                return self._render_html(output_path, names, edges, sizes, pos)
+            return self._render_image(output_path, names, edges, sizes, pos)
+
+    def _render_image(self, output_path, names, edges, sizes, pos):
+        from matplotlib.collections import LineCollection
+        from matplotlib.figure import Figure
+
+        count = len(names)
+        # Shrink nodes and drop labels as the graph grows so large graphs stay legible.
+        node_size = max(10, min(2000, 40000 / max(count, 1)))
+        # A standalone Figure (no pyplot state) is safe to render from worker threads.
+        fig = Figure(figsize=(12, 8) if count <= SPRING_LAYOUT_LIMIT else (24, 16))
+        ax = fig.add_subplot()
+        segments = [(pos[s], pos[t]) for s, targets in edges.items() for t in targets]
+        ax.add_collection(LineCollection(segments, colors='gray', linewidths=0.5, alpha=0.6, zorder=1))
+        nodes = list(names)
+        xs = [pos[n][0] for n in nodes]
+        ys = [pos[n][1] for n in nodes]
+        ax.scatter(xs, ys, s=[min(2000, node_size * sizes.get(n, 1) ** 0.5) for n in nodes],
+                   c='lightblue', edgecolors='steelblue', zorder=2)
+        if count <= LABEL_LIMIT:
+            for n, x, y in zip(nodes, xs, ys):
+                ax.annotate(names[n], (x, y), ha='center', va='center', fontsize=10 if count <= 50 else 6, zorder=3)
+        ax.set_axis_off()
+        ax.autoscale()
+        ax.set_title("Code Dependency Graph")
+        fig.savefig(output_path, format=None if isinstance(output_path, str) else 'png')
+        return output_path
+
+    def _render_html(self, output_path, names, edges, sizes, pos):
+        import plotly.graph_objects as go
+
+        # All edges go into one trace, separated by None, so the page stays
+        # fast with tens of thousands of edges.
+        edge_x, edge_y = [], []
+        for source, targets in edges.items():
+            for target in targets:
+                edge_x += [pos[source][0], pos[target][0], None]
+                edge_y += [pos[source][1], pos[target][1], None]
+        nodes = list(names)
+        fan_in = defaultdict(int)
+        for targets in edges.values():
+            for target in targets:
+                fan_in[target] += 1
+        fig = go.Figure([
+            go.Scattergl(x=edge_x, y=edge_y, mode='lines', hoverinfo='skip',
+                         line=dict(width=0.5, color='#999')),
+            go.Scattergl(
+                x=[pos[n][0] for n in nodes], y=[pos[n][1] for n in nodes], mode='markers',
+                text=[f"{names[n]}<br>imports: {len(edges.get(n, ()))}<br>imported by: {fan_in[n]}"
+                      + (f"<br>modules: {sizes[n]}" if sizes.get(n, 1) > 1 else "") for n in nodes],
+                hoverinfo='text',
+                marker=dict(size=[6 + 4 * sizes.get(n, 1) ** 0.5 for n in nodes], color='lightblue',
+                            line=dict(width=1, color='steelblue')),
+            ),
+        ])
+        fig.update_layout(title="Code Dependency Graph", showlegend=False,
+                          xaxis=dict(visible=False), yaxis=dict(visible=False))
+        fig.write_html(output_path, include_plotlyjs='cdn')
         return output_path
@@ -0,0 +1,78 @@
+import math
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
+from codev_suite.core.graph_algorithms import longest_path_layers
+
+Position = Tuple[float, float]
+
+def package_of(name: str, depth: int) -> str:
+    """
+    Returns the first ``depth`` components of a dotted module name.
+    """
+    return ".".join(name.split(".")[:depth])
+
+def collapse(names: Dict[int, str], edges: Dict[int, Set[int]], depth: int):
+    """
+    Merges modules into their package at the given depth, e.g. depth 2 maps
+    ``app.api.views`` to ``app.api``. Returns new ``(names, edges, sizes)``
+    where ``sizes`` counts the modules merged into each package node.
+    """
+    ids: Dict[str, int] = {}
+    mapping: Dict[int, int] = {}
+    sizes: Dict[int, int] = defaultdict(int)
+    for node, name in names.items():
+        package = package_of(name, depth)
+        mapping[node] = ids.setdefault(package, len(ids))
+        sizes[mapping[node]] += 1
+    collapsed_edges: Dict[int, Set[int]] = defaultdict(set)
+    for source, targets in edges.items():
+        if source not in mapping:
+            continue
+        for target in targets:
+            if target in mapping and mapping[target] != mapping[source]:
+                collapsed_edges[mapping[source]].add(mapping[target])
+    return {i: name for name, i in ids.items()}, dict(collapsed_edges), dict(sizes)
+
+def hierarchical_layout(names: Dict[int, str], edges: Dict[int, Set[int]]) -> Dict[int, Position]:
+    """
+    Places nodes in layers by longest import path (importers on top), ordered
+    by name within a layer so modules of a package sit together. O(V + E).
+    """
+    layers = longest_path_layers(list(names), edges)
+    rows: Dict[int, List[int]] = defaultdict(list)
+    for node, layer in layers.items():
+        rows[layer].append(node)
+    # Very wide layers (typically one big import cycle) wrap onto sub-rows
+    # within their band instead of becoming a single unreadable line.
+    max_width = max(10, int(math.sqrt(len(names)) * 2))
+    band = 1.0 / (max(rows) + 1) if rows else 1.0
+    positions = {}
+    for layer, row in rows.items():
+        row.sort(key=lambda node: names[node])
+        wraps = math.ceil(len(row) / max_width)
+        for i, node in enumerate(row):
+            sub_row, column = divmod(i, max_width)
+            width = min(max_width, len(row) - sub_row * max_width)
+            x = (column + 0.5) / width
+            y = band * (layer + 1 - (sub_row + 0.5) / wraps)
+            positions[node] = (x, y)
+    return positions
+
+def clustered_layout(names: Dict[int, str], depth: int = 1) -> Dict[int, Position]:
+    """
+    Groups nodes by package: packages sit on a grid and their modules on a
+    circle around the package centre. O(V), independent of the edge count.
+    """
+    clusters: Dict[str, List[int]] = defaultdict(list)
+    for node, name in names.items():
+        clusters[package_of(name, depth)].append(node)
+    columns = max(1, math.ceil(math.sqrt(len(clusters))))
+    positions = {}
+    for index, package in enumerate(sorted(clusters)):
+        members = sorted(clusters[package], key=lambda node: names[node])
+        cx, cy = index % columns, -(index // columns)
+        radius = 0.4 * min(1.0, math.sqrt(len(members)) / 10) if len(members) > 1 else 0.0
+        for i, node in enumerate(members):
+            angle = 2 * math.pi * i / len(members)
+            positions[node] = (cx + radius * math.cos(angle), cy + radius * math.sin(angle))
+    return positions
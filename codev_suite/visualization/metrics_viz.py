@@ -1,35 +1,100 @@
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+import matplotlib
 import numpy as np
+from codev_suite.analyzers.findings import complexity_rank
+
+# Beyond this many blocks one bar per function is unreadable; the chart
+# switches to a histogram.
+MAX_BARS = 40
+RANK_COLORS = {"A": "#2ca02c", "B": "#98df8a", "C": "#ffbb78", "D": "#ff7f0e", "E": "#d62728", "F": "#7f0000"}
+
+def _save(fig: Figure, output_path):
+    # File names pick the format from their extension; file objects get PNG.
+    fig.savefig(output_path, format=None if isinstance(output_path, str) else 'png')
+
+def _complexity_bins(maximum):
+    from codev_suite.analyzers.aggregate import COMPLEXITY_BINS
+
+    return COMPLEXITY_BINS + (max(COMPLEXITY_BINS[-1], maximum) + 1,)
+
+def _complexity_histogram(ax, counts, edges):
+    # Bins have uneven widths, so they are drawn as evenly spaced labelled bars.
+    labels = [str(int(lo)) if hi - lo == 1 else f"{int(lo)}-{int(hi) - 1}" for lo, hi in zip(edges[:-1], edges[1:])]
+    colors = [RANK_COLORS[complexity_rank(int(lo))] for lo in edges[:-1]]
+    ax.bar(labels, counts, color=colors)
+    ax.set_xlabel('Cyclomatic Complexity')
+    ax.set_ylabel('Functions / Classes')
+    ax.set_title(f'Complexity Distribution ({int(sum(counts))} blocks)')
 
 class MetricsVisualizer:
     """
     Creates premium visualizations for code metrics.
+
+    Figures are built with the object-oriented matplotlib API rather than
+    pyplot's global state, so charts can be rendered from several threads at
+    once. ``output_path`` may be a file name or a binary file object such as
+    ``io.BytesIO`` (written as PNG).
     """
     @staticmethod
     def plot_complexity_distribution(complexity_data, output_path="complexity_dist.png"):
         """
-        Plots a bar chart of complexity per function/method.
+        Plots a bar chart of complexity per function/method, or a histogram
+        when there are more than ``MAX_BARS`` of them.
         """
+        if len(complexity_data) > MAX_BARS:
+            counts, edges = np.histogram([item['complexity'] for item in complexity_data],
+                                         bins=_complexity_bins(max(item['complexity'] for item in complexity_data)))
+            fig = Figure(figsize=(10, 6))
+            _complexity_histogram(fig.add_subplot(), counts, edges)
+            fig.tight_layout()
+            _save(fig, output_path)
+            return output_path
+
         names = [item['name'] for item in complexity_data]
         values = [item['complexity'] for item in complexity_data]
-        
-        plt.figure(figsize=(10, 6))
-        colors = plt.cm.viridis(np.linspace(0, 1, len(names)))
-        bars = plt.bar(names, values, color=colors)
-        
-        plt.xlabel('Functions / Classes')
-        plt.ylabel('Cyclomatic Complexity')
-        plt.title('Code Complexity Distribution')
-        plt.xticks(rotation=45, ha='right')
-        
+
+        fig = Figure(figsize=(10, 6))
+        ax = fig.add_subplot()
+        colors = matplotlib.colormaps['viridis'](np.linspace(0, 1, len(names)))
+        bars = ax.bar(names, values, color=colors)
+
+        ax.set_xlabel('Functions / Classes')
+        ax.set_ylabel('Cyclomatic Complexity')
+        ax.set_title('Code Complexity Distribution')
+        ax.tick_params(axis='x', labelrotation=45)
+        for label in ax.get_xticklabels():
+            label.set_horizontalalignment('right')
+
         # Add labels on top of bars
         for bar in bars:
             yval = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2, yval + 0.1, yval, ha='center', va='bottom')
-            
-        plt.tight_layout()
-        plt.savefig(output_path)
-        plt.close()
+            ax.text(bar.get_x() + bar.get_width()/2, yval + 0.1, yval, ha='center', va='bottom')
+
+        fig.tight_layout()
+        _save(fig, output_path)
+        return output_path
+
+    @staticmethod
+    def plot_repository_summary(metrics, output_path="repository_metrics.png"):
+        """
+        Plots a ``RepoMetrics`` aggregate: a histogram of block complexity
+        (bars colored by rank, log scale) and one of file maintainability.
+        """
+        fig = Figure(figsize=(12, 5))
+        complexity_ax, mi_ax = fig.subplots(1, 2)
+        _complexity_histogram(complexity_ax, *metrics.histogram("complexity"))
+        complexity_ax.set_yscale('log')
+
+        counts, edges = metrics.histogram("maintainability")
+        colors = ['red' if left < 20 else 'orange' if left < 50 else 'green' for left in edges[:-1]]
+        mi_ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color=colors, edgecolor='white')
+        mi_ax.set_xlim(0, 100)
+        mi_ax.set_xlabel('Maintainability Index')
+        mi_ax.set_ylabel('Files')
+        mi_ax.set_title(f'Maintainability ({metrics.analyzed} files)')
+
+        fig.tight_layout()
+        _save(fig, output_path)
         return output_path
 
     @staticmethod
@@ -37,13 +102,13 @@ class MetricsVisualizer:
         """
         Plots a 'gauge' or simple color indicator for Maintainability Index.
         """
-        plt.figure(figsize=(6, 2))
+        fig = Figure(figsize=(6, 2))
+        ax = fig.add_subplot()
         color = 'green' if mi_score > 50 else 'orange' if mi_score > 20 else 'red'
-        
-        plt.barh(['Maintainability'], [mi_score], color=color)
-        plt.xlim(0, 100)
-        plt.title(f'Maintainability Index: {mi_score:.2f}')
-        plt.tight_layout()
-        plt.savefig(output_path)
-        plt.close()
+
+        ax.barh(['Maintainability'], [mi_score], color=color)
+        ax.set_xlim(0, 100)
+        ax.set_title(f'Maintainability Index: {mi_score:.2f}')
+        fig.tight_layout()
+        _save(fig, output_path)
         return output_path
@@ -1,60 +1,161 @@
 import streamlit as st
+import hashlib
+import io
 import os
 import tempfile
-from codev_suite.core.parser import CodeParser
-from codev_suite.analyzers.metrics import MetricsAnalyzer
-from codev_suite.analyzers.smells import CodeSmellDetector
-from codev_suite.analyzers.bugs import BugDetector
+from concurrent.futures import ThreadPoolExecutor
+from codev_suite.analyzers.pipeline import AnalysisPipeline
 from codev_suite.ai.engine import AIEngine
+from codev_suite.ai.chunking import FunctionChunker, stitch_report
+from codev_suite.analyzers.coupling import import_cycles, module_coupling
+from codev_suite.core.cache import ResultCache, content_hash
+from codev_suite.core.discovery import SourceError, decode_source, iter_python_files, read_source
+from codev_suite.core.history import AnalysisIndex
+from codev_suite.core.scanner import RepositoryScanner, ScanSummary
 from codev_suite.visualization.metrics_viz import MetricsVisualizer
 from codev_suite.visualization.graphs import DependencyGraphGenerator
+from codev_suite.web.jobs import start_job
+from codev_suite.web.uploads import UploadError, extract_zip, project_root, save_uploads
+
+BACKGROUND_WORKERS = 4
 
 st.set_page_config(page_title="CoDevSuite - AI Code Intelligence", layout="wide")
 
-st.title("🚀 CoDevSuite: AI-Powered Code Intelligence")
-st.markdown("""
-Analyze your Python code for complexity, smells, and bugs. 
-Get AI-powered refactoring suggestions and architecture visualizations.
-""")
+# Streamlit reruns this script on every interaction. Analysis and charts are
+# memoized by content hash (shared by all sessions), and AI, scan and graph
+# work run on a shared thread pool so a click never blocks the page.
+
+@st.cache_resource
+def background_pool():
+    return ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix="codev-web")
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def analyze_source(digest, name, _content):
+    return AnalysisPipeline().run(_content, name)
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def render_charts(digest, _complexity, mi_score):
+    """Renders both metric charts in memory; returns PNG bytes."""
+    dist, gauge = io.BytesIO(), io.BytesIO()
+    MetricsVisualizer.plot_complexity_distribution(_complexity, dist)
+    MetricsVisualizer.plot_maintainability_gauge(mi_score, gauge)
+    return dist.getvalue(), gauge.getvalue()
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def render_repository_chart(digest, _metrics):
+    """Complexity and maintainability histograms for a scanned repository; PNG bytes."""
+    image = io.BytesIO()
+    MetricsVisualizer.plot_repository_summary(_metrics, image)
+    return image.getvalue()
+
+def ai_insights_job(job, content, complexity, findings):
+    with ResultCache() as cache:
+        engine = AIEngine(cache=cache)
+        chunker = FunctionChunker(content)
+        chunks = chunker.select(complexity, findings)
+        prompts = [engine.explain_prompt(chunker.outline())]
+        prompts += [engine.function_prompt(chunk) for chunk in chunks]
+        answers = engine.batch(prompts, progress=lambda done, total: job.update(done, total, "Calling Gemini API..."))
+    return answers[0], stitch_report(chunks, answers[1:]) if chunks else None
+
+def dependency_graph_job(job, root):
+    job.update(0, 3, "Parsing imports and calls...")
+    generator = DependencyGraphGenerator(root, jobs=os.cpu_count())
+    generator.build_graph()
+    job.update(1, 3, "Rendering graph...")
+    image = io.BytesIO()
+    generator.visualize(image)
+    job.update(2, 3, "Computing coupling...")
+    calls = generator.calls
+    call_rows = [
+        {"function": symbol, "calls": ", ".join(sorted(calls.callees(symbol))),
+         "called by": len(calls.callers(symbol))}
+        for symbol in sorted(calls.defs)
+        if calls.callees(symbol) or calls.callers(symbol)
+    ]
+    job.update(3, 3)
+    return image.getvalue(), import_cycles(generator), module_coupling(generator), call_rows
+
+def single_file_graph_job(job, content):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Save the uploaded file to the tmp dir to analyze its imports
+        with open(os.path.join(tmpdir, "uploaded_file.py"), "w") as f:
+            f.write(content)
+        return dependency_graph_job(job, tmpdir)
+
+def scan_job(job, root):
+    total = sum(1 for _ in iter_python_files(root))
+    results = {}
+    with ResultCache() as cache:
+        scanner = RepositoryScanner(root, cache=cache)
+        for result in scanner.scan():
+            results[result["path"]] = result
+            job.update(len(results), total, "Analyzing files...")
+    return dict(sorted(results.items()))
 
-uploaded_file = st.file_uploader("Upload a Python file", type=["py"])
+@st.fragment(run_every=1.0)
+def job_progress(key):
+    job = st.session_state[key]
+    if job.done():
+        # Rerun the whole page once so the results render in place.
+        st.rerun()
+    st.progress(job.fraction, text=f"{job.label}: {job.message or 'Queued...'}")
+
+def show_job(key, render):
+    job = st.session_state.get(key)
+    if job is None:
+        return
+    if not job.done():
+        job_progress(key)
+        return
+    try:
+        result = job.result()
+    except Exception as e:
+        st.error(f"{job.label} failed: {e}")
+        return
+    render(result)
+
+def show_ai_insights(result):
+    explanation, report = result
+    st.info(explanation)
+    if report:
+        st.success(report)
+
+def show_dependency_graph(result):
+    image, cycles, coupling, call_rows = result
+    st.image(image)
+    for cycle in cycles:
+        st.error("Import cycle: " + " -> ".join(cycle))
+    st.markdown("**Module coupling**")
+    st.dataframe(coupling)
+    if call_rows:
+        st.markdown("**Call graph**")
+        st.dataframe(call_rows)
+
+def show_file_report(content, result, digest):
+    """Per-file view: source, metrics, smells, bugs and AI insights."""
+    complexity = result["complexity"]
+    mi_score = result["maintainability"]
+    smells = result["smells"]
+    bugs = result["bugs"]
 
-if uploaded_file is not None:
-    content = uploaded_file.getvalue().decode("utf-8")
-    
     col1, col2 = st.columns(2)
-    
+
     with col1:
         st.subheader("Source Code")
         st.code(content, language="python")
-        
-    # Analysis
-    parser = CodeParser(source_code=content)
-    parser.parse()  # Populate the AST tree
-    metrics_analyzer = MetricsAnalyzer(content)
-    complexity = metrics_analyzer.analyze_complexity()
-    mi_score = metrics_analyzer.analyze_maintainability()
-    
-    detector = CodeSmellDetector()
-    smells = detector.check(parser.tree)
-    
-    bug_detector = BugDetector()
-    bugs = bug_detector.check(parser.tree)
-    
+
     with col2:
         st.subheader("Complexity Metrics")
         st.metric("Maintainability Index", f"{mi_score:.2f}")
-        
+
         # Viz
-        viz = MetricsVisualizer()
-        dist_path = viz.plot_complexity_distribution(complexity)
-        st.image(dist_path)
-        
-        gauge_path = viz.plot_maintainability_gauge(mi_score)
-        st.image(gauge_path)
+        dist_png, gauge_png = render_charts(digest, complexity, mi_score)
+        st.image(dist_png)
+        st.image(gauge_png)
 
     st.divider()
-    
+
     # Smells and Bugs
     c3, c4 = st.columns(2)
     with c3:
@@ -64,7 +165,7 @@ if uploaded_file is not None:
                 st.warning(f"**{s['type']}** (Line {s['line']}): {s['details']}")
         else:
             st.success("No code smells detected!")
-            
+
     with c4:
         st.subheader("🐞 Potential Bugs")
         if bugs:
@@ -74,29 +175,158 @@ if uploaded_file is not None:
             st.success("No potential bugs detected!")
 
     st.divider()
-    
+
     # AI Insights
     st.subheader("🤖 AI Insights")
-    if st.button("Get AI Explanation & Refactoring"):
-        with st.spinner("Calling Gemini API..."):
-            engine = AIEngine()
-            explanation = engine.explain_code(content)
-            st.info(explanation)
-            
-            if smells or bugs:
-                refactor = engine.suggest_refactor(content, smells + bugs)
-                st.success(refactor)
-                
+    ai_key = f"ai:{digest}"
+    if st.button("Get AI Explanation & Refactoring", key=f"ai-button:{digest}"):
+        st.session_state[ai_key] = start_job(
+            background_pool(), "AI insights", ai_insights_job, content, complexity, smells + bugs,
+        )
+    show_job(ai_key, show_ai_insights)
+
+def upload_workspace(uploads):
+    """
+    Writes a zip or a set of uploaded files to a per-session temporary
+    directory, reusing it while the upload is unchanged. Returns
+    ``(digest, root)``.
+    """
+    hasher = hashlib.sha256()
+    for upload in uploads:
+        hasher.update(f"{upload.name}\0{upload.file_id}\0".encode("utf-8"))
+    digest = hasher.hexdigest()
+    workspace = st.session_state.get("workspace")
+    if workspace is None or workspace[0] != digest:
+        tmpdir = tempfile.TemporaryDirectory(prefix="codev-upload-")
+        if len(uploads) == 1 and uploads[0].name.endswith(".zip"):
+            # pyproject.toml is kept for the project's [tool.codev] rule settings.
+            extract_zip(uploads[0], tmpdir.name, suffixes=(".py", "pyproject.toml"))
+        else:
+            save_uploads(uploads, tmpdir.name)
+        # The previous TemporaryDirectory is cleaned up once it is replaced.
+        workspace = (digest, tmpdir)
+        st.session_state["workspace"] = workspace
+    return digest, project_root(workspace[1].name)
+
+def show_repository(results, root, digest):
+    summary = ScanSummary(top=10)
+    for result in results.values():
+        summary.add(result)
+    metrics = summary.metrics
+
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Files analyzed", summary.analyzed)
+    m2.metric("Average Maintainability", f"{summary.average_maintainability:.2f}")
+    m3.metric("Code smells", summary.smells)
+    m4.metric("Potential bugs", summary.bugs)
+    for error in summary.errors:
+        st.warning(f"**{error['path']}** skipped: {error['error']}")
+
+    percentiles = metrics.percentiles("complexity")
+    if percentiles:
+        st.caption("Complexity percentiles: " + ", ".join(f"p{q} {value:g}" for q, value in percentiles.items()))
+        st.image(render_repository_chart(digest, metrics))
+
+    st.subheader("Files")
+    files = metrics.files_frame()[["maintainability", "max_complexity", "smells", "bugs"]]
+    st.dataframe(files.sort_values("maintainability").round(2), use_container_width=True)
+    st.subheader("Complexity Hotspots")
+    st.dataframe([
+        {"file": h["path"], "name": h["name"], "line": h["lineno"], "complexity": h["complexity"], "rank": h["rank"]}
+        for h in summary.top_hotspots()
+    ], use_container_width=True)
+
     st.divider()
-    
+
     st.subheader("🕸️ Dependency Graph")
+    graph_key = f"graph:{digest}"
     if st.button("Generate Dependency Graph"):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Save the uploaded file to the tmp dir to analyze its imports
-            with open(os.path.join(tmpdir, "uploaded_file.py"), "w") as f:
-                f.write(content)
-            
-            generator = DependencyGraphGenerator(tmpdir)
-            generator.build_graph()
-            graph_path = generator.visualize("web_graph.png")
-            st.image(graph_path)
+        st.session_state[graph_key] = start_job(background_pool(), "Dependency graph", dependency_graph_job, root)
+    show_job(graph_key, show_dependency_graph)
+
+    st.divider()
+
+    st.subheader("🔎 File Details")
+    selected = st.selectbox("File", metrics.paths)
+    if selected:
+        content = read_source(os.path.join(root, selected), max_bytes=None)
+        show_file_report(content, results[selected], content_hash(content.encode("utf-8")))
+
+def show_history():
+    """Trends of runs recorded with ``codev scan --record``, read from the history index."""
+    with AnalysisIndex() as index:
+        projects = index.projects()
+        if not projects:
+            st.info("No recorded runs yet. Record one with `codev scan DIR_PATH --record`.")
+            return
+        root = st.selectbox("Project", [root for root, _ in projects],
+                            format_func=lambda root: f"{root} ({dict(projects)[root]} runs)")
+        last = st.slider("Runs", min_value=2, max_value=100, value=10)
+        runs = index.runs(root, last)
+        rising = index.complexity_changes(root, last, top=20)
+        falling = index.complexity_changes(root, last, top=20, rising=False)
+
+    import pandas as pd
+
+    frame = pd.DataFrame(runs).set_index("run")
+    st.subheader("Maintainability")
+    st.line_chart(frame["maintainability"])
+    st.subheader("Findings")
+    st.line_chart(frame[["smells", "bugs"]].fillna(0))
+
+    columns = ["path", "symbol", "lineno", "before", "after", "delta"]
+    st.subheader("Functions Whose Complexity Rose Most")
+    st.dataframe(pd.DataFrame(rising, columns=columns), use_container_width=True)
+    st.subheader("Functions Whose Complexity Fell Most")
+    st.dataframe(pd.DataFrame(falling, columns=columns), use_container_width=True)
+
+st.title("🚀 CoDevSuite: AI-Powered Code Intelligence")
+st.markdown("""
+Analyze your Python code for complexity, smells, and bugs.
+Get AI-powered refactoring suggestions and architecture visualizations.
+""")
+
+mode = st.radio("Analyze", ["Single file", "Repository", "History"], horizontal=True)
+
+if mode == "Single file":
+    uploaded_file = st.file_uploader("Upload a Python file", type=["py"])
+
+    if uploaded_file is not None:
+        data = uploaded_file.getvalue()
+        try:
+            content = decode_source(data, uploaded_file.name)
+        except SourceError as e:
+            st.error(str(e))
+            st.stop()
+        digest = content_hash(data)
+
+        # Analysis
+        result = analyze_source(digest, uploaded_file.name, content)
+        show_file_report(content, result, digest)
+
+        st.divider()
+
+        st.subheader("🕸️ Dependency Graph")
+        graph_key = f"graph:{digest}"
+        if st.button("Generate Dependency Graph"):
+            st.session_state[graph_key] = start_job(
+                background_pool(), "Dependency graph", single_file_graph_job, content,
+            )
+        show_job(graph_key, show_dependency_graph)
+elif mode == "History":
+    show_history()
+else:
+    archive = st.file_uploader("Upload a zip archive", type=["zip"])
+    files = st.file_uploader("...or a directory of Python files", type=["py"], accept_multiple_files="directory")
+    uploads = [archive] if archive is not None else files or []
+
+    if uploads:
+        try:
+            digest, root = upload_workspace(uploads)
+        except UploadError as e:
+            st.error(str(e))
+            st.stop()
+        scan_key = f"scan:{digest}"
+        if scan_key not in st.session_state:
+            st.session_state[scan_key] = start_job(background_pool(), "Repository scan", scan_job, root)
+        show_job(scan_key, lambda results: show_repository(results, root, digest))
@@ -0,0 +1,43 @@
+import threading
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Optional
+
+class Job:
+    """
+    Background work whose progress the web UI polls between reruns.
+
+    The worker function receives the job as its first argument and reports
+    progress through ``update``; the UI reads ``fraction`` and ``message``.
+    """
+    def __init__(self, label: str):
+        self.label = label
+        self.completed = 0
+        self.total = 0
+        self.message = ""
+        self.future: Optional[Future] = None
+        self._lock = threading.Lock()
+
+    def update(self, completed: int, total: int, message: str = ""):
+        with self._lock:
+            self.completed, self.total = completed, total
+            if message:
+                self.message = message
+
+    @property
+    def fraction(self) -> float:
+        with self._lock:
+            return min(1.0, self.completed / self.total) if self.total else 0.0
+
+    def done(self) -> bool:
+        return self.future is not None and self.future.done()
+
+    def result(self) -> Any:
+        return self.future.result()
+
+def start_job(executor: Executor, label: str, fn: Callable[..., Any], *args) -> Job:
+    """
+    Submits ``fn(job, *args)`` to ``executor`` and returns the job handle.
+    """
+    job = Job(label)
+    job.future = executor.submit(fn, job, *args)
+    return job
@@ -0,0 +1,108 @@
+import os
+import stat
+import zipfile
+from typing import BinaryIO, Iterable, List, Tuple
+from codev_suite.core.discovery import is_excluded_dir
+
+MAX_FILES = 20_000
+MAX_TOTAL_BYTES = 256 * 1024 * 1024
+COPY_BUFFER = 64 * 1024
+
+class UploadError(ValueError):
+    """Raised for archives that are unsafe or exceed the upload limits."""
+
+def safe_path(root: str, name: str) -> str:
+    """
+    Maps an archive member or uploaded file name to a path inside ``root``.
+    Absolute names and names escaping ``root`` via ``..`` (zip slip) raise
+    ``UploadError``.
+    """
+    name = name.replace("\\", "/")
+    if name.startswith("/") or (len(name) > 1 and name[1] == ":"):
+        raise UploadError(f"Absolute path in upload: {name}")
+    root = os.path.realpath(root)
+    target = os.path.realpath(os.path.join(root, *name.split("/")))
+    if os.path.commonpath([root, target]) != root or target == root:
+        raise UploadError(f"Path escapes the upload directory: {name}")
+    return target
+
+def _wanted(name: str, suffixes: Tuple[str, ...]) -> bool:
+    parts = name.replace("\\", "/").split("/")
+    return name.endswith(suffixes) and not any(is_excluded_dir(part) for part in parts[:-1])
+
+class _Budget:
+    def __init__(self, max_files: int, max_bytes: int):
+        self.files_left = max_files
+        self.bytes_left = max_bytes
+
+    def copy(self, source: BinaryIO, path: str):
+        self.files_left -= 1
+        if self.files_left < 0:
+            raise UploadError("Upload contains too many files")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as out:
+            # Count the bytes actually written rather than trusting sizes
+            # declared in the archive, which a zip bomb can fake.
+            while True:
+                block = source.read(COPY_BUFFER)
+                if not block:
+                    break
+                self.bytes_left -= len(block)
+                if self.bytes_left < 0:
+                    raise UploadError("Upload is too large once extracted")
+                out.write(block)
+
+def extract_zip(fileobj: BinaryIO, dest: str, suffixes: Tuple[str, ...] = (".py",),
+                max_files: int = MAX_FILES, max_bytes: int = MAX_TOTAL_BYTES) -> List[str]:
+    """
+    Extracts the members of a zip archive ending in ``suffixes`` into ``dest``,
+    one member at a time in fixed-size blocks. Symlinks, vendored/virtualenv
+    directories and other files are skipped. Returns the extracted paths
+    relative to ``dest``.
+    """
+    budget = _Budget(max_files, max_bytes)
+    extracted = []
+    try:
+        archive = zipfile.ZipFile(fileobj)
+    except zipfile.BadZipFile as e:
+        raise UploadError(f"Not a valid zip archive: {e}") from e
+    with archive:
+        for info in archive.infolist():
+            if info.is_dir() or not _wanted(info.filename, suffixes):
+                continue
+            if stat.S_ISLNK(info.external_attr >> 16):
+                continue
+            path = safe_path(dest, info.filename)
+            with archive.open(info) as source:
+                budget.copy(source, path)
+            extracted.append(os.path.relpath(path, os.path.realpath(dest)))
+    return extracted
+
+def save_uploads(files: Iterable, dest: str, suffixes: Tuple[str, ...] = (".py",),
+                 max_files: int = MAX_FILES, max_bytes: int = MAX_TOTAL_BYTES) -> List[str]:
+    """
+    Writes uploaded file objects (with a ``name``, which may contain a
+    relative directory) below ``dest``. Returns the written relative paths.
+    """
+    budget = _Budget(max_files, max_bytes)
+    saved = []
+    for upload in files:
+        if not _wanted(upload.name, suffixes):
+            continue
+        path = safe_path(dest, upload.name)
+        upload.seek(0)
+        budget.copy(upload, path)
+        saved.append(os.path.relpath(path, os.path.realpath(dest)))
+    return saved
+
+def project_root(dest: str) -> str:
+    """
+    Skips the single top-level folder most archives wrap a project in, so
+    module names start at the project rather than at ``project-main``.
+    """
+    entries = os.listdir(dest)
+    if len(entries) == 1 and os.path.isdir(os.path.join(dest, entries[0])):
+        inner = os.path.join(dest, entries[0])
+        if not os.path.isfile(os.path.join(inner, "__init__.py")):
+            return inner
+    return dest
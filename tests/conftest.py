@@ -0,0 +1,25 @@
+import multiprocessing
+import os
+import pytest
+from codev_suite.analyzers.rules import Rule, default_registry
+
+class Crash(Rule):
+    """Ends the process analyzing any file that uses the name ``CRASH``."""
+    id = "test-crash"
+
+    def enter_Name(self, node):
+        if node.id == "CRASH":
+            os._exit(1)
+
+@pytest.fixture
+def crash_rule():
+    """
+    Registers ``Crash`` for the test and returns its id, for ``select``.
+    Pool workers only know the rule when forked from the test process.
+    """
+    if multiprocessing.get_start_method() != "fork":
+        pytest.skip("worker processes are not forked")
+    registry = default_registry()
+    registry.register(Crash)
+    yield Crash.id
+    registry.rules.pop(Crash.id)
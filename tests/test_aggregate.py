@@ -0,0 +1,38 @@
+import io
+from codev_suite.analyzers.aggregate import RepoMetrics
+from codev_suite.analyzers.pipeline import AnalysisPipeline
+from codev_suite.visualization.metrics_viz import MetricsVisualizer
+
+def _branches(name, count):
+    body = "".join(f"    if x == {i}:\n        return {i}\n" for i in range(count))
+    return f"def {name}(x):\n{body}    return x\n"
+
+def _metrics():
+    pipeline = AnalysisPipeline()
+    metrics = RepoMetrics()
+    for index in range(20):
+        metrics.add(pipeline.run(_branches(f"f{index}", index), f"m{index}.py"))
+    metrics.add({"path": "broken.py", "error": "SyntaxError: invalid syntax"})
+    return metrics
+
+def test_percentiles_histogram_and_top_n():
+    metrics = _metrics()
+    assert (metrics.files, metrics.analyzed) == (21, 20)
+    assert metrics.percentiles("complexity", q=(0, 50, 100)) == {0: 1.0, 50: 10.5, 100: 20.0}
+    counts, edges = metrics.histogram("complexity")
+    assert counts.sum() == 20 and list(edges[:6]) == [1, 2, 3, 4, 5, 6]
+
+    hotspots = metrics.top_hotspots(3)
+    assert [(h["path"], h["complexity"], h["rank"]) for h in hotspots] == [
+        ("m19.py", 20, "C"), ("m18.py", 19, "C"), ("m17.py", 18, "C")]
+    assert [path for path, _ in metrics.top_files(2)] == ["m19.py", "m18.py"]
+
+def test_frames_and_repository_chart():
+    metrics = _metrics()
+    files = metrics.files_frame()
+    assert files.loc["m5.py", "max_complexity"] == 6 and len(files) == 20
+    blocks = metrics.blocks_frame()
+    assert blocks.groupby("path", observed=True)["complexity"].max().idxmax() == "m19.py"
+    image = io.BytesIO()
+    MetricsVisualizer.plot_repository_summary(metrics, image)
+    assert image.getvalue().startswith(b"\x89PNG")
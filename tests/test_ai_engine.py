@@ -0,0 +1,88 @@
+import threading
+import time
+from codev_suite.ai.engine import AIEngine, TokenBucket
+from codev_suite.core.cache import ResultCache
+
+class StubResponse:
+    def __init__(self, text):
+        self.text = text
+
+class StubModel:
+    """Local stand-in for the Gemini model; records calls and can fail on demand."""
+    def __init__(self, failures=0, delay=0.0):
+        self.calls = []
+        self.failures = failures
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def generate_content(self, prompt):
+        with self._lock:
+            self.calls.append(prompt)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            fail = self.failures > 0
+            self.failures -= 1
+        try:
+            time.sleep(self.delay)
+            if fail:
+                raise RuntimeError("quota exceeded")
+            return StubResponse(f"answer: {prompt}")
+        finally:
+            with self._lock:
+                self.active -= 1
+
+def make_engine(model, **kwargs):
+    kwargs.setdefault("requests_per_minute", 60000)
+    return AIEngine(api_key="unused", model=model, backoff=0.0, **kwargs)
+
+def test_batch_is_concurrent_and_ordered():
+    model = StubModel(delay=0.05)
+    engine = make_engine(model, max_concurrency=3)
+    prompts = [f"p{i}" for i in range(6)]
+    assert engine.batch(prompts) == [f"answer: {p}" for p in prompts]
+    assert model.peak == 3
+
+def test_batch_reports_progress():
+    engine = make_engine(StubModel())
+    updates = []
+    engine.batch(["a", "a", "b"], progress=lambda done, total: updates.append((done, total)))
+    assert updates[0] == (0, 3)
+    assert updates[-1] == (3, 3)
+
+def test_duplicate_and_cached_prompts_are_not_resent(tmp_path):
+    model = StubModel()
+    with ResultCache(str(tmp_path)) as cache:
+        engine = make_engine(model, cache=cache)
+        assert engine.batch(["a", "a", "b"]) == ["answer: a", "answer: a", "answer: b"]
+        assert engine.explain_code("x = 1").startswith("answer:")
+        engine.explain_code("x = 1")
+    assert sorted(model.calls[:2]) == ["a", "b"]
+    assert len(model.calls) == 3
+
+def test_retries_with_backoff_then_reports_error():
+    model = StubModel(failures=2)
+    assert make_engine(model, max_retries=2).complete("p") == "answer: p"
+
+    model = StubModel(failures=5)
+    result = make_engine(model, max_retries=1).complete("p")
+    assert result == "Error calling AI: quota exceeded"
+    assert len(model.calls) == 2
+
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=50, capacity=1)
+    start = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.09
+
+def test_burst_starts_without_waiting():
+    # One request per 10 seconds, but a full batch of workers starts at once.
+    model = StubModel(delay=0.05)
+    engine = make_engine(model, max_concurrency=4, requests_per_minute=6)
+    start = time.monotonic()
+    engine.batch([f"p{i}" for i in range(4)])
+    assert time.monotonic() - start < 1 and model.peak == 4
+
+    assert make_engine(model, max_concurrency=4, burst=2).rate_limiter.capacity == 2
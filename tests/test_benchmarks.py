@@ -0,0 +1,22 @@
+import ast
+from benchmarks.corpora import CORPORA
+from benchmarks.run import compare, run_benchmarks
+from codev_suite.core.discovery import iter_python_files
+
+def test_corpora_are_valid_python(tmp_path):
+    for name, generate in CORPORA.items():
+        generate(str(tmp_path / name), 1)
+        paths = list(iter_python_files(str(tmp_path / name)))
+        assert paths, name
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                ast.parse(f.read())
+
+def test_run_and_compare_flag_regressions(tmp_path):
+    results = run_benchmarks(str(tmp_path), repeat=1, corpora=["deep_nesting"],
+                             benchmarks=["structure", "build_graph"])
+    assert set(results) == {"deep_nesting/structure", "deep_nesting/build_graph"}
+
+    rows = compare({"a": 0.100, "b": 0.100, "c": 0.001}, {"a": 0.110, "b": 0.200, "c": 0.004, "d": 1.0})
+    assert [row["benchmark"] for row in rows if row["regression"]] == ["b"]
+    assert rows[-1]["baseline"] is None
@@ -0,0 +1,54 @@
+from codev_suite.core.cache import ResultCache
+from codev_suite.core.scanner import RepositoryScanner
+
+def test_cache_roundtrip_and_persistence(tmp_path):
+    with ResultCache(str(tmp_path)) as cache:
+        cache.set("k", {"smells": [1, 2]})
+        assert cache.get("k") == {"smells": [1, 2]}
+        assert cache.get("missing") is None
+
+    with ResultCache(str(tmp_path)) as cache:
+        assert cache.get("k") == {"smells": [1, 2]}
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    with ResultCache(str(tmp_path), max_bytes=100) as cache:
+        cache.set("old", "x" * 40)
+        cache.set("new", "y" * 40)
+        cache.get("old")
+        cache.flush()
+        cache.set("newest", "z" * 40)
+        assert cache.get("new") is None
+        assert cache.get("old") is not None
+        assert cache.get("newest") is not None
+
+def test_eviction_counts_entries_of_other_processes(tmp_path):
+    with ResultCache(str(tmp_path), max_bytes=100) as cache, ResultCache(str(tmp_path), max_bytes=100) as other:
+        cache.set("a", "x" * 40)
+        cache.set("b", "x" * 40)
+        cache.flush()
+        other.clear()
+        # This connection still counts "a" and "b"; the store only holds "c".
+        cache.set("c", "x" * 40)
+        assert cache.get("c") is not None
+
+        other.set("d", "y" * 40)
+        other.set("e", "y" * 40)
+        other.flush()
+        cache.flush()
+        cache.set("f", "z" * 40)
+        assert cache.get("c") is None and cache.get("d") is None
+        assert cache.get("e") is not None and cache.get("f") is not None
+
+def test_warm_scan_is_served_from_cache(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.py").write_text("def f():\n    return 1\n")
+    (src / "b.py").write_text("def f():\n    return 1\n")
+
+    with ResultCache(str(tmp_path / "cache")) as cache:
+        cold = {r["path"]: r for r in RepositoryScanner(str(src), jobs=1, cache=cache).scan()}
+        hits_before = cache.hits
+        warm = {r["path"]: r for r in RepositoryScanner(str(src), jobs=1, cache=cache).scan()}
+
+    assert cold == warm
+    assert cache.hits - hits_before == 2
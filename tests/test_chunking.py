@@ -0,0 +1,50 @@
+from codev_suite.ai.chunking import FunctionChunker, stitch_report
+from codev_suite.analyzers.pipeline import AnalysisPipeline
+
+SOURCE = (
+    "import os\n"
+    "\n"
+    "def simple(x):\n"
+    "    '''Adds one.'''\n"
+    "    return x + 1\n"
+    "\n"
+    "class Worker:\n"
+    "    def run(self, a, b, c, d, e, f):\n"
+    "        try:\n"
+    "            return a\n"
+    "        except:\n"
+    "            return b\n"
+)
+
+def test_selects_only_smelly_functions():
+    result = AnalysisPipeline().run(SOURCE)
+    chunker = FunctionChunker(SOURCE)
+    chunks = chunker.select(result["complexity"], result["smells"] + result["bugs"])
+
+    assert [c["qualname"] for c in chunks] == ["Worker.run"]
+    assert chunks[0]["source"].startswith("    def run(")
+    assert "simple" not in chunks[0]["source"]
+    assert {f["type"] for f in chunks[0]["findings"]} == {"Too Many Arguments", "Bare Except"}
+
+def test_outline_elides_bodies():
+    outline = FunctionChunker(SOURCE).outline()
+    assert "return x + 1" not in outline
+    assert "Adds one." in outline
+    assert "def run(self, a, b, c, d, e, f):" in outline
+
+def test_function_prompt_is_stable_when_code_shifts():
+    from codev_suite.ai.engine import AIEngine
+
+    engine = AIEngine(api_key="unused", model=object())
+    shifted = "# header\n\n" + SOURCE
+
+    def prompt(source):
+        result = AnalysisPipeline().run(source)
+        chunk = FunctionChunker(source).select(result["complexity"], result["smells"] + result["bugs"])[0]
+        return engine.function_prompt(chunk)
+
+    assert prompt(SOURCE) == prompt(shifted)
+
+def test_stitch_report():
+    chunks = [{"qualname": "f", "line": 1, "end_line": 3, "complexity": 12}]
+    assert stitch_report(chunks, [" ok "]) == "### f (lines 1-3, complexity 12)\n\nok"
@@ -0,0 +1,59 @@
+import ast
+from codev_suite.analyzers.coupling import CallGraph, import_cycles, module_coupling
+from codev_suite.analyzers.symbols import extract_symbols
+from codev_suite.visualization.graphs import DependencyGraphGenerator
+
+def test_extract_symbols_resolves_aliases_and_self():
+    source = (
+        "import pkg.util as u\n"
+        "from .helpers import clean\n"
+        "class Service:\n"
+        "    def run(self):\n"
+        "        self.step()\n"
+        "        u.fetch()\n"
+        "        obj.unknown()\n"
+        "    def step(self):\n"
+        "        clean(local())\n"
+        "def local():\n"
+        "    pass\n"
+    )
+    symbols = extract_symbols(ast.parse(source), "pkg.service")
+    assert symbols["defs"] == [
+        "pkg.service.Service", "pkg.service.Service.run", "pkg.service.Service.step", "pkg.service.local",
+    ]
+    assert sorted(map(tuple, symbols["calls"])) == [
+        ("pkg.service.Service.run", "pkg.service.Service.step"),
+        ("pkg.service.Service.run", "pkg.util.fetch"),
+        ("pkg.service.Service.step", "pkg.helpers.clean"),
+        ("pkg.service.Service.step", "pkg.service.local"),
+    ]
+
+def test_call_graph_updates_per_module():
+    calls = CallGraph()
+    calls.update("a", {"defs": ["a.f"], "calls": [["a.f", "b.g"], ["a.f", "len"]]})
+    calls.update("b", {"defs": ["b.g"], "calls": []})
+    assert calls.callees("a.f") == {"b.g"}
+    assert calls.most_called(cross_module=True) == [("b.g", 1)]
+    assert calls.module_edges() == {"a": {"b"}}
+
+    calls.remove("b")
+    assert calls.callees("a.f") == set()
+
+def test_cycles_and_coupling(tmp_path):
+    (tmp_path / "a.py").write_text("import b\n\ndef f():\n    b.g()\n")
+    (tmp_path / "b.py").write_text("import a\nimport os\n\ndef g():\n    pass\n")
+    (tmp_path / "c.py").write_text("from a import f\n\nf()\n")
+    generator = DependencyGraphGenerator(str(tmp_path))
+    generator.build_graph()
+
+    assert import_cycles(generator) == [["a", "b"]]
+    rows = {row["module"]: row for row in module_coupling(generator)}
+    assert rows["a"]["fan_in"] == 2 and rows["a"]["fan_out"] == 1
+    assert rows["b"]["external"] == 1
+    assert rows["c"]["instability"] == 1.0
+    assert generator.calls.callers("a.f") == {"c"}
+
+    saved = generator.save(str(tmp_path / "graph.json"))
+    loaded = DependencyGraphGenerator(str(tmp_path))
+    loaded.load(saved)
+    assert loaded.calls.callees("a.f") == {"b.g"}
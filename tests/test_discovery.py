@@ -0,0 +1,52 @@
+import os
+import pytest
+from codev_suite.core import discovery
+from codev_suite.core.discovery import (
+    FileTooLarge, GitIgnore, SourceDecodeError, iter_python_files, read_source,
+)
+from codev_suite.core.scanner import RepositoryScanner
+
+def _rel(root, paths):
+    return [os.path.relpath(path, root) for path in paths]
+
+def test_walk_honours_gitignore_files(tmp_path):
+    for rel_path in ("a.py", "gen/out.py", "pkg/keep.py", "pkg/skip_me.py", "pkg/sub/x.py",
+                     "pkg/sub/y_pb2.py", ".venv/lib.py", "docs/conf.py"):
+        (tmp_path / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel_path).write_text("x = 1\n")
+    (tmp_path / ".gitignore").write_text("# generated\n/gen/\nskip_*.py\n*_pb2.py\ndocs\n")
+    (tmp_path / "pkg" / "sub" / ".gitignore").write_text("!y_pb2.py\n")
+
+    assert _rel(tmp_path, iter_python_files(str(tmp_path))) == ["a.py", "pkg/keep.py", "pkg/sub/x.py", "pkg/sub/y_pb2.py"]
+    assert len(list(iter_python_files(str(tmp_path), gitignore=False))) == 7
+
+def test_gitignore_patterns():
+    ignore = GitIgnore(["/build", "**/cache/", "*.gen.py", "lib/**/tmp.py", "\\#odd.py"])
+    assert ignore.match("build") and not ignore.match("src/build")
+    assert ignore.match("a/b/cache", is_dir=True) and ignore.match("a/cache") is None
+    assert ignore.match("x/y.gen.py") and ignore.match("lib/tmp.py") and ignore.match("lib/a/b/tmp.py")
+    assert ignore.match("#odd.py")
+
+def test_read_source_limits_and_encodings(tmp_path, monkeypatch):
+    path = tmp_path / "m.py"
+    path.write_bytes(b"# -*- coding: latin-1 -*-\r\nname = '\xe9'\r\n")
+    assert read_source(str(path)) == "# -*- coding: latin-1 -*-\nname = '\xe9'\n"
+
+    # Large files go through mmap; a bad byte is reported with its offset.
+    monkeypatch.setattr(discovery, "MMAP_THRESHOLD", 16)
+    path.write_bytes(b"x = 1\n" * 10 + b"y = '\xff'\n")
+    with pytest.raises(SourceDecodeError, match="byte 65"):
+        read_source(str(path))
+    assert "�" in read_source(str(path), errors="replace")
+    with pytest.raises(FileTooLarge):
+        read_source(str(path), max_bytes=10)
+
+def test_scan_reports_oversized_and_undecodable_files(tmp_path):
+    (tmp_path / "pyproject.toml").write_text("[tool.codev]\nmax_file_bytes = 100\n")
+    (tmp_path / "big.py").write_text("x = 1\n" * 50)
+    (tmp_path / "bad.py").write_bytes(b"x = '\xff'\n")
+    (tmp_path / "ok.py").write_text("x = 1\n")
+    results = {r["path"]: r for r in RepositoryScanner(str(tmp_path), jobs=1).scan()}
+    assert results["big.py"]["error"].startswith("FileTooLarge")
+    assert results["bad.py"]["error"].startswith("SourceDecodeError")
+    assert "error" not in results["ok.py"]
@@ -0,0 +1,29 @@
+import json
+import pickle
+from codev_suite.analyzers.findings import Block, Finding, compact, json_default
+from codev_suite.analyzers.pipeline import AnalysisPipeline
+
+SOURCE = "def f(a, b, c, d, e, f, g):\n    if a == True:\n        return 1\n"
+
+def test_findings_behave_like_dicts():
+    result = AnalysisPipeline().run(SOURCE, "a.py")
+    smell, bug = result["smells"][0], result["bugs"][0]
+    assert isinstance(smell, Finding) and isinstance(result["complexity"][0], Block)
+    assert smell == {"type": "Too Many Arguments", "rule": "too-many-arguments", "name": "f", "line": 1,
+                     "details": "Function has 7 arguments (limit: 5)"}
+    assert list(bug) == ["type", "rule", "line", "details"]
+    assert bug["details"] == "Compare using 'if x:' or 'if not x:' instead of '== True'."
+    assert dict(result["complexity"][0], path="a.py")["rank"] == "A"
+
+def test_records_round_trip_through_json_and_pickle():
+    result = AnalysisPipeline().run(SOURCE, "a.py")
+    loaded = json.loads(json.dumps(result, default=json_default))
+    assert loaded["smells"] == result["smells"]
+    restored = compact(loaded)
+    assert isinstance(restored["bugs"][0], Finding) and restored == result
+    assert restored["smells"][0].rule == "too-many-arguments"
+
+    finding = Finding("Custom", 3, "{} > {}", (2, 1), extra={"severity": "high"}, rule="custom")
+    copy = pickle.loads(pickle.dumps(finding))
+    assert copy == {"type": "Custom", "rule": "custom", "severity": "high", "line": 3, "details": "2 > 1"}
+    assert copy.type is finding.type
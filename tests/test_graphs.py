@@ -0,0 +1,72 @@
+from codev_suite.visualization.graphs import DependencyGraphGenerator
+
+def _make_project(root):
+    (root / "app").mkdir()
+    (root / "app" / "__init__.py").write_text("")
+    (root / "app" / "models.py").write_text("import os\nimport requests.adapters\n")
+    (root / "app" / "views.py").write_text("from . import models\nfrom .models import User\nimport requests\n")
+    (root / "app" / "broken.py").write_text("def (\n")
+    (root / ".venv").mkdir()
+    (root / ".venv" / "lib.py").write_text("import app\n")
+
+def edge_labels(generator):
+    graph = generator.graph
+    return {(graph.nodes[s]["label"], graph.nodes[t]["label"]) for s, t in graph.edges()}
+
+def test_build_graph_resolves_imports(tmp_path):
+    _make_project(tmp_path)
+    generator = DependencyGraphGenerator(str(tmp_path))
+    generator.build_graph()
+
+    assert edge_labels(generator) == {
+        ("app.models", "os"),
+        ("app.models", "requests"),
+        ("app.views", "app.models"),
+        ("app.views", "requests"),
+    }
+    assert all(isinstance(node, int) for node in generator.graph.nodes)
+    assert generator.graph.nodes[generator.node_id("os")]["kind"] == "stdlib"
+    assert [path for path, _ in generator.errors] == ["app/broken.py"]
+
+def test_parallel_build_matches_serial(tmp_path):
+    _make_project(tmp_path)
+    serial = DependencyGraphGenerator(str(tmp_path))
+    serial.build_graph()
+    parallel = DependencyGraphGenerator(str(tmp_path), jobs=2, chunk_size=1)
+    parallel.build_graph()
+    assert edge_labels(serial) == edge_labels(parallel)
+
+def test_incremental_update_after_load(tmp_path):
+    _make_project(tmp_path)
+    generator = DependencyGraphGenerator(str(tmp_path))
+    generator.build_graph()
+    saved = generator.save(str(tmp_path / "graph.json"))
+
+    (tmp_path / "app" / "views.py").write_text("import json\n")
+    (tmp_path / "app" / "models.py").unlink()
+
+    updated = DependencyGraphGenerator(str(tmp_path))
+    updated.load(saved)
+    updated.build_graph(["app/views.py", "app/models.py"])
+    assert edge_labels(updated) == {("app.views", "json")}
+
+def test_incremental_build_re_resolves_importers(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "app.py").write_text("from pkg import new\nimport pkg.new.deep\n")
+    generator = DependencyGraphGenerator(str(tmp_path))
+    generator.build_graph()
+    assert edge_labels(generator) == {("app", "pkg")}
+
+    def full_rebuild():
+        rebuilt = DependencyGraphGenerator(str(tmp_path))
+        rebuilt.build_graph()
+        return edge_labels(rebuilt)
+
+    (tmp_path / "pkg" / "new.py").write_text("")
+    generator.build_graph(["pkg/new.py"])
+    assert edge_labels(generator) == full_rebuild() == {("app", "pkg.new")}
+
+    (tmp_path / "pkg" / "new.py").unlink()
+    generator.build_graph(["pkg/new.py"])
+    assert edge_labels(generator) == full_rebuild() == {("app", "pkg")}
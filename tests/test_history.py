@@ -0,0 +1,88 @@
+import sqlite3
+import pytest
+from codev_suite.analyzers.pipeline import AnalysisPipeline
+from codev_suite.core.history import INDEX_VERSION, AnalysisIndex
+
+def _source(branches):
+    body = "".join(f"        if x == {i}:\n            return {i}\n" for i in range(branches))
+    return (f"class A:\n    def run(self, x):\n{body}        return x\n\n"
+            f"class B:\n    def run(self, x):\n        return x\n")
+
+def _record(index, root, files, revision=None, removed=(), full=False):
+    pipeline = AnalysisPipeline()
+    return index.record(root, [pipeline.run(source, path) for path, source in files.items()],
+                        revision, removed, full)
+
+def test_complexity_trend_across_runs(tmp_path):
+    root = str(tmp_path)
+    with AnalysisIndex(str(tmp_path / "history.sqlite")) as index:
+        _record(index, root, {"a.py": _source(1), "b.py": _source(0)}, "r1")
+        _record(index, root, {"a.py": _source(4)}, "r2")
+        _record(index, root, {"a.py": _source(6), "b.py": _source(3)}, "r3")
+
+        runs = index.runs(root)
+        assert [(run["revision"], run["files"], run["tracked"]) for run in runs] == [
+            ("r1", 2, 2), ("r2", 1, 2), ("r3", 2, 2)]
+        # r2 only re-analyzed a.py; b.py counts with its r1 value.
+        mi = {n: AnalysisPipeline().run(_source(n))["maintainability"] for n in (0, 4)}
+        assert runs[1]["maintainability"] == pytest.approx((mi[4] + mi[0]) / 2)
+
+        rising = index.complexity_changes(root)
+        assert [(c["path"], c["symbol"], c["before"], c["after"]) for c in rising] == [
+            ("a.py", "A.run", 2, 7), ("b.py", "A.run", 1, 4)]
+        # Only the last two runs: a.py rose by 2, b.py was only seen once.
+        assert [(c["path"], c["delta"]) for c in index.complexity_changes(root, last=2)] == [("a.py", 2)]
+        assert [c["complexity"] for c in index.symbol_history(root, "a.py", "A.run")] == [2, 5, 7]
+        assert index.complexity_changes(str(tmp_path / "elsewhere")) == []
+
+def test_removed_files_drop_out_of_trends(tmp_path):
+    root = str(tmp_path)
+    with AnalysisIndex(str(tmp_path / "history.sqlite")) as index:
+        _record(index, root, {"a.py": _source(1)})
+        _record(index, root, {"a.py": _source(3)})
+        assert index.complexity_changes(root)[0]["delta"] == 2
+        _record(index, root, {}, removed=["a.py"])
+        assert index.complexity_changes(root) == []
+        assert index.projects() == [(index.project(root), 3)]
+
+def test_same_named_definitions_are_kept_apart(tmp_path):
+    root = str(tmp_path)
+    redefined = "if X:\n    def f(x):\n{}else:\n    def f(x):\n        return x\n"
+    with AnalysisIndex(str(tmp_path / "history.sqlite")) as index:
+        _record(index, root, {"a.py": redefined.format("        return x\n")})
+        _record(index, root, {"a.py": redefined.format("        if x:\n            return 1\n        return x\n")})
+        assert [(c["symbol"], c["lineno"], c["delta"]) for c in index.complexity_changes(root)] == [("f", 2, 1)]
+        assert [c["complexity"] for c in index.symbol_history(root, "a.py", "f", 1)] == [1, 1]
+
+def test_full_run_drops_files_it_did_not_see(tmp_path):
+    root = str(tmp_path)
+    with AnalysisIndex(str(tmp_path / "history.sqlite")) as index:
+        _record(index, root, {"a.py": _source(1), "b.py": _source(1)}, full=True)
+        _record(index, root, {"a.py": _source(1), "b.py": _source(5)}, full=True)
+        assert [c["path"] for c in index.complexity_changes(root)] == ["b.py"]
+        # b.py was deleted; a full run leaves it out.
+        _record(index, root, {"a.py": _source(1)}, full=True)
+        assert [run["tracked"] for run in index.runs(root)] == [2, 2, 1]
+        assert index.runs(root)[-1]["maintainability"] == AnalysisPipeline().run(_source(1))["maintainability"]
+        assert index.complexity_changes(root) == []
+
+def test_version_1_index_is_migrated(tmp_path):
+    path = str(tmp_path / "history.sqlite")
+    with sqlite3.connect(path) as conn:
+        conn.executescript(
+            "CREATE TABLE runs (id INTEGER PRIMARY KEY, root TEXT NOT NULL, started REAL NOT NULL,"
+            " revision TEXT, files INTEGER NOT NULL DEFAULT 0);"
+            "CREATE TABLE functions (run INTEGER NOT NULL, path TEXT NOT NULL, symbol TEXT NOT NULL,"
+            " type TEXT NOT NULL, lineno INTEGER NOT NULL, complexity INTEGER NOT NULL,"
+            " PRIMARY KEY (path, symbol, run)) WITHOUT ROWID;"
+            "CREATE INDEX functions_run ON functions (run);"
+        )
+        conn.execute("INSERT INTO runs VALUES (1, ?, 0, NULL, 1)", (AnalysisIndex.project(str(tmp_path)),))
+        conn.execute("INSERT INTO functions VALUES (1, 'a.py', 'A.run', 'Method', 2, 2)")
+    conn.close()
+
+    with AnalysisIndex(path) as index:
+        _record(index, str(tmp_path), {"a.py": _source(3)})
+        assert [c["complexity"] for c in index.symbol_history(str(tmp_path), "a.py", "A.run")] == [2, 4]
+    with AnalysisIndex(path) as index:
+        assert index._conn.execute("PRAGMA user_version").fetchone()[0] == INDEX_VERSION
@@ -0,0 +1,33 @@
+import subprocess
+import sys
+
+# Budget for `import codev_suite.cli.main`, measured like `python -X importtime`.
+# Generous enough for slow CI machines; the lazy imports keep it ~10x lower.
+IMPORT_BUDGET_US = 800_000
+
+HEAVY_MODULES = ("networkx", "matplotlib", "google.generativeai", "dotenv", "pandas", "plotly")
+
+def import_profile(module):
+    """
+    Returns {module: cumulative microseconds} as reported by -X importtime.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    profile = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+def test_cli_does_not_import_heavy_subsystems():
+    profile = import_profile("codev_suite.cli.main")
+    loaded = [m for m in profile if any(m == h or m.startswith(h + ".") for h in HEAVY_MODULES)]
+    assert loaded == []
+
+def test_cli_import_time_budget():
+    best = min(import_profile("codev_suite.cli.main")["codev_suite.cli.main"] for _ in range(3))
+    assert best < IMPORT_BUDGET_US, f"CLI import took {best / 1000:.0f} ms"
@@ -0,0 +1,47 @@
+import subprocess
+from codev_suite.core.incremental import (
+    git_changed_files, load_report, merge_results, module_name, reverse_dependents,
+    select_changed, write_report,
+)
+
+def test_module_name():
+    assert module_name("pkg/mod.py") == "pkg.mod"
+    assert module_name("pkg/__init__.py") == "pkg"
+
+def test_reverse_dependents():
+    imports = {
+        "pkg/core.py": ["os"],
+        "pkg/api.py": ["pkg.core"],
+        "app.py": ["pkg.api"],
+        "tools.py": ["json"],
+    }
+    assert reverse_dependents(["pkg/core.py"], imports) == {"pkg/api.py"}
+    assert reverse_dependents(["pkg/core.py"], imports, transitive=True) == {"pkg/api.py", "app.py"}
+
+def test_select_changed_splits_deleted_and_adds_dependents(tmp_path):
+    (tmp_path / "a.py").write_text("x = 1\n")
+    (tmp_path / "b.py").write_text("import a\n")
+    targets, removed = select_changed(str(tmp_path), ["a.py", "gone.py"], dependents=True)
+    assert targets == ["a.py", "b.py"]
+    assert removed == ["gone.py"]
+
+def test_report_roundtrip_and_merge(tmp_path):
+    path = str(tmp_path / "report.json")
+    write_report(path, [{"path": "a.py", "smells": []}, {"path": "b.py", "smells": []}])
+    baseline = load_report(path)
+    merged = merge_results(baseline, [{"path": "a.py", "smells": [1]}], removed=["b.py"])
+    assert merged == {"a.py": {"path": "a.py", "smells": [1]}}
+
+def test_git_changed_files(tmp_path):
+    def git(*args):
+        subprocess.run(["git", "-C", str(tmp_path), *args], check=True, capture_output=True)
+
+    git("init", "-q")
+    (tmp_path / "a.py").write_text("x = 1\n")
+    (tmp_path / "b.py").write_text("y = 1\n")
+    git("add", ".")
+    git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "init")
+    (tmp_path / "a.py").write_text("x = 2\n")
+    (tmp_path / "c.py").write_text("z = 1\n")
+    (tmp_path / "notes.txt").write_text("ignored\n")
+    assert git_changed_files(str(tmp_path), "HEAD") == ["a.py", "c.py"]
@@ -0,0 +1,39 @@
+from codev_suite.core.graph_algorithms import longest_path_layers, strongly_connected_components
+from codev_suite.visualization.layout import clustered_layout, collapse, hierarchical_layout
+
+NAMES = {0: "app.api.views", 1: "app.api.urls", 2: "app.models", 3: "app.db"}
+EDGES = {0: {2}, 1: {0}, 2: {3}, 3: {2}}
+
+def test_strongly_connected_components():
+    components = sorted(sorted(c) for c in strongly_connected_components(NAMES, EDGES))
+    assert components == [[0], [1], [2, 3]]
+
+def test_layers_put_importers_above_imports():
+    layers = longest_path_layers(list(NAMES), EDGES)
+    assert layers[1] > layers[0] > layers[2] == layers[3]
+
+def test_hierarchical_layout_positions_every_node():
+    pos = hierarchical_layout(NAMES, EDGES)
+    assert set(pos) == set(NAMES)
+    assert pos[1][1] > pos[0][1] > pos[2][1]
+
+def test_collapse_to_packages():
+    names, edges, sizes = collapse(NAMES, EDGES, depth=2)
+    by_name = {name: node for node, name in names.items()}
+    assert set(by_name) == {"app.api", "app.models", "app.db"}
+    assert edges[by_name["app.api"]] == {by_name["app.models"]}
+    assert sizes[by_name["app.api"]] == 2
+
+def test_clustered_layout_groups_packages():
+    pos = clustered_layout(NAMES, depth=2)
+    assert set(pos) == set(NAMES)
+
+def test_large_graph_render(tmp_path):
+    from codev_suite.visualization.graphs import DependencyGraphGenerator
+
+    for i in range(150):
+        (tmp_path / f"m{i}.py").write_text(f"import m{(i + 1) % 150}\nimport os\n")
+    generator = DependencyGraphGenerator(str(tmp_path))
+    generator.build_graph()
+    for name in ("g.png", "g.svg", "g.html"):
+        assert (tmp_path / generator.visualize(str(tmp_path / name))).exists()
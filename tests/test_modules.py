@@ -0,0 +1,27 @@
+from codev_suite.core.modules import ImportRef, ModuleIndex, module_name, root_package
+
+INDEX = ModuleIndex(["pkg", "pkg.core", "pkg.sub", "pkg.sub.helpers", "src.lib"])
+
+def test_module_name():
+    assert module_name("pkg/sub/helpers.py") == "pkg.sub.helpers"
+    assert module_name("pkg/__init__.py") == "pkg"
+
+def test_resolve_relative_imports():
+    # from . import helpers  (inside pkg/sub/__init__.py)
+    assert INDEX.resolve("pkg.sub", True, ImportRef(None, ("helpers",), 1)) == (["pkg.sub.helpers"], None)
+    # from ..core import thing  (inside pkg/sub/helpers.py)
+    assert INDEX.resolve("pkg.sub.helpers", False, ImportRef("core", ("thing",), 2)) == (["pkg.core"], None)
+    # from . import missing  -> unresolvable, but never external
+    assert INDEX.resolve("pkg.core", False, ImportRef(None, ("missing",), 1)) == (["pkg"], None)
+
+def test_resolve_absolute_and_external_imports():
+    assert INDEX.resolve("pkg.core", False, ImportRef("pkg.sub.helpers", (), 0)) == (["pkg.sub.helpers"], None)
+    assert INDEX.resolve("pkg.core", False, ImportRef("pkg", ("sub",), 0)) == (["pkg.sub"], None)
+    assert INDEX.resolve("pkg.core", False, ImportRef("lib", ("x",), 0)) == (["src.lib"], None)
+    assert INDEX.resolve("pkg.core", False, ImportRef("numpy.linalg", (), 0)) == ([], "numpy")
+
+def test_root_package(tmp_path):
+    (tmp_path / "proj" / "pkg").mkdir(parents=True)
+    (tmp_path / "proj" / "pkg" / "__init__.py").write_text("")
+    assert root_package(str(tmp_path / "proj")) == ""
+    assert root_package(str(tmp_path / "proj" / "pkg")) == "pkg"
@@ -19,3 +19,53 @@ def test_imports():
     
     assert "os" in structure["imports"]
     assert "datetime" in structure["imports"]
+
+def test_nested_scopes_and_async():
+    code = (
+        "class Outer:\n"
+        "    class Inner:\n"
+        "        async def run(self):\n"
+        "            def helper():\n"
+        "                pass\n"
+        "    def method(self):\n"
+        "        pass\n"
+        "\n"
+        "async def fetch():\n"
+        "    def inner():\n"
+        "        pass\n"
+    )
+    parser = CodeParser(source_code=code)
+    structure = parser.get_structure()
+
+    classes = {c["qualname"]: c for c in structure["classes"]}
+    assert set(classes) == {"Outer", "Outer.Inner"}
+    assert classes["Outer"]["methods"] == ["method"]
+    assert classes["Outer.Inner"]["methods"] == ["run"]
+
+    functions = {f["qualname"]: f for f in structure["functions"]}
+    assert set(functions) == {"fetch", "fetch.inner", "Outer.Inner.run.helper"}
+    assert functions["fetch"]["async"] is True
+    assert functions["fetch.inner"]["async"] is False
+
+def test_get_structure_scales_linearly():
+    import time
+
+    def build(n):
+        return "\n".join(
+            f"class C{i}:\n    def m(self):\n        def f():\n            pass\n"
+            for i in range(n)
+        )
+
+    def best_time(code):
+        best = float("inf")
+        for _ in range(3):
+            parser = CodeParser(source_code=code)
+            parser.parse()
+            start = time.perf_counter()
+            parser.get_structure()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    small, large = best_time(build(500)), best_time(build(4000))
+    # 8x the input; a quadratic implementation would be ~64x slower.
+    assert large / small < 20
@@ -0,0 +1,48 @@
+from codev_suite.analyzers.pipeline import AnalysisPipeline
+from codev_suite.analyzers.smells import CodeSmellDetector
+from codev_suite.analyzers.bugs import BugDetector
+from radon.metrics import h_visit, mi_visit
+import ast
+
+SAMPLE = (
+    "def f(a, b, c, d, e, g):\n"
+    "    if a:\n"
+    "        if b:\n"
+    "            if c:\n"
+    "                if d == True:\n"
+    "                    return 1\n"
+    "    try:\n"
+    "        return 2\n"
+    "        print('never')\n"
+    "    except:\n"
+    "        pass\n"
+)
+
+def test_pipeline_matches_separate_analyzers():
+    result = AnalysisPipeline().run(SAMPLE)
+    tree = ast.parse(SAMPLE)
+
+    assert result["smells"] == CodeSmellDetector().check(tree)
+    assert result["bugs"] == BugDetector().check(tree)
+    assert result["maintainability"] == mi_visit(SAMPLE, multi=False)
+    assert result["halstead"]["volume"] == h_visit(SAMPLE).total.volume
+    assert [b["name"] for b in result["complexity"]] == ["f"]
+
+def test_pipeline_parses_once(monkeypatch):
+    calls = []
+    original = ast.parse
+
+    def counting_parse(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(ast, "parse", counting_parse)
+    AnalysisPipeline().run(SAMPLE)
+    assert len(calls) == 1
+
+def test_detectors_find_expected_rules():
+    tree = ast.parse(SAMPLE)
+    smells = {s["type"] for s in CodeSmellDetector().check(tree)}
+    bugs = {b["type"] for b in BugDetector().check(tree)}
+    assert smells == {"Too Many Arguments", "Deeply Nested Code"}
+    assert bugs == {"Boolean Comparison", "Bare Except"}
@@ -0,0 +1,47 @@
+import pytest
+from codev_suite.analyzers.pipeline import AnalysisPipeline
+from codev_suite.analyzers.prefilter import needs_analysis, screenable
+from codev_suite.analyzers.rules import Rule
+
+TRIVIAL = '''"""Package docstring with def, if x == 1: and a-b."""
+from . import models  # re-exported: class Model, a + b
+from .views import *
+import os.path as osp, sys
+
+__all__ = ["models", 'osp']
+VERSION = (1, 2, 3)
+TABLE = {"a": [1, 2.5e3], "b": r"\\d+ if not", "c": b'\\x00'}
+'''
+
+@pytest.mark.parametrize("snippet", [
+    "def f(): pass", "class A: pass", "x = y if z else w", "x = -1", "x = a == b", "x = not y",
+    "x = [i for i in y]", "x = lambda: 0", "x = f'{a}'", "x = rf'{a}'", "x += 1", "try:\n    pass\nfinally:\n    pass",
+    "with x:\n    pass", "x = a is None", "x = a and b", "@d\ndef f(): pass",
+])
+def test_screen_flags_anything_with_blocks_operators_or_branches(snippet):
+    assert not needs_analysis(TRIVIAL)
+    assert needs_analysis(TRIVIAL + snippet + "\n")
+
+@pytest.mark.parametrize("source", [
+    '"""\\\nModule docstring.\n"""\nLIMIT = 10 - 1\nNAME = """x"""\n',
+    "X = 'a\\\nb ' ; Y = 1 - 2 ; Z = 'c'\n",
+])
+def test_backslash_newline_in_strings_does_not_hide_code(source):
+    assert needs_analysis(source)
+    assert AnalysisPipeline().run(source, "a.py") == AnalysisPipeline({"prefilter": False}).run(source, "a.py")
+
+def test_trivial_files_get_exact_results():
+    fast, strict = AnalysisPipeline(), AnalysisPipeline({"prefilter": False})
+    assert fast.prefilter and not strict.prefilter
+    assert fast.fingerprint() != strict.fingerprint()
+    assert fast.run(TRIVIAL, "pkg/__init__.py") == strict.run(TRIVIAL, "pkg/__init__.py")
+    with pytest.raises(SyntaxError):
+        fast.run("X = (\n", "broken.py")
+
+    class AssignRule(Rule):
+        id = "assign"
+
+        def enter_Assign(self, node):
+            pass
+
+    assert screenable(fast.rules) and not screenable(fast.rules + [AssignRule()])
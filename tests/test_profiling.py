@@ -0,0 +1,33 @@
+import json
+from codev_suite.analyzers.pipeline import AnalysisPipeline
+from codev_suite.core.profiling import FILE, NULL_SPAN, RULE, STAGE, Profiler, span
+from codev_suite.core.scanner import RepositoryScanner
+
+SOURCE = "def f(a):\n    if a == True:\n        return 1\n    return 2\n"
+
+def test_spans_are_free_without_profiler():
+    assert span("parse") is NULL_SPAN
+
+def test_pipeline_reports_stage_and_rule_spans():
+    pipeline = AnalysisPipeline()
+    with Profiler(memory=True) as profiler:
+        result = pipeline.run(SOURCE, "a.py")
+    assert [b["type"] for b in result["bugs"]] == ["Boolean Comparison"]
+    stages = {name for name, _, _ in profiler.totals(STAGE)}
+    assert {"parse", "rules", "metrics.complexity"} <= stages
+    # Only rules whose handlers ran are timed; this source has no except.
+    rules = {name for name, _, _ in profiler.totals(RULE)}
+    assert "boolean-comparison" in rules and "bare-except" not in rules
+    assert rules <= {rule.id for rule in pipeline.rules}
+    assert all("alloc_bytes" in event["args"] for event in profiler.events if event["cat"] == STAGE)
+
+def test_scan_merges_worker_events_into_trace(tmp_path):
+    for name in ("a.py", "b.py"):
+        (tmp_path / name).write_text(SOURCE)
+    with Profiler() as profiler:
+        list(RepositoryScanner(str(tmp_path), jobs=2, chunk_size=1).scan())
+    assert sorted(event["name"] for event in profiler.slowest(FILE)) == ["a.py", "b.py"]
+
+    trace = json.loads(open(profiler.write_chrome_trace(str(tmp_path / "trace.json"))).read())
+    assert {event["ph"] for event in trace["traceEvents"]} == {"X"}
+    assert {event["cat"] for event in trace["traceEvents"]} == {FILE, STAGE, RULE}
@@ -0,0 +1,51 @@
+import ast
+import pytest
+from codev_suite.analyzers.pipeline import AnalysisPipeline
+from codev_suite.analyzers.rules import BUG, Rule, RuleRegistry, load_config, run_rules
+from codev_suite.core.scanner import RepositoryScanner
+
+SOURCE = "def f(a, b, c, d, e, f, g):\n    if x == True:\n        pass\n"
+
+def test_config_disables_rules_and_sets_options():
+    default = AnalysisPipeline().run(SOURCE)
+    assert [s["type"] for s in default["smells"]] == ["Too Many Arguments"]
+    assert [b["type"] for b in default["bugs"]] == ["Boolean Comparison"]
+
+    config = {"disable": ["boolean-comparison"], "rules": {"too-many-arguments": {"max_args": 7}}}
+    pipeline = AnalysisPipeline(config)
+    result = pipeline.run(SOURCE)
+    assert result["smells"] == [] and result["bugs"] == []
+    assert "boolean-comparison" not in {rule.id for rule in pipeline.rules}
+    assert pipeline.fingerprint() != AnalysisPipeline().fingerprint()
+
+def test_unknown_rules_and_options_are_rejected():
+    with pytest.raises(ValueError):
+        AnalysisPipeline({"disable": ["no-such-rule"]})
+    with pytest.raises(ValueError):
+        AnalysisPipeline({"rules": {"long-method": {"max_lines": 10}}})
+
+def test_custom_rules_share_one_walk():
+    registry = RuleRegistry()
+
+    @registry.register
+    class NoPrint(Rule):
+        id = "no-print"
+        name = "Print Call"
+        category = BUG
+
+        def enter_Call(self, node):
+            if isinstance(node.func, ast.Name) and node.func.id == "print":
+                self.report(node.lineno, "Use logging instead of print().")
+
+    findings = run_rules(registry.create(), ast.parse("print(1)\n"))
+    assert findings[BUG] == [{"type": "Print Call", "rule": "no-print", "line": 1, "details": "Use logging instead of print()."}]
+    assert registry.create({"disable": ["no-print"]}) == []
+
+def test_project_config_from_pyproject(tmp_path):
+    (tmp_path / "pyproject.toml").write_text('[tool.codev]\ndisable = ["too-many-arguments"]\n')
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text(SOURCE)
+    assert load_config(str(tmp_path / "pkg")) == {"disable": ["too-many-arguments"]}
+
+    result = next(RepositoryScanner(str(tmp_path), jobs=1).scan())
+    assert result["smells"] == []
@@ -0,0 +1,65 @@
+from codev_suite.core.scanner import RepositoryScanner, ScanSummary
+
+def _make_tree(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "good.py").write_text("def f(x):\n    if x:\n        return 1\n    return 2\n")
+    (tmp_path / "pkg" / "other.py").write_text("import os\n")
+    (tmp_path / "broken.py").write_text("def (\n")
+    (tmp_path / ".venv").mkdir()
+    (tmp_path / ".venv" / "ignored.py").write_text("x = 1\n")
+
+def test_scan_isolates_bad_files(tmp_path):
+    _make_tree(tmp_path)
+    results = {r["path"]: r for r in RepositoryScanner(str(tmp_path), jobs=1).scan()}
+
+    assert set(results) == {"broken.py", "pkg/good.py", "pkg/other.py"}
+    assert "SyntaxError" in results["broken.py"]["error"]
+    assert results["pkg/good.py"]["complexity"][0]["complexity"] == 2
+
+def test_parallel_scan_matches_serial(tmp_path):
+    _make_tree(tmp_path)
+    serial = {r["path"]: r for r in RepositoryScanner(str(tmp_path), jobs=1).scan()}
+    parallel = {r["path"]: r for r in RepositoryScanner(str(tmp_path), jobs=2, chunk_size=1).scan()}
+    assert serial == parallel
+
+def test_summary_aggregates(tmp_path):
+    _make_tree(tmp_path)
+    summary = ScanSummary(top=1)
+    for result in RepositoryScanner(str(tmp_path), jobs=1).scan():
+        summary.add(result)
+    assert summary.files == 3
+    assert summary.analyzed == 2
+    assert [h["name"] for h in summary.top_hotspots()] == ["f"]
+
+def test_timeout_keeps_partial_results(tmp_path, monkeypatch):
+    import time
+    from codev_suite.analyzers.metrics import MetricsAnalyzer
+
+    _make_tree(tmp_path)
+    monkeypatch.setattr(MetricsAnalyzer, "analyze_halstead", lambda self: time.sleep(5))
+    scanner = RepositoryScanner(str(tmp_path), jobs=1, config={"file_timeout": 0.2, "prefilter": False})
+    started = time.perf_counter()
+    results = {r["path"]: r for r in scanner.scan()}
+
+    assert time.perf_counter() - started < 3
+    good = results["pkg/good.py"]
+    assert "AnalysisTimeout during metrics.halstead" in good["error"]
+    assert good["complexity"][0]["name"] == "f" and "halstead" not in good
+    summary = ScanSummary()
+    for result in results.values():
+        summary.add(result)
+    assert summary.analyzed == 0 and len(summary.errors) == 3
+
+def test_worker_that_dies_is_reported(tmp_path, crash_rule):
+    _make_tree(tmp_path)
+    (tmp_path / "pkg" / "crash.py").write_text("CRASH\n")
+    (tmp_path / "pkg" / "crash_too.py").write_text("CRASH = 1\n")
+    for i in range(8):
+        (tmp_path / f"mod{i}.py").write_text(f"def f{i}(x):\n    return x\n")
+    scanner = RepositoryScanner(str(tmp_path), jobs=2, chunk_size=4, config={"select": [crash_rule]})
+    results = {r["path"]: r for r in scanner.scan()}
+
+    assert len(results) == 13
+    crashed = {path for path, result in results.items() if result.get("error", "").startswith("WorkerExited")}
+    assert crashed == {"pkg/crash.py", "pkg/crash_too.py"}
+    assert "error" not in results["pkg/good.py"] and "error" not in results["mod7.py"]
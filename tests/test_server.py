@@ -0,0 +1,86 @@
+import json
+import os
+import signal
+import threading
+import urllib.error
+import urllib.request
+import pytest
+from concurrent.futures.process import BrokenProcessPool
+from codev_suite.server.service import AnalysisServer, AnalysisService, BatchTooLarge, Overloaded, _warm_up
+
+@pytest.fixture
+def service(tmp_path):
+    with AnalysisService(jobs=1, cache_dir=str(tmp_path)) as service:
+        yield service
+
+@pytest.fixture
+def server(service):
+    with AnalysisServer(("127.0.0.1", 0), service, quiet=True) as httpd:
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+        httpd.shutdown()
+
+def request(url, payload=None, data=None):
+    if payload is not None:
+        data = json.dumps(payload).encode()
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=data)) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+def test_analyze_single_and_batch(server):
+    status, result = request(server + "/analyze", {"source": "def f(x):\n    return x\n", "path": "a.py"})
+    assert status == 200
+    assert result["path"] == "a.py"
+    assert result["complexity"][0]["name"] == "f"
+
+    status, body = request(server + "/analyze", {"files": [
+        {"source": "x = 1\n", "path": "b.py"},
+        {"source": "def (\n", "path": "c.py"},
+    ]})
+    assert status == 200
+    assert [r["path"] for r in body["results"]] == ["b.py", "c.py"]
+    assert "error" in body["results"][1]
+
+def test_rejects_bad_requests(server):
+    assert request(server + "/analyze", data=b"{not json")[0] == 400
+    assert request(server + "/analyze", {"source": "def (\n"})[0] == 422
+    assert request(server + "/nope", {})[0] == 404
+    status, health = request(server + "/health")
+    assert status == 200 and health["workers"] == 1
+
+def test_backpressure(tmp_path):
+    # Not started, so nothing is dispatched and submitted files stay pending.
+    service = AnalysisService(jobs=1, use_cache=False, max_pending=1)
+    try:
+        with pytest.raises(BatchTooLarge):
+            service.submit_many([("x = 1\n", "a.py"), ("y = 2\n", "b.py")])
+        service.submit("x = 1\n", "a.py")
+        with pytest.raises(Overloaded):
+            service.submit("y = 2\n", "b.py")
+    finally:
+        service.close()
+
+def test_oversized_batch_is_rejected(server):
+    files = [{"source": "x = 1\n", "path": f"{i}.py"} for i in range(300)]
+    status, body = request(server + "/analyze", {"files": files})
+    assert status == 413 and "at most 256" in body["error"]
+
+def test_survives_a_dead_worker(service, server):
+    os.kill(service._pool.submit(_warm_up).result(), signal.SIGKILL)
+    with pytest.raises(BrokenProcessPool):
+        service._pool.submit(_warm_up).result(timeout=10)
+
+    status, result = request(server + "/analyze", {"source": "def f(x):\n    return x\n", "path": "a.py"})
+    assert status == 200 and result["complexity"][0]["name"] == "f"
+    assert service.pending == 0
+
+def test_file_that_ends_its_worker_is_reported(crash_rule):
+    with AnalysisService(jobs=1, use_cache=False, config={"select": [crash_rule]}) as service:
+        crash, good = service.submit_many([("CRASH\n", "crash.py"), ("x = y\n", "good.py")])
+        assert crash.result(timeout=30)["error"].startswith("WorkerExited")
+        assert "error" not in good.result(timeout=30)
+        assert "error" not in service.submit("z = 1\n", "next.py").result(timeout=30)
+        assert service.pending == 0
@@ -0,0 +1,43 @@
+import io
+import zipfile
+import pytest
+from codev_suite.web.uploads import UploadError, extract_zip, project_root, save_uploads
+
+def make_zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    buffer.seek(0)
+    return buffer
+
+def test_extract_zip_keeps_python_sources(tmp_path):
+    archive = make_zip({
+        "proj-main/app/__init__.py": "",
+        "proj-main/app/views.py": "import os\n",
+        "proj-main/README.md": "# readme",
+        "proj-main/.venv/lib.py": "x = 1\n",
+    })
+    extracted = extract_zip(archive, str(tmp_path))
+    assert sorted(extracted) == ["proj-main/app/__init__.py", "proj-main/app/views.py"]
+    assert (tmp_path / "proj-main" / "app" / "views.py").read_text() == "import os\n"
+    assert project_root(str(tmp_path)) == str(tmp_path / "proj-main")
+
+@pytest.mark.parametrize("name", ["../evil.py", "/etc/evil.py", "a/../../evil.py", "C:/evil.py"])
+def test_extract_zip_rejects_zip_slip(tmp_path, name):
+    with pytest.raises(UploadError):
+        extract_zip(make_zip({name: "x = 1\n"}), str(tmp_path / "out"))
+    assert not (tmp_path / "evil.py").exists()
+
+def test_extract_zip_enforces_limits(tmp_path):
+    archive = make_zip({"a.py": "x" * 1000, "b.py": "y" * 1000})
+    with pytest.raises(UploadError):
+        extract_zip(archive, str(tmp_path), max_bytes=1500)
+    with pytest.raises(UploadError):
+        extract_zip(archive, str(tmp_path), max_files=1)
+
+def test_save_uploads_preserves_directories(tmp_path):
+    upload = io.BytesIO(b"import json\n")
+    upload.name = "pkg/mod.py"
+    assert save_uploads([upload], str(tmp_path)) == ["pkg/mod.py"]
+    assert (tmp_path / "pkg" / "mod.py").read_bytes() == b"import json\n"
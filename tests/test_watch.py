@@ -0,0 +1,68 @@
+import os
+import pytest
+from codev_suite.core.watch import PollingWatcher, WorkspaceState, new_findings
+
+def bump(path, text):
+    path.write_text(text)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+def test_polling_watcher_reports_changes(tmp_path):
+    (tmp_path / "a.py").write_text("x = 1\n")
+    (tmp_path / "b.py").write_text("y = 1\n")
+    watcher = PollingWatcher(str(tmp_path), interval=0.01)
+    assert watcher.wait(timeout=0) == set()
+
+    bump(tmp_path / "a.py", "x = 2\n")
+    (tmp_path / "b.py").unlink()
+    (tmp_path / "c.py").write_text("z = 1\n")
+    assert watcher.wait(timeout=1) == {"a.py", "b.py", "c.py"}
+
+def test_notify_watcher_reports_saves(tmp_path):
+    pytest.importorskip("watchdog")
+    from codev_suite.core.watch import NotifyWatcher
+
+    watcher = NotifyWatcher(str(tmp_path))
+    try:
+        (tmp_path / "a.py").write_text("x = 1\n")
+        (tmp_path / "notes.txt").write_text("ignored")
+        assert watcher.wait(timeout=5) == {"a.py"}
+    finally:
+        watcher.close()
+
+def test_workspace_updates_incrementally(tmp_path):
+    (tmp_path / "a.py").write_text("import b\n")
+    (tmp_path / "b.py").write_text("def f():\n    pass\n")
+    state = WorkspaceState(str(tmp_path), jobs=1).load()
+    assert set(state.results) == {"a.py", "b.py"}
+
+    # Saving identical content does not re-run anything.
+    assert state.update(["b.py"])["analyzed"] == {}
+
+    (tmp_path / "b.py").write_text("import a\n\ndef f():\n    try:\n        pass\n    except:\n        pass\n")
+    update = state.update(["b.py"])
+    previous, current = update["analyzed"]["b.py"]
+    assert [f["type"] for f in new_findings(previous, current)] == ["Bare Except"]
+    assert update["cycles"] == [["a", "b"]]
+
+    (tmp_path / "a.py").unlink()
+    update = state.update(["a.py"])
+    assert update["removed"] == ["a.py"]
+    assert update["cycles"] == []
+    assert set(state.results) == {"b.py"}
+
+def test_workspace_resolves_a_new_module_already_imported(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "app.py").write_text("from pkg import new\n")
+    state = WorkspaceState(str(tmp_path), jobs=1).load()
+    assert state.cycles == []
+
+    # The new module imports app back: a cycle only if app.py's import is
+    # re-resolved to pkg.new, though app.py itself did not change.
+    (tmp_path / "pkg" / "new.py").write_text("import app\n")
+    update = state.update(["pkg/new.py"])
+    assert update["cycles"] == [["app", "pkg.new"]]
+
+    (tmp_path / "pkg" / "new.py").unlink()
+    assert state.update(["pkg/new.py"])["cycles"] == []
@@ -0,0 +1,22 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+from codev_suite.visualization.metrics_viz import MetricsVisualizer
+from codev_suite.web.jobs import start_job
+
+def test_job_reports_progress_and_result():
+    def work(job, n):
+        for i in range(n):
+            job.update(i + 1, n, "working")
+        return n * 2
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        job = start_job(pool, "double", work, 4)
+        assert job.result() == 8
+    assert job.done()
+    assert job.fraction == 1.0
+    assert job.message == "working"
+
+def test_charts_render_to_memory():
+    buffer = io.BytesIO()
+    MetricsVisualizer.plot_complexity_distribution([{"name": "f", "complexity": 3}], buffer)
+    assert buffer.getvalue().startswith(b"\x89PNG")
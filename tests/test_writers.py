@@ -0,0 +1,47 @@
+import io
+import json
+from codev_suite.analyzers.pipeline import AnalysisPipeline
+from codev_suite.reporting.writers import JsonReportWriter, NdjsonReportWriter, SarifReportWriter
+
+RESULTS = [
+    {"path": "a.py", "smells": [{"type": "Long Method", "rule": "long-method", "line": 3, "details": "too long"}],
+     "bugs": [{"type": "Bare Except", "rule": "bare-except", "line": 9, "details": "bare"}]},
+    {"path": "b.py", "error": "SyntaxError: invalid syntax"},
+]
+
+def render(writer_cls):
+    stream = io.StringIO()
+    with writer_cls(stream) as writer:
+        for result in RESULTS:
+            writer.write(result)
+    return stream.getvalue()
+
+def test_json_and_ndjson_writers():
+    assert json.loads(render(JsonReportWriter))["files"] == RESULTS
+    assert [json.loads(line) for line in render(NdjsonReportWriter).splitlines()] == RESULTS
+
+def test_empty_json_report_is_valid():
+    stream = io.StringIO()
+    with JsonReportWriter(stream):
+        pass
+    assert json.loads(stream.getvalue()) == {"version": 1, "files": []}
+
+def test_sarif_writer():
+    log = json.loads(render(SarifReportWriter))
+    run = log["runs"][0]
+    assert log["version"] == "2.1.0"
+    assert [(r["ruleId"], r["level"]) for r in run["results"]] == [("long-method", "note"), ("bare-except", "warning")]
+    assert run["results"][1]["locations"][0]["physicalLocation"]["region"]["startLine"] == 9
+    assert run["invocations"][0]["executionSuccessful"] is False
+    assert {"id": "bare-except", "name": "Bare Except", "shortDescription": {"text": "Bare Except"},
+            "defaultConfiguration": {"level": "warning"}} in run["tool"]["driver"]["rules"]
+
+def test_sarif_rule_ids_come_from_the_registry():
+    source = "def f(a, b, c, d, e, f, g):\n    if a:\n        if b:\n            if c:\n                if d:\n                    pass\n"
+    stream = io.StringIO()
+    with SarifReportWriter(stream) as writer:
+        writer.write(AnalysisPipeline().run(source, "a.py"))
+    run = json.loads(stream.getvalue())["runs"][0]
+    # The display names ("Too Many Arguments", "Deeply Nested Code") differ from the ids.
+    assert [r["ruleId"] for r in run["results"]] == ["too-many-arguments", "deep-nesting"]
+    assert {"too-many-arguments", "deep-nesting"} <= {rule["id"] for rule in run["tool"]["driver"]["rules"]}